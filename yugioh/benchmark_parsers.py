@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 14:25:12 2026
+
+Author: Jordan Tanudjaja
+
+Script for comparing the parsing backends of the parsers module on a corpus of saved card pages.
+Every .html file in the corpus directory is parsed into a card dictionary by each backend, and the
+time taken and the number of cards that differ from the html.parser backend are printed
+
+Usage: python benchmark_parsers.py [corpus directory] [number of repeats]
+"""
+
+import os
+import sys
+import time
+import pandas as pd
+from tabulate import tabulate
+
+from yugioh import ygfandom as ygf
+from yugioh import parsers
+
+
+def load_corpus(corpus_directory):
+    """
+    Returns a list of 2-element tuples of the url and the HTML of every saved card page in the corpus
+    directory, the url is rebuilt from the filename the same way the fandom site names its pages
+    """
+    corpus = []
+    for filename in sorted(os.listdir(corpus_directory)):
+        if filename.endswith('.html'):
+            with open(os.path.join(corpus_directory, filename), encoding = 'utf-8') as page:
+                corpus.append(('https://yugioh.fandom.com/wiki/' + filename[:-len('.html')], page.read()))
+    return corpus
+
+
+def benchmark(corpus, backend_name, repeats):
+    """
+    Returns the best time out of all the repeats to parse the whole corpus with a backend, and the card
+    dictionaries of the last repeat
+    """
+    yg_card = ygf.YgScraper(parser = backend_name)
+    best_time = float('inf')
+    for _ in range(repeats):
+        time1 = time.perf_counter()
+        card_details = [yg_card.parse_card_details(html, url) for url, html in corpus]
+        best_time = min(best_time, time.perf_counter() - time1)
+    return best_time, card_details
+
+
+if __name__ == '__main__':
+
+    corpus_directory = sys.argv[1] if len(sys.argv) > 1 else 'Data/Saved Pages'
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    corpus = load_corpus(corpus_directory)
+    if len(corpus) == 0:
+        sys.exit(f'No saved .html pages found in {corpus_directory}')
+
+    baseline_time, baseline_details = benchmark(corpus, parsers.SoupBackend.name, repeats)
+    results = {parsers.SoupBackend.name: {'Seconds': baseline_time, 'Pages per second': len(corpus) / baseline_time,
+                                          'Speedup': 1.0, 'Cards that differ': 0}}
+
+    if parsers.lxml is not None:
+        lxml_time, lxml_details = benchmark(corpus, parsers.LxmlBackend.name, repeats)
+        results[parsers.LxmlBackend.name] = {'Seconds': lxml_time, 'Pages per second': len(corpus) / lxml_time,
+                                             'Speedup': baseline_time / lxml_time,
+                                             'Cards that differ': sum(card != baseline_card for card, baseline_card in zip(lxml_details, baseline_details))}
+    else:
+        print('lxml is not installed, only the html.parser backend is benchmarked')
+
+    results_df = pd.DataFrame.from_dict(results, orient = 'index').round(3)
+    print(f'{len(corpus)} pages, best of {repeats} repeats')
+    print(tabulate(results_df, headers='keys', tablefmt='psql'))
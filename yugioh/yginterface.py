@@ -8,15 +8,21 @@ Script for interacting with the Yugioh Card Database to either update cards,
 check the banlist, or inspect any cards that are erroneous in the database
 """
 
-import time
 import pandas as pd
 from tabulate import tabulate
 import textwrap
-import concurrent.futures
 
 from yugioh import ygfandom as ygf
 from yugioh import banlist
+from yugioh import crawler
 from yugioh import tcgplayer as tcg
+from yugioh import webfetch
+from yugioh import httpcache
+from yugioh import pricecache
+from yugioh import pricehistory
+
+MAX_WORKERS = 5 # Number of threads used to scrape card pages, the connection pool of the shared
+                # WebFetcher object is matched to this number
 
 
 def option1(duelist):
@@ -30,14 +36,10 @@ def option1(duelist):
     yg_card = ygf.YgScraper() # Instantiating a YgScraper() object to scrape the site for card details
     yg_card.add_card_urls(card_url_list)
 
-    if __name__ == '__main__':
-        with concurrent.futures.ThreadPoolExecutor(max_workers = 5) as executor:
-            executor.map(yg_card.set_card_details, card_url_list)
-
-    card_dict_list = yg_card.get_card_details()
+    # Results come back in the same order as the urls, urls that could not be scraped give None
+    card_dict_list = yg_card.scrape_card_details(yg_card.get_card_urls(), max_workers = MAX_WORKERS)
 
-    for card in card_dict_list:
-        duelist.add_card(card)
+    duelist.add_cards(card for card in card_dict_list if card is not None)
 
 
 def option2(duelist):
@@ -59,16 +61,13 @@ def option2(duelist):
 
     card_url_list = yg_card_set.get_card_urls()
 
-    if __name__ == '__main__':
-        with concurrent.futures.ThreadPoolExecutor(max_workers = 5) as executor:
-            executor.map(yg_card_set.set_card_details, card_url_list)
+    # Card sets have hundreds of cards, so the card pages are downloaded concurrently by the asyncio engine
+    yg_card_set.scrape_many(card_url_list, concurrency = MAX_WORKERS)
 
     card_dict_list = yg_card_set.get_card_details()
 
-    # Don't use multiprocessing here because the order of saving and adding cards to the database
-    # could be messed up
-    for card in card_dict_list:
-        duelist.add_card(card)
+    # All the new cards of the set are added and saved to the database in one go
+    duelist.add_cards(card_dict_list)
 
 
 def option3():
@@ -76,7 +75,9 @@ def option3():
     Option 3: Check competitive status of cards in the most recent banlist
     Function that is invoked when option 3 is selected
     """
-    updated_df = banlist.banlist_update()
+    diff_df = banlist.banlist_update()
+    if len(diff_df) != 0:
+        print(tabulate(diff_df, headers='keys', tablefmt='psql'))
 
 
 def option4(duelist):
@@ -89,24 +90,25 @@ def option4(duelist):
     print('Use Jupyter Notebook to better visualize the properties of cards that needs to be updated')
 
 
-def option5():
+def option5(price_cache, price_history):
     """
     Option 5: Check current prices of any yugioh card (even those not in the Yugioh Card Database)
     Function that is invoked when option 5 is selected
     """
     input_string = input("Insert the name of the card you would like to search (ONLY 1 CARD AT A TIME):\t")
-    card_search = tcg.CardPriceScraper() # Instantiating a CardPriceScraper() object to scrape the site
+    card_search = tcg.CardPriceScraper(price_cache = price_cache, price_history = price_history) # Instantiating a CardPriceScraper() object to scrape the site
                                          # for prices of the card that was inputted
 
-    price_stats = card_search.price_searcher(input_string)
-    if price_stats != None:
-        price_stats_df = pd.DataFrame.from_dict(price_stats, orient = 'index', columns = [input_string]).transpose()
-        print(tabulate(price_stats_df, headers='keys', tablefmt='psql'))
-        time.sleep(1) # Delaying 1 second before closing the browswer
-        card_search.quit_browser()
+    try:
+        price_stats = card_search.price_searcher(input_string)
+        if price_stats != None:
+            price_stats_df = pd.DataFrame.from_dict(price_stats, orient = 'index', columns = [input_string]).transpose()
+            print(tabulate(price_stats_df, headers='keys', tablefmt='psql'))
+    finally:
+        card_search.quit_browser() # The browser is closed even if the card is not found
 
 
-def option6(duelist):
+def option6(duelist, price_cache, price_history):
     """
     Option 6: Check the current prices of a card/cards that are only in the current Yugioh Card Database
     Function that is invoked when option 6 is selected
@@ -126,16 +128,15 @@ def option6(duelist):
             break
 
     if len(card_names_list) != 0:
-        card_bundle = tcg.CardPriceScraper() # Instantiating a CardPriceScraper() object to scrape the site
+        card_bundle = tcg.CardPriceScraper(price_cache = price_cache, price_history = price_history) # Instantiating a CardPriceScraper() object to scrape the site
                                              # for prices of cards in the card bundle
         card_bundle.set_card_prices(card_names_list)
         card_prices = card_bundle.get_card_prices()
         print(tabulate(card_prices, headers='keys', tablefmt='psql'))
-        time.sleep(1) # Delaying 1 second before closing the browser
         card_bundle.quit_browser()
 
 
-def option7(duelist):
+def option7(duelist, price_cache, price_history):
     """
     Option 7: Plan shopping cart for purchasing cards in the current Yugioh Card Database
     Function that is invoked when option 7 is selected
@@ -165,7 +166,7 @@ def option7(duelist):
             break
 
     if len(cards_to_buy) != 0:
-        shopping_cart = tcg.BuyingTool(cards_to_buy)
+        shopping_cart = tcg.BuyingTool(cards_to_buy, price_cache = price_cache, price_history = price_history)
         normalprices_df = shopping_cart.get_normalprice_df()
         totalprices_df = shopping_cart.get_totalprice_df()
         cumulative_df = shopping_cart.get_cumulative_df()
@@ -179,16 +180,32 @@ def option7(duelist):
         print('Potential Total Money Spent \n'
               f"{tabulate(cumulative_df, headers='keys', tablefmt='psql')}")
 
-        time.sleep(1) # Delay 1 second before closing browser
         shopping_cart.quit_browser()
 
 
+def option8(duelist):
+    """
+    Option 8: Sync the database with the latest card sets on the fandom site
+    Function that is invoked when option 8 is selected
+    """
+    # Only the card sets and cards that are new since the last sync are scraped, refer to the crawler module
+    summary = crawler.sync_database(duelist, max_workers = MAX_WORKERS)
+    print(tabulate(pd.DataFrame([summary]), headers='keys', tablefmt='psql', showindex = False))
+
+
 if __name__ == '__main__':
 
         pd.options.display.max_columns = None
         pd.options.display.width = None
 
-        NUM_OPTIONS = 7
+        # Web pages are cached in the Data directory so that re-running an option is mostly cache hits
+        webfetch.configure_fetcher(pool_size = MAX_WORKERS, cache = httpcache.ResponseCache())
+        # Card prices are cached for a few hours so that searching the same cards again is instant
+        price_cache = pricecache.get_price_cache()
+        # Every price search is kept so that price trends can be looked up without searching again
+        price_history = pricehistory.PriceHistory()
+
+        NUM_OPTIONS = 8
 
         OPTIONS = """
         1) Update a few cards in the database using individual card urls
@@ -198,6 +215,7 @@ if __name__ == '__main__':
         5) Check current prices of any yugioh card (even those not in the Yugioh Card Database)
         6) Check the current prices of a card/cards that are only in the current Yugioh Card Database
         7) Plan shopping cart for purchasing cards in the current Yugioh Card Database
+        8) Sync the database with the latest card sets on the fandom site
         """
 
         answer = input("Welcome to Yugioh Card Database (YCD) Interface! What would you like to do today? \n"
@@ -216,7 +234,7 @@ if __name__ == '__main__':
                     answer = int(answer)
                     break
         print('\n')
-        duelist = ygf.DbHandler() # Instantiating a DbHandler() object to reference the Yugioh Card Database
+        duelist = ygf.get_database() # Shared DbHandler() object that references the Yugioh Card Database
 
         while answer in range(1, NUM_OPTIONS + 1):
 
@@ -229,11 +247,13 @@ if __name__ == '__main__':
             elif answer == 4:
                 option4(duelist)
             elif answer == 5:
-                option5()
+                option5(price_cache, price_history)
             elif answer == 6:
-                option6(duelist)
+                option6(duelist, price_cache, price_history)
             elif answer == 7:
-                option7(duelist)
+                option7(duelist, price_cache, price_history)
+            elif answer == 8:
+                option8(duelist)
 
             # Code-block to handle interface after the user selected and completed an option
             print('\n')
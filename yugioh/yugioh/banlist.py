@@ -9,17 +9,56 @@ Yugioh Card Database from the ygfandom module. Banlist source is taken from
 (https://www.yugioh-card.com/uk/gameplay/detail.php?id=1155)
 """
 
-import requests
-from bs4 import BeautifulSoup
-import textdistance
+import pandas as pd
 from yugioh import ygfandom as ygf
+from yugioh import webfetch
+from yugioh import parsers
 
-def banlist_update(banlist_url = 'https://www.yugioh-card.com/uk/gameplay/detail.php?id=1155', filepath = 'Data/Yugioh Card Database.csv'):
+
+def get_banlist(banlist_url = 'https://www.yugioh-card.com/uk/gameplay/detail.php?id=1155', parser = None):
+    """
+    Returns a dataframe of the cards on the banlist with 2 columns: Banlist Name (the card name as it
+    is written on the banlist) and Status (the new competitive status of the card). Cards that are no
+    longer on the list get the Unlimited status
+
+    Parameters:
+    -----------
+    banlist_url: str
+        Default value: 'https://www.yugioh-card.com/uk/gameplay/detail.php?id=1155'
+
+        URL that contains the most recent banlist, refer to the banlist_update function
+
+    parser: str
+        Default value: None
+
+        Name of the parsing backend from the parsers module ('lxml' or 'html.parser'), lxml is used if no
+        name is passed and it is installed
+    """
+    # read_html does not work for this website, hence we have to manually scrape the table for information
+    # read_html gives an HTTP Error: 403 Forbidden
+    banlist_source = webfetch.get_fetcher().get(banlist_url)
+    banlist_source.raise_for_status()
+
+    parser = parsers.get_backend(parser)
+    banlist_source_html = parser.parse(banlist_source.text)
+
+    # The first card name cell of each row holds the card name, and the second status cell holds the
+    # new status (the first one holds the previous status)
+    banlist_df = pd.DataFrame([(card_names[0], statuses[1]) for card_names, statuses in parser.banlist_rows(banlist_source_html)
+                               if len(card_names) != 0 and len(statuses) >= 2],
+                              columns = ['Banlist Name', 'Status'])
+    banlist_df['Status'] = banlist_df['Status'].replace('No longer on list', 'Unlimited')
+    return banlist_df
+
+
+def banlist_update(banlist_url = 'https://www.yugioh-card.com/uk/gameplay/detail.php?id=1155', filepath = 'Data/Yugioh Card Database.csv', parser = None):
     """
-    Method used to update the database with the up to date competitive status of cards in the banlist
+    Returns a dataframe of the cards whose competitive status was changed, with the columns Card Name,
+    Previous Status and New Status and the index of the cards in the database
 
-    The method scrapes the data from the URL and cross-references it with the competitve status of the
-    cards in the current database, and updates them accordingly
+    Method used to update the database with the up to date competitive status of cards in the banlist.
+    The banlist is scraped from the URL into a dataframe and joined with the current database in one
+    go, and only the cards whose status changed are updated and saved
 
     Bug: Some of the cards in this URL are not fully scraped by the method
 
@@ -34,62 +73,47 @@ def banlist_update(banlist_url = 'https://www.yugioh-card.com/uk/gameplay/detail
     filepath: str
         Default value: 'Data/Yugioh Card Database.csv'
         
-        Filepath that leads to the Yugioh Card Database to initialize a DbHandler Object. Default value 
+        Filepath that leads to the Yugioh Card Database to get the shared DbHandler Object. Default value 
         allows any python file in the same level as the yugioh package to access the database directly 
-    """
-    # url for accessing the current banlist
-    # read_html does not work for this website, hence we have to manually scrape the table for information
-    # read_html gives an HTTP Error: 403 Forbidden
-    banlist_source = requests.get(banlist_url)
 
-    if banlist_source.status_code == 200:
-        banlist_source_html = BeautifulSoup(banlist_source.text.encode('utf-8'), 'html.parser')
+    parser: str
+        Default value: None
 
-    # Creating 2 temporary lists, banlist cards contain the names of the cards in the banlist
-    # update_status contains the current competitive status of those cards
-    banlist_cards = []
-    uptodate_status = []
-
-    for tr in banlist_source_html.find_all('tr'):
-        banlist_cards.append([td.text for td in tr.find_all('td', attrs = {'class': 'xl763'})])
-        uptodate_status.append([td.text for td in tr.find_all('td', attrs = {'class': 'xl753'})])
-
-    # Editing the lists to combine card names and statuses into the banlist_card list
-    for i in range(len(banlist_cards)):
-        if len(banlist_cards[i]) != 0:
-            banlist_cards[i][1] = uptodate_status[i][1]
-
-    duelist = ygf.DbHandler(database_filepath = filepath)
+        Name of the parsing backend from the parsers module ('lxml' or 'html.parser'), lxml is used if no
+        name is passed and it is installed
+    """
+    status_column = 'Competitive Status (TCG Advanced)'
+    banlist_df = get_banlist(banlist_url, parser = parser)
+    duelist = ygf.get_database(filepath)
     df = duelist.get_card_database()
 
-    # Block of code for checking the status of the current cards in the database and cross-referencing to
-    # the banlist
-    for card in banlist_cards:
-        if len(card) != 0:
-            try:
-                if card[0] in df['Card Name'].values:
-                    db_name = df[df['Card Name'] == card[0]]['Card Name'].iloc[0]
-                else:
-                    df['txtdistance'] = df['Card Name'].apply(lambda x: textdistance.levenshtein(card[0], x))
-                    db_name = df[df['txtdistance'] <= 2]['Card Name'].iloc[0]
-                    df.drop(columns = ['txtdistance'], inplace = True)
-
-                if df[df['Card Name'] == db_name]['Competitive Status (TCG Advanced)'].iloc[0] == card[1]:
-                    print(f"{db_name}'s status is the same ({card[1]}), no change needed")
-                elif card[1] == 'No longer on list':
-                    if df[df['Card Name'] == db_name]['Competitive Status (TCG Advanced)'].iloc[0] != 'Unlimited':
-                        df['Competitive Status (TCG Advanced)'].loc[df[df['Card Name'] == db_name].index] = 'Unlimited'
-                        print(f"{db_name}'s status is changed to Unlimited")
-                else:
-                    df['Competitive Status (TCG Advanced)'].loc[df[df['Card Name'] == db_name].index] = card[1]
-                    print(f"{db_name}'s status is changed to {card[1]}")
-            except:
-                print(f'{card[0]} was not found in database, use locate_card method to check if the card is actually in the database')
-                
-    duelist.set_card_database(df)
-    duelist.save_card_database()
-    print(count)
-
-    return df
-
-
+    # Names on the banlist that are not in the database are matched to the closest Card Name
+    db_card_names = set(df['Card Name'])
+    def match_card_name(banlist_name):
+        if banlist_name in db_card_names:
+            return banlist_name
+        matches = duelist.match_card_names(banlist_name, max_distance = 2, limit = 1)
+        if len(matches) == 0:
+            print(f'{banlist_name} was not found in database, use locate_card method to check if the card is actually in the database')
+            return None
+        print(f'{banlist_name} is matched to {matches[0][0]}')
+        return matches[0][0]
+
+    banlist_df['Card Name'] = banlist_df['Banlist Name'].map(match_card_name)
+    banlist_df = banlist_df.dropna(subset = ['Card Name']).drop_duplicates('Card Name', keep = 'last')
+
+    # Joining the banlist to every card in the database with the same name, and keeping the cards whose
+    # status is different
+    status_df = ( df[['Card Name', status_column]].reset_index()
+                                                  .merge(banlist_df[['Card Name', 'Status']], on = 'Card Name')
+                                                  .set_index('index') )
+    status_df.index.name = None
+    diff_df = ( status_df[status_df[status_column] != status_df['Status']]
+                         .rename(columns = {status_column: 'Previous Status', 'Status': 'New Status'}) )
+
+    if len(diff_df) == 0:
+        print('All statuses are up to date, no change needed')
+    else:
+        duelist.update_cards(diff_df[['New Status']].rename(columns = {'New Status': status_column}))
+
+    return diff_df
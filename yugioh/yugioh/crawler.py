@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:05:37 2026
+
+Author: Jordan Tanudjaja
+
+Python module for building and keeping the Yugioh Card Database in sync with the card sets of (https://yugioh.fandom.com).
+The card sets are discovered from the Booster Pack page and the set templates (packs, decks, reprint sets
+and collectible tins), the same way the Card Database Initialization notebook builds the database
+
+A JSON checkpoint keeps the card urls of every card set that was already read and the urls that are not
+card pages, so a sync only reads the card sets that are new and only scrapes the cards that are not in
+the database yet, plus the cards that the regulatory checkup marks as needing an update
+
+A full crawl that rebuilds the database from scratch keeps its progress in a CrawlJournal (refer to the
+journal module) instead, so it can be resumed after an interruption
+"""
+
+import os
+import json
+import datetime
+import concurrent.futures
+import requests
+import pandas as pd
+from yugioh import ygfandom as ygf
+from yugioh import webfetch
+from yugioh import parsers
+from yugioh import dbstorage
+from yugioh import pipeline
+from yugioh.journal import CrawlJournal
+
+FANDOM_URL = 'https://yugioh.fandom.com'
+BOOSTER_PACK_URL = FANDOM_URL + '/wiki/Booster_Pack'
+
+# Set templates with the card set urls that are denied because they have not been updated with the
+# latest cards from Konami, or they are typos and have no cards in them
+SET_TEMPLATES = {
+    FANDOM_URL + '/wiki/Template:Packs': ('https://yugioh.fandom.com/wiki/Phantom_Rage_%2B1_Bonus_Pack',
+                                          'https://yugioh.fandom.com/wiki/Rise_of_the_Duelist_%2B1_Bonus_Pack',
+                                          'https://yugioh.fandom.com/wiki/Blazing_Vortex_%2B1_Bonus_Pack',
+                                          'https://yugioh.fandom.com/wiki/Maximum_Gold',
+                                          'https://yugioh.fandom.com/wiki/EX_Value_The_Gold_Box_%2B_ABYR%26CBLZ',
+                                          'https://yugioh.fandom.com/wiki/EX_Value_The_Gold_Box_%2B_GS2013',
+                                          'https://yugioh.fandom.com/wiki/Legendary_Duelists:_Rage_of_Ra',
+                                          'https://yugioh.fandom.com/wiki/World_Premiere_Pack_2020',
+                                          'https://yugioh.fandom.com/wiki/Dragons_of_Legend:_The_Complete_Series',
+                                          'https://yugioh.fandom.com/wiki/Deck_Build_Pack:_Genesis_Impactors'),
+    FANDOM_URL + '/wiki/Template:Decks': ('https://yugioh.fandom.com/wiki/Yu-Gi-Oh!_Rush_Duel_Starter_Deck:_Yuga_-_Open!_Sevens_Road!!',
+                                          'https://yugioh.fandom.com/wiki/Yu-Gi-Oh!_Rush_Duel_Starter_Deck:_Luke_-_Explosive_Conquest!_Dragears!!',
+                                          'https://yugioh.fandom.com/wiki/Yu-Gi-Oh!_Rush_Duel_Starter_Deck_Set_-_Yuga_vs._Luke',
+                                          'https://yugioh.fandom.com/wiki/Structure_Deck_R:_Dragunity_Drive'),
+    FANDOM_URL + '/wiki/Template:Reprint_sets': (),
+    FANDOM_URL + '/wiki/Template:Collectible_tins': ('https://yugioh.fandom.com/wiki/Tin_of_Lost_Memories',
+                                                     'https://yugioh.fandom.com/wiki/Duelist_Pack_Collection_Tin_2009')
+    }
+
+# Card lists of structure decks whose main page has no card table
+EXTRA_SET_URLS = ('https://yugioh.fandom.com/wiki/Set_Card_Lists:Structure_Deck:_Lord_of_the_Storm_(TCG-EN)',
+                  'https://yugioh.fandom.com/wiki/Set_Card_Lists:Structure_Deck:_Dinosaur%27s_Rage_(TCG-EN)',
+                  'https://yugioh.fandom.com/wiki/Set_Card_Lists:Structure_Deck:_Invincible_Fortress_(TCG-EN)',
+                  'https://yugioh.fandom.com/wiki/Set_Card_Lists:Structure_Deck:_Spellcaster%27s_Judgment_(TCG-EN)')
+
+
+def get_booster_urls(url = BOOSTER_PACK_URL, cutoff = None, fetcher = None, parser = None):
+    """
+    Returns the urls of the booster packs listed in the Booster Pack page in a list format, in the order
+    of the page and without duplicates
+
+    Parameters:
+    -----------
+    url: str
+        Default value: 'https://yugioh.fandom.com/wiki/Booster_Pack'
+
+        URL of the page that lists the booster packs
+
+    cutoff: str
+        Default value: None
+
+        Title of the last booster pack to be returned, every booster pack is returned if no title is passed
+
+    fetcher: webfetch.WebFetcher
+        Default value: None
+
+        WebFetcher object used to download the page, the shared WebFetcher object of the webfetch
+        module is used if no object is passed
+
+    parser: str
+        Default value: None
+
+        Name of the parsing backend from the parsers module
+    """
+    fetcher = fetcher if fetcher is not None else webfetch.get_fetcher()
+    parser = parsers.get_backend(parser)
+    booster_source = fetcher.get(url)
+    booster_source.raise_for_status()
+
+    booster_urls = {}
+    for href, title in parser.navbox_links(parser.parse(booster_source.text), 'navbox-subgroup'):
+        if href is not None:
+            booster_urls[FANDOM_URL + href] = None
+        if cutoff is not None and title == cutoff:
+            break
+    return list(booster_urls)
+
+
+def get_other_sets_url(url, denied_urls = (), fetcher = None, parser = None):
+    """
+    Returns the urls of the card sets listed in a set template page (packs, decks, reprint sets,
+    collectible tins) in a list format, in the order of the page and without duplicates or denied urls
+
+    Parameters:
+    -----------
+    url: str
+        URL of the set template page, such as 'https://yugioh.fandom.com/wiki/Template:Packs'
+
+    denied_urls: iterable of strings
+        Default value: ()
+
+        Card set urls that are not returned
+
+    fetcher: webfetch.WebFetcher
+        Default value: None
+
+        WebFetcher object used to download the page, the shared WebFetcher object of the webfetch
+        module is used if no object is passed
+
+    parser: str
+        Default value: None
+
+        Name of the parsing backend from the parsers module
+    """
+    fetcher = fetcher if fetcher is not None else webfetch.get_fetcher()
+    parser = parsers.get_backend(parser)
+    template_source = fetcher.get(url)
+    template_source.raise_for_status()
+
+    links = parser.navbox_links(parser.parse(template_source.text), 'navbox', first = True)
+    set_urls = dict.fromkeys(FANDOM_URL + href for href, _ in links[1:] if href is not None) # In a template URL format, the first link is useless
+    return [set_url for set_url in set_urls if set_url not in set(denied_urls)]
+
+
+def discover_set_urls(fetcher = None, parser = None):
+    """
+    Returns the urls of every card set on the fandom site in a list format: the booster packs, the sets
+    of every set template and the extra structure deck card lists
+
+    Parameters:
+    -----------
+    fetcher: webfetch.WebFetcher
+        Default value: None
+
+        WebFetcher object used to download the pages, the shared WebFetcher object of the webfetch
+        module is used if no object is passed
+
+    parser: str
+        Default value: None
+
+        Name of the parsing backend from the parsers module
+    """
+    set_urls = dict.fromkeys(get_booster_urls(fetcher = fetcher, parser = parser))
+    for template_url, denied_urls in SET_TEMPLATES.items():
+        set_urls.update(dict.fromkeys(get_other_sets_url(template_url, denied_urls, fetcher = fetcher, parser = parser)))
+    set_urls.update(dict.fromkeys(EXTRA_SET_URLS))
+    return list(set_urls)
+
+
+def load_checkpoint(checkpoint_filepath):
+    """
+    Returns the crawl checkpoint in a dictionary format, with the keys: sets (card urls of each card set
+    that was read), skipped_urls (urls that are not card pages) and last_sync. An empty checkpoint is
+    returned if the file does not exist
+
+    Parameters:
+    -----------
+    checkpoint_filepath: str
+        Filepath of the JSON checkpoint
+    """
+    checkpoint = {'sets': {}, 'skipped_urls': [], 'last_sync': None}
+    if os.path.exists(checkpoint_filepath):
+        with open(checkpoint_filepath, encoding = 'utf-8') as checkpoint_file:
+            checkpoint.update(json.load(checkpoint_file))
+    return checkpoint
+
+
+def save_checkpoint(checkpoint, checkpoint_filepath):
+    """
+    Method to save the crawl checkpoint, the file is replaced in one step so an interrupted save does
+    not leave a broken checkpoint
+
+    Parameters:
+    -----------
+    checkpoint: dict
+        Crawl checkpoint, refer to the load_checkpoint function
+
+    checkpoint_filepath: str
+        Filepath of the JSON checkpoint
+    """
+    temporary_filepath = checkpoint_filepath + '.tmp'
+    with open(temporary_filepath, 'w', encoding = 'utf-8') as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file, indent = 1)
+    os.replace(temporary_filepath, checkpoint_filepath)
+
+
+def _read_card_set(set_url, fetcher = None, parser = None):
+    """
+    Returns the card urls of a card set in a list format, and returns nothing if the card set cannot
+    be read
+    """
+    yg_card_set = ygf.YgScraper(fetcher = fetcher, parser = parser)
+    try:
+        yg_card_set.set_card_urls(set_url)
+    except Exception as e: # Some card sets cannot be read by set_card_urls, refer to option 2 of yginterface
+        print(f'{set_url} could not be read and will be tried again ({e!r})')
+        return None
+    return yg_card_set.get_card_urls()
+
+
+def _scrape_card(yg_card, url):
+    """
+    Returns whether the card url failed and its card dictionary in a tuple format. A url fails if it
+    cannot be downloaded (including connection errors and timeouts) or parsed, and a url that is not a
+    card page gives no card dictionary without failing, the same way as pipeline.scrape_cards
+    """
+    try:
+        html = yg_card.fetcher.get_html(url)
+    except requests.exceptions.RequestException:
+        html = None
+    if html is None:
+        print(f'{url} could not be downloaded and will be tried again')
+        return True, None
+
+    try:
+        return False, yg_card.parse_card_details(html, url)
+    except Exception as e:
+        print(f'{url} could not be parsed and will be tried again ({e!r})')
+        return True, None
+
+
+def _card_changed(card_dict, db_card):
+    """
+    Returns True if the scraped card has different values from the card in the database, the support
+    columns are compared as sets and every other column as text, the way they are saved
+    """
+    for column in ygf.DbHandler.yugioh_columns:
+        if column in dbstorage.set_columns:
+            if dbstorage.parse_set(card_dict[column]) != dbstorage.parse_set(db_card[column]):
+                return True
+        elif str(card_dict[column]) != str(db_card[column]):
+            return True
+    return False
+
+def sync_database(duelist = None, checkpoint_filepath = 'Data/Crawl Checkpoint.json', set_urls = None, refresh_sets = (),
+                  update_changed = True, max_workers = 5, fetcher = None, parser = None):
+    """
+    Returns a dictionary with the number of new card sets, added cards and updated cards after syncing the
+    database with the card sets of the fandom site
+
+    Only the card sets that are not in the checkpoint are read, only the cards that are not in the
+    database (by their Reference) are scraped, and the cards that the regulatory checkup marks as needing
+    an update (such as cards that were not released yet) are scraped again and updated if they changed.
+    The checkpoint is saved after the card sets are read and after the cards are scraped, so an
+    interrupted sync continues where it stopped. Only the urls that are not card pages are kept as
+    skipped, the urls that could not be downloaded or parsed are scraped again on the next sync
+
+    Parameters:
+    -----------
+    duelist: ygf.DbHandler
+        Default value: None
+
+        DbHandler object of the database to be synced, the shared DbHandler object of the default database
+        is used if no object is passed
+
+    checkpoint_filepath: str
+        Default value: 'Data/Crawl Checkpoint.json'
+
+        Filepath of the JSON checkpoint
+
+    set_urls: list of strings
+        Default value: None
+
+        Card set urls to be synced, every card set on the fandom site is discovered if no urls are passed
+
+    refresh_sets: iterable of strings
+        Default value: ()
+
+        Card set urls that are read again even if they are in the checkpoint, for sets that are still
+        getting new cards
+
+    update_changed: bool
+        Default value: True
+
+        If True, the cards that the regulatory checkup marks as needing an update are scraped again
+
+    max_workers: int
+        Default value: 5
+
+        Number of threads that read the card sets and scrape the cards
+
+    fetcher: webfetch.WebFetcher
+        Default value: None
+
+        WebFetcher object used to download the pages, the shared WebFetcher object of the webfetch
+        module is used if no object is passed
+
+    parser: str
+        Default value: None
+
+        Name of the parsing backend from the parsers module
+    """
+    duelist = duelist if duelist is not None else ygf.get_database()
+    checkpoint = load_checkpoint(checkpoint_filepath)
+    if set_urls is None:
+        set_urls = discover_set_urls(fetcher = fetcher, parser = parser)
+
+    # Block of code to read the card urls of the card sets that are new since the last sync
+    refresh_sets = set(refresh_sets)
+    new_set_urls = [set_url for set_url in set_urls if set_url not in checkpoint['sets'] or set_url in refresh_sets]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers = max_workers) as executor:
+        for set_url, card_urls in zip(new_set_urls, executor.map(_read_card_set, new_set_urls, [fetcher] * len(new_set_urls), [parser] * len(new_set_urls))):
+            if card_urls is not None:
+                checkpoint['sets'][set_url] = card_urls
+    save_checkpoint(checkpoint, checkpoint_filepath)
+
+    # Block of code to scrape the cards that are not in the database yet, urls that are not card pages
+    # are remembered so they are not scraped again, and urls that failed are scraped again next time
+    references = set(duelist.get_card_database()['Reference'])
+    skipped_urls = set(checkpoint['skipped_urls'])
+    new_card_urls = list(dict.fromkeys(card_url for card_urls in checkpoint['sets'].values() for card_url in card_urls
+                                       if card_url not in references and card_url not in skipped_urls))
+    print(f'{len(new_set_urls)} card sets read, {len(new_card_urls)} new cards to be scraped')
+
+    yg_card = ygf.YgScraper(fetcher = fetcher, parser = parser)
+    with concurrent.futures.ThreadPoolExecutor(max_workers = max_workers) as executor:
+        new_results = list(executor.map(_scrape_card, [yg_card] * len(new_card_urls), new_card_urls))
+    failed_urls = [url for url, (failed, _) in zip(new_card_urls, new_results) if failed]
+    new_skipped_urls = [url for url, (failed, card_dict) in zip(new_card_urls, new_results) if not failed and card_dict is None]
+    checkpoint['skipped_urls'] = list(dict.fromkeys(checkpoint['skipped_urls'] + new_skipped_urls))
+    added_cards = [card_dict for _, card_dict in new_results if card_dict is not None]
+    if len(added_cards) != 0:
+        duelist.add_cards(added_cards)
+
+    # Block of code to scrape the cards that need an update again and update the ones that changed
+    updated_cards = {}
+    if update_changed:
+        checkup_df = duelist.regulatory_checkup()
+        checkup_df = checkup_df[~checkup_df['Reference'].isin(new_card_urls)] # Cards that were just scraped
+        with concurrent.futures.ThreadPoolExecutor(max_workers = max_workers) as executor:
+            checkup_results = executor.map(_scrape_card, [yg_card] * len(checkup_df), checkup_df['Reference'])
+            for card_index, (_, card_dict) in zip(checkup_df.index, checkup_results):
+                if card_dict is not None and _card_changed(card_dict, checkup_df.loc[card_index]):
+                    updated_cards[card_index] = card_dict
+        if len(updated_cards) != 0:
+            duelist.update_cards(pd.DataFrame(list(updated_cards.values()), index = list(updated_cards), columns = ygf.DbHandler.yugioh_columns))
+
+    checkpoint['last_sync'] = datetime.datetime.now().isoformat(timespec = 'seconds')
+    save_checkpoint(checkpoint, checkpoint_filepath)
+    if len(failed_urls) != 0:
+        print(f'{len(failed_urls)} urls failed and will be tried again on the next sync')
+    return {'New card sets': len(new_set_urls), 'Added cards': len(added_cards), 'Updated cards': len(updated_cards)}
+
+
+def crawl_database(database_filepath = 'Data/Yugioh Card Database.csv', journal_filepath = 'Data/Crawl Journal.sqlite', set_urls = None,
+                   io_workers = 5, parse_workers = None, fetcher = None, parser = None):
+    """
+    Returns the card database in a DataFrame format after rebuilding it from every card set on the fandom
+    site, and saves it to database_filepath (the file is replaced)
+
+    Every card set and card url is kept in the journal with its status, and a card url is recorded with
+    the hash of its HTML and its card as soon as it is scraped. Running the function again with the same
+    journal resumes the crawl: only the urls that are pending or failed are crawled, and the database is
+    rebuilt from the cards in the journal. Delete the journal file to crawl everything again
+
+    Parameters:
+    -----------
+    database_filepath: str
+        Default value: 'Data/Yugioh Card Database.csv'
+
+        Filepath of the rebuilt Yugioh Card Database, refer to the DbHandler class for the file formats
+
+    journal_filepath: str
+        Default value: 'Data/Crawl Journal.sqlite'
+
+        Filepath of the CrawlJournal SQLite file
+
+    set_urls: list of strings
+        Default value: None
+
+        Card set urls to be crawled, every card set on the fandom site is discovered if no urls are
+        passed and the journal has no card sets yet
+
+    io_workers: int
+        Default value: 5
+
+        Number of threads that download the pages, refer to pipeline.scrape_cards
+
+    parse_workers: int
+        Default value: None
+
+        Number of processes that parse the card pages, refer to pipeline.scrape_cards
+
+    fetcher: webfetch.WebFetcher
+        Default value: None
+
+        WebFetcher object used to download the pages, the shared WebFetcher object of the webfetch
+        module is used if no object is passed
+
+    parser: str
+        Default value: None
+
+        Name of the parsing backend from the parsers module
+    """
+    journal = CrawlJournal(journal_filepath)
+    try:
+        if set_urls is None and len(journal.get_urls('set', statuses = CrawlJournal.statuses)) == 0:
+            set_urls = discover_set_urls(fetcher = fetcher, parser = parser)
+        if set_urls is not None:
+            journal.add_urls(set_urls, 'set')
+
+        # Block of code to read the card urls of the card sets that were not read yet
+        pending_set_urls = journal.get_urls('set')
+        with concurrent.futures.ThreadPoolExecutor(max_workers = io_workers) as executor:
+            for set_url, card_urls in zip(pending_set_urls, executor.map(_read_card_set, pending_set_urls, [fetcher] * len(pending_set_urls), [parser] * len(pending_set_urls))):
+                journal.record_set(set_url, card_urls)
+
+        # Block of code to scrape the cards that were not scraped yet, each result is written to the
+        # journal as soon as it is ready
+        pending_card_urls = journal.get_urls('card')
+        print(f'{len(pending_set_urls)} card sets read, {len(pending_card_urls)} cards to be scraped')
+        pipeline.scrape_cards(pending_card_urls, io_workers = io_workers, parse_workers = parse_workers, parser = parser,
+                              fetcher = fetcher, on_result = journal.record_card)
+
+        cards = journal.get_cards()
+        counts = journal.get_counts()
+    finally:
+        journal.close()
+
+    df = pd.DataFrame(cards, columns = ygf.DbHandler.yugioh_columns).drop_duplicates('Reference').reset_index(drop = True)
+    dbstorage.get_storage(database_filepath).save(df, database_filepath)
+    ygf.invalidate_database(database_filepath)
+
+    print(f"{len(df)} cards saved, {counts.get(('card', 'skipped'), 0)} urls are not card pages, "
+          f"{counts.get(('set', 'failed'), 0) + counts.get(('card', 'failed'), 0)} urls failed and will be tried again on the next run")
+    return df
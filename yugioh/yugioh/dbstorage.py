@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:14:36 2026
+
+Author: Jordan Tanudjaja
+
+Python module for the file formats that the Yugioh Card Database can be stored in. The format is chosen
+from the extension of the database filepath:
+    .csv: the original format, every column is stored as text and the support columns as stringified sets
+    .parquet and .feather: columnar binary formats with typed columns, nullable integer columns for the
+                           numeric stats, categorical columns for the columns with few distinct values,
+                           and list columns for the support columns
+    .sqlite and .db: SQLite database with indexes on the Reference and the Card Name, where adding or
+                     changing cards only writes the rows that changed
+
+Parquet and Feather files need the pyarrow package. Every format is loaded into the same dataframe as the
+CSV format, with the support columns as stringified sets. Use the parse_set function to read them as sets,
+they are not parsed on load because it is several times slower than reading the CSV file
+"""
+
+import os
+import ast
+import sqlite3
+import pandas as pd
+
+# Columns that hold the sets of cards, archetypes and series that a card supports
+set_columns = ('Card/Attribute/Type Support', 'Direct Archetype & Series Support', 'Indirect Archetype & Series Support')
+
+# Columns with few distinct values, stored as categorical columns in the columnar formats
+categorical_columns = ('Card Type', 'Spell/Trap Property', 'Attribute', 'Types', 'Competitive Status (TCG Advanced)')
+
+# Columns of the numeric stats, stored as nullable integers in the columnar formats and in the compact
+# in-memory format
+numeric_columns = ('Level/Rank', 'ATK', 'DEF', 'LINK', 'Pendulum Scale')
+
+# Integers that stand for the values of the numeric stats that are not numbers in the columnar formats,
+# empty values are stored as missing values
+numeric_sentinels = {'?': -1, 'N/A': -2}
+
+
+def parse_set(value):
+    """
+    Returns the set of strings held by a support column value, the value can already be a set, a list,
+    or a stringified set from the CSV format
+    """
+    if isinstance(value, (set, frozenset, list, tuple)):
+        return set(value)
+    try:
+        parsed_value = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return {value} if value not in ('', 'N/A') else set()
+    return set(parsed_value) if isinstance(parsed_value, (set, list, tuple)) else {str(parsed_value)}
+
+
+def format_set(values):
+    """
+    Returns the stringified set of the strings in its argument, in the same format as the CSV format
+    and in the order of the values
+    """
+    return '{' + ', '.join(repr(value) for value in values) + '}' if len(values) != 0 else 'set()'
+
+
+def to_integers(values):
+    """
+    Returns the numeric stats in its argument as nullable integers, the values that are not numbers are
+    replaced by their sentinel in numeric_sentinels. Returns nothing if a value is neither a number nor
+    a sentinel, so that the column can be stored as text without losing it
+    """
+    integers = []
+    for value in values:
+        value = '' if value is None else str(value).strip()
+        if value in numeric_sentinels:
+            integers.append(numeric_sentinels[value])
+        elif value == '':
+            integers.append(None)
+        elif value.lstrip('-').isdigit():
+            integers.append(int(value))
+        else:
+            return None
+    return pd.array(integers, dtype = 'Int64')
+
+
+def from_integers(values):
+    """
+    Returns the numeric stats in its argument as text, the opposite of the to_integers function
+    """
+    sentinel_values = {integer: value for value, integer in numeric_sentinels.items()}
+    return ['' if pd.isna(value) else sentinel_values.get(int(value), str(int(value))) for value in values]
+
+
+def to_columnar(df):
+    """
+    Returns a copy of the card database in the columnar format: nullable integers for the numeric stats,
+    categorical columns for the columns with few distinct values, sorted lists for the support columns
+    and text for every other column
+    """
+    df = df.reset_index(drop = True)
+    columnar_df = pd.DataFrame(index = df.index)
+    for column in df.columns:
+        integers = to_integers(df[column]) if column in numeric_columns else None
+        if column in set_columns:
+            columnar_df[column] = [sorted(parse_set(value)) for value in df[column]]
+        elif integers is not None:
+            columnar_df[column] = integers
+        elif column in categorical_columns or column in numeric_columns:
+            columnar_df[column] = df[column].astype(str).astype('category')
+        else:
+            columnar_df[column] = df[column].astype(str)
+    return columnar_df
+
+
+def from_columnar(df):
+    """
+    Returns the card database from the columnar format with the same columns as the CSV format: text
+    columns, and stringified sets for the support columns
+    """
+    for column in df.columns:
+        if column in set_columns:
+            df[column] = [format_set(value) for value in df[column]]
+        elif column in numeric_columns and pd.api.types.is_integer_dtype(df[column]):
+            df[column] = from_integers(df[column])
+        elif column in categorical_columns or column in numeric_columns:
+            df[column] = df[column].astype(object)
+    return df
+
+
+def to_compact(df):
+    """
+    Returns a copy of the card database in the compact in-memory format: nullable integers for the
+    numeric stats (values that are not numbers, such as 'N/A' and '?', become missing values),
+    categorical columns for the columns with few distinct values, and sets for the support columns
+
+    The compact format takes several times less memory, but it cannot be saved back to the database
+    file because the values that are not numbers are lost
+    """
+    compact_df = pd.DataFrame(index = df.index)
+    for column in df.columns:
+        if column in numeric_columns:
+            compact_df[column] = pd.to_numeric(df[column], errors = 'coerce').astype('Int64')
+        elif column in categorical_columns:
+            compact_df[column] = df[column].astype(str).astype('category')
+        elif column in set_columns:
+            compact_df[column] = [parse_set(value) for value in df[column]]
+        else:
+            compact_df[column] = df[column]
+    return compact_df
+
+
+class CsvStorage:
+    """
+    Storage of the card database in a CSV file, the original format of the Yugioh Card Database
+    """
+    extensions = ('.csv',)
+
+    def load(self, filepath):
+        """
+        Returns the card database that is read from the CSV file
+        """
+        return pd.read_csv(filepath, keep_default_na = False)
+
+    def save(self, df, filepath):
+        """
+        Method to save the card database to the CSV file
+        """
+        # Required to set index to Card Name before writing to the csv file in order to prevent insertion
+        # of additonal Unnamed columns when reading the csv file
+        df.set_index('Card Name').to_csv(filepath)
+
+    def upsert(self, database_df, changed_df, filepath, previous_references = None):
+        """
+        Method to save the cards that were added or changed, a CSV file cannot be partly written so
+        the whole database is saved
+        """
+        self.save(database_df, filepath)
+
+
+class ParquetStorage:
+    """
+    Storage of the card database in a Parquet file
+    """
+    extensions = ('.parquet',)
+
+    def load(self, filepath):
+        """
+        Returns the card database that is read from the Parquet file
+        """
+        return from_columnar(pd.read_parquet(filepath))
+
+    def save(self, df, filepath):
+        """
+        Method to save the card database to the Parquet file
+        """
+        to_columnar(df).to_parquet(filepath, index = False)
+
+    def upsert(self, database_df, changed_df, filepath, previous_references = None):
+        """
+        Method to save the cards that were added or changed, a Parquet file cannot be partly written so
+        the whole database is saved
+        """
+        self.save(database_df, filepath)
+
+
+class FeatherStorage:
+    """
+    Storage of the card database in a Feather file
+    """
+    extensions = ('.feather',)
+
+    def load(self, filepath):
+        """
+        Returns the card database that is read from the Feather file
+        """
+        return from_columnar(pd.read_feather(filepath))
+
+    def save(self, df, filepath):
+        """
+        Method to save the card database to the Feather file
+        """
+        to_columnar(df).to_feather(filepath)
+
+    def upsert(self, database_df, changed_df, filepath, previous_references = None):
+        """
+        Method to save the cards that were added or changed, a Feather file cannot be partly written so
+        the whole database is saved
+        """
+        self.save(database_df, filepath)
+
+
+class SqliteStorage:
+    """
+    Storage of the card database in a SQLite database. Every card is a row of the cards table, keyed by
+    its Reference, and every value is stored as text the same way it is written to the CSV format, so
+    loading the SQLite database gives the same dataframe as loading any other format. The position
+    column keeps the order of the cards
+
+    The database is opened in WAL mode, so the CLI or a notebook can read the database while cards are
+    being written to it, and every write is done in a single transaction. New cards get their position
+    inside that transaction, so two processes adding cards at the same time do not overwrite each other
+    """
+    extensions = ('.sqlite', '.db')
+    table_name = 'cards'
+
+    def connect(self, filepath):
+        """
+        Returns a connection to the SQLite database in WAL mode
+
+        Parameters:
+        -----------
+        filepath: str
+            Filepath of the SQLite database
+        """
+        connection = sqlite3.connect(filepath, timeout = 30)
+        connection.execute('PRAGMA journal_mode = WAL')
+        return connection
+
+    def load(self, filepath):
+        """
+        Returns the card database that is read from the SQLite database, in the order of its index
+        """
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f'{filepath} does not exist')
+
+        connection = self.connect(filepath)
+        try:
+            df = pd.read_sql_query(f'SELECT * FROM {self.table_name} ORDER BY position', connection, index_col = 'position')
+        finally:
+            connection.close()
+        df.index.name = None
+        return df
+
+    def save(self, df, filepath):
+        """
+        Method to save the whole card database to the SQLite database, replacing the cards that were in it
+        """
+        connection = self.connect(filepath)
+        try:
+            with connection:
+                connection.execute('BEGIN IMMEDIATE')
+                self.__create_table(connection, df.columns)
+                connection.execute(f'DELETE FROM {self.table_name}')
+                self.__insert(connection, df)
+        finally:
+            connection.close()
+
+    def upsert(self, database_df, changed_df, filepath, previous_references = None):
+        """
+        Method to save the cards that were added or changed, only the rows of changed_df are written
+
+        Parameters:
+        -----------
+        database_df: DataFrame
+            The whole card database, it is only used to create the cards table of a new SQLite database
+
+        changed_df: DataFrame
+            The cards that were added or changed, a card replaces the card with the same Reference and
+            new cards are added after the last card
+
+        filepath: str
+            Filepath of the SQLite database
+
+        previous_references: list of strings
+            Default value: None
+
+            Reference of every card of changed_df before it was changed, in the same order as its rows,
+            None for new cards. A card whose Reference was changed replaces the row of its previous
+            Reference and keeps its position
+        """
+        if previous_references is None:
+            previous_references = [None] * len(changed_df)
+
+        connection = self.connect(filepath)
+        try:
+            with connection:
+                # The write lock is taken before reading the positions of the cards
+                connection.execute('BEGIN IMMEDIATE')
+                if self.__create_table(connection, database_df.columns):
+                    self.__insert(connection, database_df)
+                else:
+                    # The rows of the previous References are removed first, so that cards that swapped
+                    # their References do not collide on the unique Reference index
+                    positions = []
+                    for previous_reference, reference in zip(previous_references, changed_df['Reference']):
+                        position = None
+                        if previous_reference is not None and previous_reference != reference:
+                            row = connection.execute(f'SELECT position FROM {self.table_name} WHERE "Reference" = ?',
+                                                     (previous_reference,)).fetchone()
+                            if row:
+                                position = row[0]
+                                connection.execute(f'DELETE FROM {self.table_name} WHERE position = ?', (position,))
+                        positions.append(position)
+                    self.__insert(connection, changed_df, positions)
+        finally:
+            connection.close()
+
+    def __create_table(self, connection, columns):
+        """
+        Creates the cards table and its indexes if they do not exist yet, and returns True if the table
+        was created. The Reference index of a database created before it was unique is made unique
+
+        Private method that is invoked in the save and upsert methods
+        """
+        if connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self.table_name,)).fetchone():
+            unique_indexes = {row[1]: row[2] for row in connection.execute(f'PRAGMA index_list({self.table_name})')}
+            if not unique_indexes.get('reference_index'):
+                connection.execute('DROP INDEX IF EXISTS reference_index')
+                connection.execute(f'CREATE UNIQUE INDEX reference_index ON {self.table_name} ("Reference")')
+            return False
+        columns = ', '.join(f'"{column}" TEXT' for column in columns)
+        connection.execute(f'CREATE TABLE {self.table_name} (position INTEGER PRIMARY KEY, {columns})')
+        connection.execute(f'CREATE UNIQUE INDEX reference_index ON {self.table_name} ("Reference")')
+        connection.execute(f'CREATE INDEX card_name_index ON {self.table_name} ("Card Name" COLLATE NOCASE)')
+        return True
+
+    def __insert(self, connection, df, positions = None):
+        """
+        Inserts the cards of a dataframe into the cards table, keyed by their Reference. A card replaces
+        the card that has the same Reference and keeps its position, new cards are put at the position
+        given in positions or after the last card if it is None. Values are stored as text and missing
+        values as empty text
+
+        Private method that is invoked in the save and upsert methods, inside their transaction
+        """
+        columns = ', '.join(f'"{column}"' for column in df.columns)
+        updates = ', '.join(f'"{column}" = excluded."{column}"' for column in df.columns)
+        placeholders = ', '.join('?' * len(df.columns))
+        if positions is None:
+            positions = [None] * len(df)
+        rows = [(position,) + tuple('' if value is None else str(value) for value in row)
+                for position, row in zip(positions, df.itertuples(index = False, name = None))]
+        connection.executemany(f'INSERT INTO {self.table_name} (position, {columns}) '
+                               f'VALUES (COALESCE(?, (SELECT COALESCE(MAX(position), -1) + 1 FROM {self.table_name})), {placeholders}) '
+                               f'ON CONFLICT("Reference") DO UPDATE SET {updates}', rows)
+
+
+# Storage classes that can be chosen from the extension of the database filepath
+storages = (CsvStorage, ParquetStorage, FeatherStorage, SqliteStorage)
+
+def get_storage(filepath):
+    """
+    Returns the storage object that handles the file format of the filepath in its argument
+
+    Parameters:
+    -----------
+    filepath: str
+        Filepath of the card database, its extension decides the file format
+    """
+    extension = os.path.splitext(filepath)[1].lower()
+    for storage in storages:
+        if extension in storage.extensions:
+            return storage()
+    raise ValueError(f'{filepath} is not a supported card database file, use one of these extensions: '
+                     f'{[extension for storage in storages for extension in storage.extensions]}')
+
+
+def convert_card_database(source_filepath, target_filepath):
+    """
+    Returns the card database after converting it from one file format to another, for example to import
+    the CSV file into a Parquet file or to export a Parquet file back to CSV
+
+    Parameters:
+    -----------
+    source_filepath: str
+        Filepath of the card database to be converted
+
+    target_filepath: str
+        Filepath of the converted card database, its extension decides the file format
+    """
+    df = get_storage(source_filepath).load(source_filepath)
+    get_storage(target_filepath).save(df, target_filepath)
+    return df
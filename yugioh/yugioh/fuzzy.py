@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:40:51 2026
+
+Author: Jordan Tanudjaja
+
+Python module for matching misspelled card names, such as the names on the banlist, to the card names in
+the Yugioh Card Database. Names are compared by their normalized key (lowercase, without accents and
+punctuation), and names that are not an exact match are found through an inverted index of bigrams that
+only leaves a few candidates to be compared with the Levenshtein distance
+"""
+
+import re
+import unicodedata
+
+
+def normalize_name(name):
+    """
+    Returns the normalized key of a card name: lowercase letters without accents, punctuation removed
+    and whitespace collapsed into single spaces
+
+    Parameters:
+    -----------
+    name: str
+        Card name to be normalized
+    """
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(character for character in name if not unicodedata.combining(character)).casefold()
+    name = re.sub(r'[^\w\s]', '', name)
+    return ' '.join(name.split())
+
+
+def bounded_levenshtein(a, b, max_distance):
+    """
+    Returns the Levenshtein distance between two strings, or max_distance + 1 as soon as the distance is
+    known to be greater than max_distance
+
+    Parameters:
+    -----------
+    a, b: str
+        Strings to be compared
+
+    max_distance: int
+        Largest distance that is of interest
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous_row = list(range(len(b) + 1))
+    for i, character_a in enumerate(a, 1):
+        current_row = [i]
+        for j, character_b in enumerate(b, 1):
+            current_row.append(min(previous_row[j] + 1, current_row[j - 1] + 1,
+                                   previous_row[j - 1] + (character_a != character_b)))
+        if min(current_row) > max_distance:
+            return max_distance + 1
+        previous_row = current_row
+    return min(previous_row[-1], max_distance + 1)
+
+
+class FuzzyIndex:
+    """
+    Class for finding the card names that are closest to a misspelled name
+    """
+    def __init__(self, names):
+        """
+        Parameters:
+        -----------
+        names: iterable of strings
+            Card names that can be matched, repeated names are only kept once
+
+        Variables:
+        ----------
+        Private:
+            names: list
+                The card names in the order they were first passed
+
+            keys: list
+                The normalized key of each card name
+
+            key_index: dict
+                Keys are the normalized keys and values are the lists of positions of the card names
+                with that key
+
+            gram_index: dict
+                Keys are the bigrams of the padded normalized keys and values are the lists of positions
+                of the card names that contain the bigram
+        """
+        self.__names = list(dict.fromkeys(names))
+        self.__keys = [normalize_name(name) for name in self.__names]
+        self.__key_index = {}
+        self.__gram_index = {}
+        for position, key in enumerate(self.__keys):
+            self.__key_index.setdefault(key, []).append(position)
+            for gram in self.__grams(key):
+                self.__gram_index.setdefault(gram, []).append(position)
+
+    def __len__(self):
+        return len(self.__names)
+
+    @staticmethod
+    def __grams(key):
+        """
+        Returns the set of bigrams of the key padded with a start and end character
+
+        Private method that is invoked to build and search the bigram index
+        """
+        padded_key = f'\x02{key}\x03'
+        return {padded_key[i:i + 2] for i in range(len(padded_key) - 1)}
+
+    def search(self, name, max_distance = 2, limit = 5):
+        """
+        Returns the card names that are closest to the name in its argument in a list format, each card
+        name is in a 2-element tuple with its Levenshtein distance to the name (after both are
+        normalized). The list is ranked by distance, then by the difference in length, then by the order
+        of the card names, and it is empty if no card name is within max_distance
+
+        Parameters:
+        -----------
+        name: str
+            Name to be matched, it can be misspelled
+
+        max_distance: int
+            Default value: 2
+
+            Largest Levenshtein distance of the card names to be returned
+
+        limit: int
+            Default value: 5
+
+            Maximum number of card names to be returned, every card name within max_distance is
+            returned if the value is None
+        """
+        key = normalize_name(name)
+        grams = self.__grams(key)
+
+        # An edit changes at most 2 bigrams, so a card name within max_distance shares at least this
+        # many bigrams with the name. Card names that share fewer bigrams are never compared
+        min_shared_grams = len(grams) - 2 * max_distance
+        if min_shared_grams > 0:
+            shared_grams = {}
+            for gram in grams:
+                for position in self.__gram_index.get(gram, ()):
+                    shared_grams[position] = shared_grams.get(position, 0) + 1
+            candidates = [position for position, count in shared_grams.items() if count >= min_shared_grams]
+        else:
+            candidates = range(len(self.__names))
+
+        matches = []
+        for position in candidates:
+            candidate_key = self.__keys[position]
+            if candidate_key == key:
+                distance = 0
+            else:
+                distance = bounded_levenshtein(key, candidate_key, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, abs(len(candidate_key) - len(key)), position))
+        matches.sort()
+        return [(self.__names[position], distance) for distance, _, position in matches[:limit]]
+
+    def best_match(self, name, max_distance = 2):
+        """
+        Returns the card name that is closest to the name in its argument, and returns nothing if no card
+        name is within max_distance
+
+        Parameters:
+        -----------
+        name: str
+            Name to be matched, it can be misspelled
+
+        max_distance: int
+            Default value: 2
+
+            Largest Levenshtein distance of the card name to be returned
+        """
+        key = normalize_name(name)
+        if key in self.__key_index:
+            return self.__names[self.__key_index[key][0]]
+        matches = self.search(name, max_distance = max_distance, limit = 1)
+        return matches[0][0] if matches else None
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 12:05:31 2026
+
+Author: Jordan Tanudjaja
+
+Python module for keeping the web pages downloaded by the webfetch module in a SQLite file, so that
+pages from (https://yugioh.fandom.com) and (https://www.yugioh-card.com) that rarely change are not
+downloaded again on every run. Stale pages are revalidated with a conditional GET (ETag/Last-Modified),
+and the least recently used pages are evicted when the cache grows past its size limit
+"""
+
+import time
+import requests
+from requests.structures import CaseInsensitiveDict
+from yugioh import sqlitestore
+
+class ResponseCache:
+    """
+    Class for handling the SQLite file that holds the web pages downloaded by a WebFetcher, keyed by
+    their URL, together with the ETag and Last-Modified headers used to revalidate them
+    """
+    def __init__(self, cache_filepath = 'Data/HTTP Cache.sqlite', ttl = 24 * 60 * 60, max_size = 500 * 1024 * 1024):
+        """
+        Parameters:
+        -----------
+        cache_filepath: str
+            Default value: 'Data/HTTP Cache.sqlite'
+
+            Filepath of the SQLite file, the file is created if it does not exist yet
+
+        ttl: int or float
+            Default value: 86400 (1 day)
+
+            Number of seconds a cached page is used without asking the website if it has changed. Older
+            pages are revalidated with a conditional GET
+
+        max_size: int
+            Default value: 524288000 (500 MB)
+
+            Maximum number of bytes of page content kept in the cache, the least recently used pages
+            are deleted when the cache grows past this size
+
+        Variables:
+        ----------
+        Public:
+            cache_filepath: str
+                Filepath of the SQLite file
+
+            ttl: int or float
+                Number of seconds a cached page is considered fresh
+
+            max_size: int
+                Maximum number of bytes of page content kept in the cache
+
+        Private:
+            store: sqlitestore.SqliteStore
+                Connection to the responses table, used by the threads of the WebFetcher one at a time
+        """
+        self.cache_filepath = cache_filepath
+        self.ttl = ttl
+        self.max_size = max_size
+        self.__store = sqlitestore.SqliteStore(cache_filepath,
+                                               """CREATE TABLE IF NOT EXISTS responses (
+                                                   url TEXT PRIMARY KEY,
+                                                   content BLOB NOT NULL,
+                                                   encoding TEXT,
+                                                   etag TEXT,
+                                                   last_modified TEXT,
+                                                   size INTEGER NOT NULL,
+                                                   stored_at REAL NOT NULL,
+                                                   last_access REAL NOT NULL)""",
+                                               'CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)')
+
+    def get(self, url):
+        """
+        Returns the cached record of the url in its argument in a dictionary format, and returns nothing
+        if the url is not in the cache
+
+        Parameters:
+        -----------
+        url: str
+            URL of the cached web page
+        """
+        with self.__store.transaction() as connection:
+            row = connection.execute('SELECT content, encoding, etag, last_modified, stored_at FROM responses WHERE url = ?',
+                                     (url,)).fetchone()
+            if row is None:
+                return None
+            connection.execute('UPDATE responses SET last_access = ? WHERE url = ?', (time.time(), url))
+
+        return {'url': url, 'content': row[0], 'encoding': row[1], 'etag': row[2],
+                'last_modified': row[3], 'stored_at': row[4]}
+
+    def is_fresh(self, record):
+        """
+        Returns True if the cached record can be used without revalidating it with the website
+
+        Parameters:
+        -----------
+        record: dict
+            Cached record returned by the get method
+        """
+        return time.time() - record['stored_at'] < self.ttl
+
+    def store(self, url, response):
+        """
+        Method that stores a successful response in the cache and evicts the least recently used pages
+        if the cache grows past its size limit
+
+        Parameters:
+        -----------
+        url: str
+            URL of the web page, used as the key of the cache
+
+        response: requests.Response
+            Response with status code 200 of the url
+        """
+        now = time.time()
+        content = response.content
+        with self.__store.transaction() as connection:
+            connection.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                               (url, content, response.encoding, response.headers.get('ETag'),
+                                response.headers.get('Last-Modified'), len(content), now, now))
+            self.__evict(connection)
+
+    def touch(self, url):
+        """
+        Method that marks a cached page as fresh again, it is invoked when the website answers a
+        conditional GET with 304 Not Modified
+
+        Parameters:
+        -----------
+        url: str
+            URL of the cached web page
+        """
+        now = time.time()
+        with self.__store.transaction() as connection:
+            connection.execute('UPDATE responses SET stored_at = ?, last_access = ? WHERE url = ?', (now, now, url))
+
+    def __evict(self, connection):
+        """
+        Deletes the least recently used pages until the total size of the cache is within max_size
+
+        Private method that is invoked in the store method, inside its transaction
+        """
+        total_size = connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total_size <= self.max_size:
+            return
+
+        to_delete = []
+        for url, size in connection.execute('SELECT url, size FROM responses ORDER BY last_access'):
+            if total_size <= self.max_size:
+                break
+            to_delete.append((url,))
+            total_size -= size
+        connection.executemany('DELETE FROM responses WHERE url = ?', to_delete)
+
+    def get_size(self):
+        """
+        Returns the total number of bytes of page content in the cache
+        """
+        with self.__store.read() as connection:
+            return connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def clear(self):
+        """
+        Method to delete every page in the cache
+        """
+        with self.__store.transaction() as connection:
+            connection.execute('DELETE FROM responses')
+
+    def close(self):
+        """
+        Method to close the connection to the SQLite file
+        """
+        self.__store.close()
+
+    @staticmethod
+    def to_response(record):
+        """
+        Returns a requests.Response built from a cached record, so that the callers of the WebFetcher
+        do not need to know if the page came from the cache or the website. The response has a
+        from_cache attribute set to True
+
+        Parameters:
+        -----------
+        record: dict
+            Cached record returned by the get method
+        """
+        response = requests.Response()
+        response.url = record['url']
+        response.status_code = 200
+        response.reason = 'OK'
+        response._content = record['content']
+        response.encoding = record['encoding']
+        response.headers = CaseInsensitiveDict()
+        if record['etag'] is not None:
+            response.headers['ETag'] = record['etag']
+        if record['last_modified'] is not None:
+            response.headers['Last-Modified'] = record['last_modified']
+        response.from_cache = True
+        return response
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:30:12 2026
+
+Author: Jordan Tanudjaja
+
+Python module for the journal of a full crawl of (https://yugioh.fandom.com). Every card set and card
+url of the crawl is kept in a SQLite file with its status, the hash of its downloaded HTML and the
+parsed card, so a crawl that is interrupted continues where it stopped, and running a finished crawl
+again does not download anything
+"""
+
+import json
+import time
+from yugioh import sqlitestore
+
+class CrawlJournal:
+    """
+    Class for handling the SQLite file that holds the progress of a crawl, keyed by url. One object
+    takes the results of every thread of the crawl, including the callbacks of pipeline.scrape_cards
+
+    Every url has a kind ('set' or 'card') and a status:
+        pending: the url has not been crawled yet
+        done: the url was crawled, and for a card url, its card is kept in the journal
+        skipped: the url was downloaded but it is not a card page
+        failed: the url could not be downloaded or parsed, it is crawled again when the crawl is resumed
+    """
+    statuses = ('pending', 'done', 'skipped', 'failed')
+
+    def __init__(self, journal_filepath = 'Data/Crawl Journal.sqlite'):
+        """
+        Parameters:
+        -----------
+        journal_filepath: str
+            Default value: 'Data/Crawl Journal.sqlite'
+
+            Filepath of the SQLite file, the file is created if it does not exist yet
+
+        Variables:
+        ----------
+        Public:
+            journal_filepath: str
+                Filepath of the SQLite file
+
+        Private:
+            store: sqlitestore.SqliteStore
+                Connection to the pages table, so the threads of a crawl record their urls one at a time
+        """
+        self.journal_filepath = journal_filepath
+        self.__store = sqlitestore.SqliteStore(journal_filepath,
+                                               """CREATE TABLE IF NOT EXISTS pages (
+                                                   position INTEGER PRIMARY KEY AUTOINCREMENT,
+                                                   url TEXT NOT NULL UNIQUE,
+                                                   kind TEXT NOT NULL,
+                                                   status TEXT NOT NULL,
+                                                   html_hash TEXT,
+                                                   card TEXT,
+                                                   updated_at REAL NOT NULL)""",
+                                               'CREATE INDEX IF NOT EXISTS pages_kind_status ON pages (kind, status)')
+
+    def add_urls(self, urls, kind):
+        """
+        Method that adds urls to the journal with the pending status, urls that are already in the
+        journal keep their status
+
+        Parameters:
+        -----------
+        urls: iterable of strings
+            Urls to be crawled
+
+        kind: str
+            'set' for card set urls or 'card' for card urls
+        """
+        now = time.time()
+        with self.__store.transaction() as connection:
+            connection.executemany("INSERT OR IGNORE INTO pages (url, kind, status, updated_at) VALUES (?, ?, 'pending', ?)",
+                                   [(url, kind, now) for url in urls])
+
+    def get_urls(self, kind, statuses = ('pending', 'failed')):
+        """
+        Returns the urls of a kind with one of the statuses in a list format, in the order they were
+        added to the journal
+
+        Parameters:
+        -----------
+        kind: str
+            'set' or 'card'
+
+        statuses: iterable of strings
+            Default value: ('pending', 'failed')
+
+            Statuses of the urls to be returned, the default value gives the urls that still have to
+            be crawled
+        """
+        statuses = tuple(statuses)
+        with self.__store.read() as connection:
+            rows = connection.execute(f"SELECT url FROM pages WHERE kind = ? AND status IN ({', '.join('?' * len(statuses))}) ORDER BY position",
+                                      (kind, *statuses)).fetchall()
+        return [row[0] for row in rows]
+
+    def record_set(self, url, card_urls):
+        """
+        Method that records a card set url as done and adds the urls of its cards to the journal, in
+        one transaction so an interruption cannot lose the card urls of a finished set
+
+        Parameters:
+        -----------
+        url: str
+            Card set url
+
+        card_urls: list of strings
+            Urls of the cards in the card set, nothing is recorded if the value is None and the set is
+            recorded as failed
+        """
+        now = time.time()
+        with self.__store.transaction() as connection:
+            if card_urls is None:
+                connection.execute("UPDATE pages SET status = 'failed', updated_at = ? WHERE url = ?", (now, url))
+                return
+            connection.executemany("INSERT OR IGNORE INTO pages (url, kind, status, updated_at) VALUES (?, 'card', 'pending', ?)",
+                                   [(card_url, now) for card_url in card_urls])
+            connection.execute("UPDATE pages SET status = 'done', updated_at = ? WHERE url = ?", (now, url))
+
+    def record_card(self, url, html_hash, card_dict):
+        """
+        Method that records the result of a card url, it has the same arguments as the on_result
+        function of pipeline.scrape_cards: the url is failed if html_hash is None, skipped if card_dict
+        is None, and done otherwise
+
+        Parameters:
+        -----------
+        url: str
+            Card url
+
+        html_hash: str
+            SHA-256 hash of the downloaded HTML
+
+        card_dict: dict
+            Card dictionary returned by YgScraper.parse_card_details
+        """
+        if html_hash is None:
+            status, card = 'failed', None
+        elif card_dict is None:
+            status, card = 'skipped', None
+        else:
+            # Sets are kept as sorted lists because JSON has no sets, and other values that JSON cannot
+            # hold, such as the exception that parse_card_details keeps in the Card Type of a broken
+            # card table, are kept as text
+            status, card = 'done', json.dumps({key: sorted(value) if isinstance(value, set) else value for key, value in card_dict.items()},
+                                              default = str)
+
+        with self.__store.transaction() as connection:
+            connection.execute("""INSERT INTO pages (url, kind, status, html_hash, card, updated_at) VALUES (?, 'card', ?, ?, ?, ?)
+                                  ON CONFLICT(url) DO UPDATE SET status = excluded.status, html_hash = excluded.html_hash,
+                                                                 card = excluded.card, updated_at = excluded.updated_at""",
+                               (url, status, html_hash, card, time.time()))
+
+    def get_cards(self):
+        """
+        Returns the card dictionaries of the card urls that are done in a list format, in the order the
+        urls were added to the journal
+        """
+        with self.__store.read() as connection:
+            rows = connection.execute("SELECT card FROM pages WHERE kind = 'card' AND status = 'done' ORDER BY position").fetchall()
+        return [{key: set(value) if isinstance(value, list) else value for key, value in json.loads(row[0]).items()} for row in rows]
+
+    def get_counts(self):
+        """
+        Returns the number of urls of each kind and status in a dictionary format, keys are 2-element
+        tuples of (kind, status)
+        """
+        with self.__store.read() as connection:
+            rows = connection.execute('SELECT kind, status, COUNT(*) FROM pages GROUP BY kind, status').fetchall()
+        return {(kind, status): count for kind, status, count in rows}
+
+    def close(self):
+        """
+        Method to close the connection to the SQLite file
+        """
+        self.__store.close()
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 13:20:07 2026
+
+Author: Jordan Tanudjaja
+
+Python module for the HTML parsing backends used to read the pages of (https://yugioh.fandom.com) and
+(https://www.yugioh-card.com). The lxml backend goes straight to the elements that are needed with
+XPath, and the html.parser backend (BeautifulSoup) is used when lxml is not installed
+
+Every backend returns plain strings and lists, so the scraping code does not depend on which backend
+parsed the page
+"""
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+except ImportError: # lxml is optional, the html.parser backend is used without it
+    lxml = None
+
+
+def _class_xpath(class_name):
+    """
+    Returns the XPath condition that matches elements with class_name in their class attribute, which
+    is how BeautifulSoup matches attrs = {'class': class_name}
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+class SoupBackend:
+    """
+    Parsing backend that uses BeautifulSoup with Python's built-in html.parser
+    """
+    name = 'html.parser'
+
+    def parse(self, html):
+        """
+        Returns the parsed document of the HTML in its argument
+
+        Parameters:
+        -----------
+        html: str
+            HTML source of a web page
+        """
+        return BeautifulSoup(html.encode('utf-8'), 'html.parser')
+
+    def card_table_html(self, doc):
+        """
+        Returns the HTML of the card table of a card page, and returns nothing if there is no card table
+        """
+        card_table = doc.find('table', attrs = {'class': "cardtable"})
+        return None if card_table is None else str(card_table)
+
+    def card_description_text(self, doc):
+        """
+        Returns the text of the first navbox-list cell of a card page, which holds the card description,
+        and returns nothing if there is no such cell
+        """
+        td = doc.find('td', attrs = {'class': "navbox-list"})
+        return None if td is None else td.text
+
+    def support_lists(self, doc):
+        """
+        Returns the hlist blocks of a card page in a list format, each block is a 2-element tuple of the
+        text of its dt element (None if it has none) and the list of texts of its dd elements
+        """
+        support_lists = []
+        for div in doc.find_all('div', attrs = {'class': "hlist"}):
+            dt = div.dt
+            support_lists.append((None if dt is None else dt.text, [dd.text for dd in div.find_all('dd')]))
+        return support_lists
+
+    def set_tables(self, doc, class_or_id, attribute_name):
+        """
+        Returns the card tables of a card set page in a list format, each table is a 2-element tuple of
+        its columns and its rows. A cell holds the href of its first link, the text of that link if it
+        has no href, or the text of the cell if it has no link
+
+        Parameters:
+        -----------
+        class_or_id: str
+            'class' or 'id', the attribute used to find the tables
+
+        attribute_name: str
+            Value of the class or id attribute of the tables
+        """
+        set_tables = []
+        for card_table in doc.find_all('table', attrs = {class_or_id: attribute_name}):
+            columns = None
+            record = []
+            for tr in card_table.find_all('tr'):
+                ths = tr.find_all('th')
+                if ths != []:
+                    columns = [th.text for th in ths]
+                else:
+                    row = []
+                    for td in tr.find_all('td'):
+                        if td.a is None:
+                            row.append(td.text)
+                        elif td.a.has_attr('href'):
+                            row.append(td.a['href'])
+                        else:
+                            row.append(td.a.text)
+                    record.append(row)
+            set_tables.append((columns, record))
+        return set_tables
+
+    def navbox_links(self, doc, class_name, first = False):
+        """
+        Returns the links in the list items of the tables with class_name in their class attribute, in
+        a list format. Each link is a 2-element tuple of its href and its title (None if it has none)
+
+        Parameters:
+        -----------
+        class_name: str
+            Class of the tables, such as navbox or navbox-subgroup
+
+        first: bool
+            Default value: False
+
+            If True, only the links of the first table are returned
+        """
+        tables = doc.find_all('table', attrs = {'class': class_name}, limit = 1 if first else None)
+        return [(a.get('href'), a.get('title')) for table in tables for a in table.select('li a')]
+
+    def banlist_rows(self, doc):
+        """
+        Returns the rows of the banlist page in a list format, each row is a 2-element tuple of the
+        texts of its card name cells (class xl763) and its status cells (class xl753)
+        """
+        return [([td.text for td in tr.find_all('td', attrs = {'class': 'xl763'})],
+                 [td.text for td in tr.find_all('td', attrs = {'class': 'xl753'})])
+                for tr in doc.find_all('tr')]
+
+
+class LxmlBackend:
+    """
+    Parsing backend that uses lxml and XPath queries targeted at the elements that are scraped
+    """
+    name = 'lxml'
+
+    def parse(self, html):
+        """
+        Returns the parsed document of the HTML in its argument
+
+        Parameters:
+        -----------
+        html: str
+            HTML source of a web page
+        """
+        parser = lxml.html.HTMLParser(encoding = 'utf-8')
+        try:
+            return lxml.html.document_fromstring(html.encode('utf-8'), parser = parser)
+        except lxml.etree.ParserError: # Blank or truncated pages give an empty document, like BeautifulSoup
+            return lxml.html.document_fromstring(b'<html></html>', parser = parser)
+
+    def card_table_html(self, doc):
+        """
+        Returns the HTML of the card table of a card page, and returns nothing if there is no card table
+        """
+        card_tables = doc.xpath(f"(//table[{_class_xpath('cardtable')}])[1]")
+        return lxml.html.tostring(card_tables[0], encoding = 'unicode') if card_tables else None
+
+    def card_description_text(self, doc):
+        """
+        Returns the text of the first navbox-list cell of a card page, which holds the card description,
+        and returns nothing if there is no such cell
+        """
+        tds = doc.xpath(f"(//td[{_class_xpath('navbox-list')}])[1]")
+        return tds[0].text_content() if tds else None
+
+    def support_lists(self, doc):
+        """
+        Returns the hlist blocks of a card page in a list format, each block is a 2-element tuple of the
+        text of its dt element (None if it has none) and the list of texts of its dd elements
+        """
+        support_lists = []
+        for div in doc.xpath(f"//div[{_class_xpath('hlist')}]"):
+            dts = div.xpath('.//dt[1]')
+            support_lists.append((dts[0].text_content() if dts else None,
+                                  [dd.text_content() for dd in div.xpath('.//dd')]))
+        return support_lists
+
+    def set_tables(self, doc, class_or_id, attribute_name):
+        """
+        Returns the card tables of a card set page in a list format, each table is a 2-element tuple of
+        its columns and its rows. A cell holds the href of its first link, the text of that link if it
+        has no href, or the text of the cell if it has no link
+
+        Parameters:
+        -----------
+        class_or_id: str
+            'class' or 'id', the attribute used to find the tables
+
+        attribute_name: str
+            Value of the class or id attribute of the tables
+        """
+        if class_or_id == 'class':
+            condition = _class_xpath(attribute_name)
+        else:
+            condition = f"@{class_or_id} = '{attribute_name}'"
+
+        set_tables = []
+        for card_table in doc.xpath(f'//table[{condition}]'):
+            columns = None
+            record = []
+            for tr in card_table.xpath('.//tr'):
+                ths = tr.xpath('.//th')
+                if ths != []:
+                    columns = [th.text_content() for th in ths]
+                else:
+                    row = []
+                    for td in tr.xpath('.//td'):
+                        links = td.xpath('.//a[1]')
+                        if not links:
+                            row.append(td.text_content())
+                        elif links[0].get('href') is not None:
+                            row.append(links[0].get('href'))
+                        else:
+                            row.append(links[0].text_content())
+                    record.append(row)
+            set_tables.append((columns, record))
+        return set_tables
+
+    def navbox_links(self, doc, class_name, first = False):
+        """
+        Returns the links in the list items of the tables with class_name in their class attribute, in
+        a list format. Each link is a 2-element tuple of its href and its title (None if it has none)
+
+        Parameters:
+        -----------
+        class_name: str
+            Class of the tables, such as navbox or navbox-subgroup
+
+        first: bool
+            Default value: False
+
+            If True, only the links of the first table are returned
+        """
+        tables = doc.xpath(f"//table[{_class_xpath(class_name)}]")
+        if first:
+            tables = tables[:1]
+        return [(a.get('href'), a.get('title')) for table in tables for a in table.xpath('.//li//a')]
+
+    def banlist_rows(self, doc):
+        """
+        Returns the rows of the banlist page in a list format, each row is a 2-element tuple of the
+        texts of its card name cells (class xl763) and its status cells (class xl753)
+        """
+        return [([td.text_content() for td in tr.xpath(f".//td[{_class_xpath('xl763')}]")],
+                 [td.text_content() for td in tr.xpath(f".//td[{_class_xpath('xl753')}]")])
+                for tr in doc.xpath('//tr')]
+
+
+# Backends that can be chosen by name
+backends = {SoupBackend.name: SoupBackend, LxmlBackend.name: LxmlBackend}
+
+def get_backend(name = None):
+    """
+    Returns a parsing backend object
+
+    Parameters:
+    -----------
+    name: str
+        Default value: None
+
+        'lxml' or 'html.parser', the lxml backend is used if no name is passed and lxml is installed,
+        otherwise the html.parser backend is used
+    """
+    if name is None:
+        name = LxmlBackend.name if lxml is not None else SoupBackend.name
+    if name == LxmlBackend.name and lxml is None:
+        raise ImportError('lxml is not installed, use the html.parser backend instead')
+    try:
+        return backends[name]()
+    except KeyError:
+        raise KeyError(f'{name} is not a parsing backend, choose from {list(backends.keys())}')
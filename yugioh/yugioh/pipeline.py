@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 15:04:22 2026
+
+Author: Jordan Tanudjaja
+
+Python module for scraping a large number of card pages from (https://yugioh.fandom.com) in two stages.
+Threads download the raw HTML of the card pages, and a pool of processes parses the HTML into card
+dictionaries, so the parsing is spread over every CPU core instead of being serialized by the GIL in
+the downloading threads. Bounded queues between the two stages stop the downloads from running too
+far ahead of the parsing
+"""
+
+import os
+import queue
+import hashlib
+import functools
+import threading
+import concurrent.futures
+import requests
+from yugioh import ygfandom as ygf
+from yugioh import webfetch
+
+# YgScraper object of each parsing process, it is created once by the initializer of the process pool.
+# It is only used to parse pages, so it never takes a WebFetcher and opens no connections
+_worker_scraper = None
+
+def _init_parse_worker(parser):
+    """
+    Initializer of the parsing processes, creates the YgScraper object used to parse the card pages with
+    the parsing backend in its argument
+    """
+    global _worker_scraper
+    _worker_scraper = ygf.YgScraper(parser = parser)
+
+def _parse_card_page(index, url, html):
+    """
+    Returns the index of the card page and the card dictionary parsed from its HTML, it runs in the
+    parsing processes
+    """
+    return index, _worker_scraper.parse_card_details(html, url)
+
+
+def scrape_cards(urls, io_workers = 5, parse_workers = None, queue_size = 50, parser = None, fetcher = None, on_result = None):
+    """
+    Returns the card details of every url in its argument in a list format, in the same order as the
+    urls. Urls that cannot be downloaded or are not card pages give None
+
+    Parameters:
+    -----------
+    urls: list of strings
+        Individual card urls to be scraped
+
+    io_workers: int
+        Default value: 5
+
+        Number of threads that download the card pages, it should match the pool size of the fetcher
+
+    parse_workers: int
+        Default value: None
+
+        Number of processes that parse the card pages, the number of CPU cores is used if no value
+        is passed
+
+    queue_size: int
+        Default value: 50
+
+        Maximum number of downloaded pages waiting to be parsed, and maximum number of pages being
+        parsed at the same time. The downloading threads wait when the parsing falls behind
+
+    parser: str
+        Default value: None
+
+        Name of the parsing backend from the parsers module used by the parsing processes
+
+    fetcher: webfetch.WebFetcher
+        Default value: None
+
+        WebFetcher object used to download the card pages, the shared WebFetcher object of the
+        webfetch module is used if no object is passed
+
+    on_result: function
+        Default value: None
+
+        Function that is called as soon as each page is done, with 3 arguments: the url, the SHA-256
+        hash of the downloaded HTML and the card dictionary. The hash is None if the page could not be
+        downloaded or parsed, and the card dictionary is None if the page is not a card page. It is
+        called from the threads of the process pool, so it has to be thread-safe
+    """
+    urls = list(urls)
+    if fetcher is None:
+        fetcher = webfetch.get_fetcher()
+    if parse_workers is None:
+        parse_workers = os.cpu_count() or 1
+
+    url_queue = queue.Queue()
+    for index, url in enumerate(urls):
+        url_queue.put((index, url))
+    html_queue = queue.Queue(maxsize = queue_size) # Bounded queue between the downloads and the parsing
+
+    def download():
+        # Each thread downloads card pages until there are no urls left, then puts None in the html_queue
+        # to tell the parsing stage that it is done. The None is always put, even if the thread fails,
+        # otherwise the parsing stage would wait for it forever
+        try:
+            while True:
+                try:
+                    index, url = url_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    html = fetcher.get_html(url)
+                    html_hash = None if html is None else hashlib.sha256(html.encode('utf-8')).hexdigest()
+                except requests.exceptions.RequestException:
+                    html, html_hash = None, None
+                except Exception as e:
+                    # Unexpected errors, such as a failing cache, only fail the url they happened on
+                    print(e)
+                    html, html_hash = None, None
+                html_queue.put((index, url, html, html_hash))
+        finally:
+            html_queue.put(None)
+
+    card_details = [None] * len(urls)
+    in_flight = threading.BoundedSemaphore(queue_size) # Limits the number of pages inside the process pool
+
+    def collect(url, html_hash, future):
+        try:
+            index, card_dict = future.result()
+        except Exception as e:
+            print(e)
+            if on_result is not None:
+                on_result(url, None, None)
+        else:
+            card_details[index] = card_dict
+            if on_result is not None:
+                on_result(url, html_hash, card_dict)
+        finally:
+            in_flight.release()
+
+    threads = [threading.Thread(target = download, daemon = True) for _ in range(min(io_workers, max(len(urls), 1)))]
+    for thread in threads:
+        thread.start()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers = parse_workers, initializer = _init_parse_worker,
+                                                initargs = (parser,)) as executor:
+        finished_threads = 0
+        while finished_threads < len(threads):
+            item = html_queue.get()
+            if item is None:
+                finished_threads += 1
+                continue
+
+            index, url, html, html_hash = item
+            if html is None:
+                print(url)
+                if on_result is not None:
+                    on_result(url, None, None)
+                continue
+            in_flight.acquire()
+            executor.submit(_parse_card_page, index, url, html).add_done_callback(functools.partial(collect, url, html_hash))
+
+    for thread in threads:
+        thread.join()
+
+    return card_details
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:12:47 2026
+
+Author: Jordan Tanudjaja
+
+Python module for keeping the price statistics searched by the tcgplayer module in a SQLite file, so
+that a card that was searched recently is not searched again in (https://www.tcgplayer.com). Prices are
+keyed by the card name without upper and lower case letters, the same way the price searches match the
+names of the results, they expire after a time-to-live, and the least recently used cards are evicted
+when the cache holds more cards than its limit
+
+The get_price_cache function returns the PriceCache object of the default SQLite file that is shared by
+every CardPriceScraper and BuyingTool object
+"""
+
+import json
+import time
+import threading
+from yugioh import sqlitestore
+
+
+def _card_key(card_name):
+    """
+    Returns the key of a card name in the cache. Only the upper and lower case letters are ignored,
+    because card names that only differ in their punctuation are different cards with different prices
+    """
+    return card_name.lower()
+
+class PriceCache:
+    """
+    Class for handling the SQLite file that holds the price statistics of the cards searched recently,
+    with the time each card was stored and last read, which decide when it expires or is evicted
+    """
+    def __init__(self, cache_filepath = 'Data/Price Cache.sqlite', ttl = 6 * 60 * 60, max_entries = 20000):
+        """
+        Parameters:
+        -----------
+        cache_filepath: str
+            Default value: 'Data/Price Cache.sqlite'
+
+            Filepath of the SQLite file, the file is created if it does not exist yet. ':memory:' keeps
+            the cache in memory for the lifetime of the object
+
+        ttl: int or float
+            Default value: 21600 (6 hours)
+
+            Number of seconds the prices of a card are used before the card is searched again
+
+        max_entries: int
+            Default value: 20000
+
+            Maximum number of cards kept in the cache, the least recently used cards are deleted when
+            the cache grows past this number
+
+        Variables:
+        ----------
+        Public:
+            cache_filepath: str
+                Filepath of the SQLite file
+
+            ttl: int or float
+                Number of seconds the prices of a card are considered fresh
+
+            max_entries: int
+                Maximum number of cards kept in the cache
+
+        Private:
+            store: sqlitestore.SqliteStore
+                Connection to the prices table, a cache hit and its last access update are one transaction
+        """
+        self.cache_filepath = cache_filepath
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.__store = sqlitestore.SqliteStore(cache_filepath,
+                                               """CREATE TABLE IF NOT EXISTS prices (
+                                                   card_key TEXT PRIMARY KEY,
+                                                   price_stats TEXT NOT NULL,
+                                                   stored_at REAL NOT NULL,
+                                                   last_access REAL NOT NULL)""",
+                                               'CREATE INDEX IF NOT EXISTS prices_last_access ON prices (last_access)')
+
+    def get(self, card_name):
+        """
+        Returns the cached price statistics of the card in a dictionary format, in the same format as
+        CardPriceScraper.price_searcher, and returns nothing if the card is not in the cache or its
+        prices are older than the time-to-live
+
+        Parameters:
+        -----------
+        card_name: str
+            Name of the card, upper and lower case letters do not matter
+        """
+        card_key = _card_key(card_name)
+        now = time.time()
+        with self.__store.transaction() as connection:
+            row = connection.execute('SELECT price_stats, stored_at FROM prices WHERE card_key = ?', (card_key,)).fetchone()
+            if row is None or now - row[1] >= self.ttl:
+                return None
+            connection.execute('UPDATE prices SET last_access = ? WHERE card_key = ?', (now, card_key))
+        return json.loads(row[0])
+
+    def store(self, card_name, price_stats):
+        """
+        Method that stores the price statistics of a card in the cache and evicts the least recently
+        used cards if the cache grows past its limit
+
+        Parameters:
+        -----------
+        card_name: str
+            Name of the card
+
+        price_stats: dict
+            Price statistics returned by CardPriceScraper.price_searcher, an empty dictionary is kept as
+            well because it means that nobody is selling the card
+        """
+        now = time.time()
+        with self.__store.transaction() as connection:
+            connection.execute('INSERT OR REPLACE INTO prices VALUES (?, ?, ?, ?)',
+                               (_card_key(card_name), json.dumps(price_stats), now, now))
+            self.__evict(connection)
+
+    def __evict(self, connection):
+        """
+        Deletes the least recently used cards until the number of cards in the cache is within
+        max_entries
+
+        Private method that is invoked in the store method, inside its transaction
+        """
+        excess = connection.execute('SELECT COUNT(*) FROM prices').fetchone()[0] - self.max_entries
+        if excess > 0:
+            connection.execute('DELETE FROM prices WHERE card_key IN (SELECT card_key FROM prices ORDER BY last_access LIMIT ?)',
+                               (excess,))
+
+    def __len__(self):
+        with self.__store.read() as connection:
+            return connection.execute('SELECT COUNT(*) FROM prices').fetchone()[0]
+
+    def clear(self):
+        """
+        Method to delete every card in the cache
+        """
+        with self.__store.transaction() as connection:
+            connection.execute('DELETE FROM prices')
+
+    def close(self):
+        """
+        Method to close the connection to the SQLite file
+        """
+        self.__store.close()
+
+
+# PriceCache object of the default SQLite file, it is created the first time it is needed
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+def get_price_cache():
+    """
+    Returns the PriceCache object of the default SQLite file that is shared by the whole package
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = PriceCache()
+        return _shared_cache
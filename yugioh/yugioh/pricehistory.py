@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 14:05:22 2026
+
+Author: Jordan Tanudjaja
+
+Python module for keeping every price search of the tcgplayer module in a SQLite time-series, so that
+the price trend of a card can be looked up without searching (https://www.tcgplayer.com) again. The
+observations are stored in the order of card and time, so the observations of a few cards in a time
+range are read without scanning the whole history
+"""
+
+import datetime
+import time
+import pandas as pd
+from yugioh import sqlitestore
+from yugioh.fuzzy import normalize_name
+
+# Columns of the price statistics returned by CardPriceScraper.price_searcher, in the same order as the
+# columns of the observations table
+PRICE_COLUMNS = ['Average Market Price', 'Average Lowest Price', 'Cheapest Price', 'Highest Price']
+
+
+def _to_timestamp(moment):
+    """
+    Returns the POSIX timestamp of a datetime, a date or a string, times without a timezone are taken
+    as UTC and numbers are returned as they are
+    """
+    if moment is None or isinstance(moment, (int, float)):
+        return moment
+    return pd.Timestamp(moment).timestamp()
+
+
+class PriceHistory:
+    """
+    Class for handling the SQLite file that holds the price observations of the cards, keyed by the
+    normalized card name and the time of the observation. Observations are never evicted, unlike the
+    prices of the PriceCache class
+    """
+    def __init__(self, history_filepath = 'Data/Price History.sqlite'):
+        """
+        Parameters:
+        -----------
+        history_filepath: str
+            Default value: 'Data/Price History.sqlite'
+
+            Filepath of the SQLite file, the file is created if it does not exist yet
+
+        Variables:
+        ----------
+        Public:
+            history_filepath: str
+                Filepath of the SQLite file
+
+        Private:
+            store: sqlitestore.SqliteStore
+                Connection to the observations table, every record_many call is written in one transaction
+        """
+        self.history_filepath = history_filepath
+        self.__store = sqlitestore.SqliteStore(history_filepath,
+                                               # WITHOUT ROWID keeps the rows sorted by the primary key, so the observations of a card are
+                                               # next to each other in the order of time
+                                               """CREATE TABLE IF NOT EXISTS observations (
+                                                   card_key TEXT NOT NULL,
+                                                   observed_at REAL NOT NULL,
+                                                   card_name TEXT NOT NULL,
+                                                   average_market_price REAL,
+                                                   average_lowest_price REAL,
+                                                   cheapest_price REAL,
+                                                   highest_price REAL,
+                                                   PRIMARY KEY (card_key, observed_at)) WITHOUT ROWID""",
+                                               'CREATE INDEX IF NOT EXISTS observations_observed_at ON observations (observed_at)')
+
+    def record(self, card_name, price_stats, observed_at = None):
+        """
+        Method that appends the price statistics of a card to the history, empty price statistics are
+        not recorded because the card had no sellers
+
+        Parameters:
+        -----------
+        card_name: str
+            Name of the card
+
+        price_stats: dict
+            Price statistics returned by CardPriceScraper.price_searcher
+
+        observed_at: float, datetime or str
+            Default value: None
+
+            Time of the observation, the current time is used if the value is None
+        """
+        self.record_many({card_name: price_stats}, observed_at = observed_at)
+
+    def record_many(self, card_prices, observed_at = None):
+        """
+        Method that appends the price statistics of several cards to the history in one transaction
+
+        Parameters:
+        -----------
+        card_prices: dict
+            Keys are the card names and values are the price statistics returned by
+            CardPriceScraper.price_searcher, cards with empty or missing price statistics are left out
+
+        observed_at: float, datetime or str
+            Default value: None
+
+            Time of the observations, the current time is used if the value is None
+        """
+        observed_at = time.time() if observed_at is None else _to_timestamp(observed_at)
+        rows = [(normalize_name(card_name), observed_at, card_name, *[price_stats.get(column) for column in PRICE_COLUMNS])
+                for card_name, price_stats in card_prices.items() if price_stats]
+        with self.__store.transaction() as connection:
+            connection.executemany('INSERT OR REPLACE INTO observations VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def __where(self, card_names, start, end):
+        """
+        Returns the WHERE clause and its parameters for the observations of the cards between start and
+        end, every card is selected if card_names is None. Returns None for the WHERE clause if
+        card_names is empty, because no observation can be selected
+
+        Private method that is invoked by the get methods
+        """
+        conditions = []
+        parameters = []
+        if card_names is not None:
+            if type(card_names) == str:
+                card_names = [card_names]
+            card_keys = list(dict.fromkeys(normalize_name(name) for name in card_names))
+            if len(card_keys) == 0:
+                return None, []
+            conditions.append(f"card_key IN ({', '.join('?' * len(card_keys))})")
+            parameters.extend(card_keys)
+        if start is not None:
+            conditions.append('observed_at >= ?')
+            parameters.append(_to_timestamp(start))
+        if end is not None:
+            conditions.append('observed_at < ?')
+            parameters.append(_to_timestamp(end))
+        return (' WHERE ' + ' AND '.join(conditions)) if conditions else '', parameters
+
+    def get_history(self, card_names = None, start = None, end = None):
+        """
+        Returns the observations of the cards between start and end in a dataframe format, with the
+        columns: Card Name, Observed At and the price statistics, sorted by card and time
+
+        Parameters:
+        -----------
+        card_names: str or list
+            Default value: None
+
+            Name(s) of the cards, upper and lower case letters, accents and punctuation do not matter.
+            Every card is returned if the value is None
+
+        start: float, datetime or str
+            Default value: None
+
+            Start of the time range (inclusive), the range has no start if the value is None
+
+        end: float, datetime or str
+            Default value: None
+
+            End of the time range (exclusive), the range has no end if the value is None
+        """
+        where, parameters = self.__where(card_names, start, end)
+        if where is None:
+            rows = []
+        else:
+            with self.__store.read() as connection:
+                rows = connection.execute(f"""SELECT card_name, observed_at, average_market_price, average_lowest_price,
+                                                     cheapest_price, highest_price
+                                              FROM observations{where} ORDER BY card_key, observed_at""", parameters).fetchall()
+
+        history_df = pd.DataFrame(rows, columns = ['Card Name', 'Observed At'] + PRICE_COLUMNS)
+        history_df['Observed At'] = pd.to_datetime(history_df['Observed At'], unit = 's')
+        return history_df
+
+    def get_aggregates(self, card_names = None, start = None, end = None, interval = datetime.timedelta(days = 1)):
+        """
+        Returns the observations of the cards between start and end downsampled to one row per card
+        and interval in a dataframe format, with the columns: Card Name, Period Start, Observations,
+        the mean of the Average Market and Average Lowest Prices, the minimum of the Cheapest Prices
+        and the maximum of the Highest Prices. The aggregates are calculated in SQLite, so the
+        observations are never loaded one by one
+
+        Parameters:
+        -----------
+        card_names, start, end:
+            Refer to the get_history method
+
+        interval: datetime.timedelta or int
+            Default value: datetime.timedelta(days = 1)
+
+            Length of each period, an int is a number of seconds. Periods start at multiples of the
+            interval since 1970-01-01 (UTC)
+        """
+        if isinstance(interval, datetime.timedelta):
+            interval = interval.total_seconds()
+        if interval <= 0:
+            raise ValueError('The interval has to be longer than 0 seconds')
+
+        where, parameters = self.__where(card_names, start, end)
+        if where is None:
+            rows = []
+        else:
+            with self.__store.read() as connection:
+                rows = connection.execute(f"""SELECT MAX(card_name), CAST(observed_at / ? AS INTEGER) * ? AS period_start, COUNT(*),
+                                                     ROUND(AVG(average_market_price), 2), ROUND(AVG(average_lowest_price), 2),
+                                                     MIN(cheapest_price), MAX(highest_price)
+                                              FROM observations{where}
+                                              GROUP BY card_key, period_start ORDER BY card_key, period_start""",
+                                          [interval, interval] + parameters).fetchall()
+
+        aggregates_df = pd.DataFrame(rows, columns = ['Card Name', 'Period Start', 'Observations'] + PRICE_COLUMNS)
+        aggregates_df['Period Start'] = pd.to_datetime(aggregates_df['Period Start'], unit = 's')
+        return aggregates_df
+
+    def __len__(self):
+        with self.__store.read() as connection:
+            return connection.execute('SELECT COUNT(*) FROM observations').fetchone()[0]
+
+    def close(self):
+        """
+        Method to close the connection to the SQLite file
+        """
+        self.__store.close()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 20:14:08 2026
+
+Author: Jordan Tanudjaja
+
+Python module for the SQLite connection used by the SQLite files of the package, such as the HTTP cache
+of the webfetch module. The connection is opened in WAL mode so the file can be read while it is being
+written to
+"""
+
+import sqlite3
+import threading
+import contextlib
+
+class SqliteStore:
+    """
+    Class for handling a SQLite connection that is shared by all the threads of a program. Only one
+    thread at a time can use the connection, through the transaction and read methods
+    """
+    def __init__(self, filepath, *statements):
+        """
+        Parameters:
+        -----------
+        filepath: str
+            Filepath of the SQLite file, the file is created if it does not exist yet. ':memory:' keeps
+            the database in memory for the lifetime of the object
+
+        statements: str
+            SQL statements that create the tables and indexes if they do not exist yet, they are run in
+            one transaction
+
+        Variables:
+        ----------
+        Public:
+            filepath: str
+                Filepath of the SQLite file
+
+        Private:
+            connection: sqlite3.Connection
+                Connection to the SQLite file, shared by all the threads behind the lock
+
+            lock: threading.Lock
+                Lock that allows only one thread at a time to use the connection
+        """
+        self.filepath = filepath
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(filepath, check_same_thread = False)
+
+        with self.transaction() as connection:
+            connection.execute('PRAGMA journal_mode=WAL')
+            for statement in statements:
+                connection.execute(statement)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Context manager that holds the lock and gives the connection inside a transaction, the
+        transaction is committed at the end of the block and rolled back if the block raises
+        """
+        with self.__lock, self.__connection:
+            yield self.__connection
+
+    @contextlib.contextmanager
+    def read(self):
+        """
+        Context manager that holds the lock and gives the connection, for blocks that only read
+        """
+        with self.__lock:
+            yield self.__connection
+
+    def close(self):
+        """
+        Method to close the connection to the SQLite file
+        """
+        with self.__lock:
+            self.__connection.close()
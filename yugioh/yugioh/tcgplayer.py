@@ -9,15 +9,54 @@ and cross-referencing with the Yugioh Card Database in the Data directory
 """
 
 import pandas as pd
+import json
 import time
+import concurrent.futures
+import queue
+import requests
 from yugioh import ygfandom as ygf
+from yugioh import webfetch
+from yugioh import pricecache
 
 # Selenium imports
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+# JSON search endpoint used by the tcgplayer.com search page, it is used by the http backend
+TCGPLAYER_SEARCH_URL = 'https://mp-search-api.tcgplayer.com/v1/search/request'
+
+# Number of search results on the first page of a tcgplayer.com search
+RESULTS_PER_PAGE = 24
+
+# Script that reads every search result of the page in one call. It returns null until the number of
+# results appears and the first page has that many result items (at most RESULTS_PER_PAGE), because the
+# items are rendered one by one after the number, and a JSON list of [title, market price, lowest price]
+# afterwards. Prices that are not shown are null
+SEARCH_RESULTS_SCRIPT = """
+const results = document.getElementsByClassName('results');
+if (results.length === 0) {
+    return null;
+}
+const cards = document.getElementsByClassName('search-result__content');
+const count = results[0].textContent.match(/([\\d,]+)\\s+results?/i);
+if (count !== null && cards.length < Math.min(parseInt(count[1].replace(/,/g, ''), 10), %d)) {
+    return null;
+}
+const text = (card, className) => {
+    const element = card.getElementsByClassName(className)[0];
+    return element ? element.textContent.trim() : null;
+};
+return JSON.stringify(Array.from(cards, card => [
+    text(card, 'search-result__title'),
+    text(card, 'search-result__market-price--value'),
+    text(card, 'inventory__price-with-shipping')
+]));
+""" % RESULTS_PER_PAGE
 
 
 class CardPriceScraper:
@@ -25,7 +64,11 @@ class CardPriceScraper:
     Class that scrapes the https://www.tcgplayer.com website and manipulates the site using
     Selenium to return the prices of whatever card the user is interested in looking at
     """
-    def __init__(self, PATH = 'External Applications/chromedriver.exe', filepath = 'Data/Yugioh Card Database.csv'):
+    price_columns = ['Average Market Price', 'Average Lowest Price', 'Cheapest Price', 'Highest Price']
+
+    def __init__(self, PATH = 'External Applications/chromedriver.exe', filepath = 'Data/Yugioh Card Database.csv',
+                 backend = 'selenium', search_url = TCGPLAYER_SEARCH_URL, max_workers = 5, browsers = 1, headless = False,
+                 price_cache = None, price_history = None):
         """
         Parameters:
         -----------
@@ -40,11 +83,74 @@ class CardPriceScraper:
             Filepath that leads to the Yugioh Card Database to initialize a DbHandler Object. Default
             value allows any python file in the same level as the yugioh package to access the database
             directly
+
+        backend: str
+            Default value: 'selenium'
+
+            'selenium' to search the prices by driving a Chrome browser, or 'http' to search the prices
+            with plain HTTP requests to the JSON search endpoint of tcgplayer.com, which needs no browser
+            and searches several cards at the same time
+
+        search_url: str
+            Default value: 'https://mp-search-api.tcgplayer.com/v1/search/request'
+
+            URL of the JSON search endpoint used by the http backend
+
+        max_workers: int
+            Default value: 5
+
+            Number of cards searched at the same time by the http backend
+
+        browsers: int
+            Default value: 1
+
+            Number of Chrome browsers in the pool of the selenium backend, set_card_prices spreads the
+            cards across the browsers so that they are searched at the same time. The browsers are
+            kept open and reused by every search until quit_browser is invoked
+
+        headless: bool
+            Default value: False
+
+            Opens the Chrome browsers without a window if True, recommended for a pool of browsers
+
+        price_cache: pricecache.PriceCache
+            Default value: None
+
+            Cache of the price statistics that is checked before a card is searched and filled after
+            every search. The same PriceCache object can be passed to several objects so that they
+            share their prices. The shared PriceCache object of the default SQLite file is used if the
+            value is None, refer to pricecache.get_price_cache
+
+        price_history: pricehistory.PriceHistory
+            Default value: None
+
+            Time-series of prices that every search of tcgplayer.com is appended to, prices that come
+            from the price cache are not appended again. Nothing is recorded if the value is None
+
         Variables:
         ----------
         Public:
             driver: webdriver.Chrome()
-                The driver that opens the Chrome browser from the Selenium Package
+                The driver that opens the Chrome browser from the Selenium Package, it is the first
+                driver of the pool and it is None with the http backend
+
+            drivers: list
+                The pool of drivers of the selenium backend, it is empty with the http backend
+
+            price_cache: pricecache.PriceCache
+                Cache of the price statistics of the cards that were searched
+
+            price_history: pricehistory.PriceHistory
+                Time-series of the prices of the cards that were searched, it can be None
+
+            backend: str
+                'selenium' or 'http'
+
+            search_url: str
+                URL of the JSON search endpoint used by the http backend
+
+            max_workers: int
+                Number of cards searched at the same time by the http backend
 
         Private:
             card_prices_df: DataFrame()
@@ -53,13 +159,50 @@ class CardPriceScraper:
             combined_df: DataFrame()
                 Dataframe that merges the card_prices_df and a subset of the yugioh card database
                 that includes the columns: Card Type, Competitive Status, and Reference
-        """
-        self.driver = webdriver.Chrome(executable_path = PATH)
-        self.driver.get('https://www.tcgplayer.com/')
+
+            PATH, headless:
+                Arguments used to open the browsers again in the restart_browser method
+
+            idle_drivers: queue.Queue
+                Drivers of the pool that are not searching a card, each search borrows one driver
+                and puts it back when it is done
+        """
+        if backend not in ('selenium', 'http'):
+            raise KeyError(f"{backend} is not a price search backend, choose from ['selenium', 'http']")
+        self.backend = backend
+        self.search_url = search_url
+        self.max_workers = max_workers
+        self.__PATH = PATH
+        self.__headless = headless
+        self.__idle_drivers = queue.Queue()
+        self.price_cache = price_cache if price_cache is not None else pricecache.get_price_cache()
+        self.price_history = price_history
+        self.drivers = []
+        if backend == 'selenium':
+            # Opening a browser takes a few seconds, so the browsers of the pool are opened at the same time
+            with concurrent.futures.ThreadPoolExecutor(max_workers = browsers) as executor:
+                self.drivers = list(executor.map(lambda _: self.__open_driver(), range(browsers)))
+            for driver in self.drivers:
+                self.__idle_drivers.put(driver)
+        self.driver = self.drivers[0] if self.drivers else None
         self.filepath = filepath
         self.__card_prices_df = pd.DataFrame()
         self.__combined_df = pd.DataFrame()
 
+    def __open_driver(self):
+        """
+        Returns a new driver that is on the https://www.tcgplayer.com home page
+
+        Private method that is invoked to open the browsers of the pool
+        """
+        options = webdriver.ChromeOptions()
+        if self.__headless:
+            options.add_argument('--headless')
+            options.add_argument('--window-size=1920,1080') # Headless Chrome has a small window by default
+        driver = webdriver.Chrome(service = Service(self.__PATH), options = options)
+        driver.get('https://www.tcgplayer.com/')
+        return driver
+
     @staticmethod
     def check_card_names(card_names, filepath = 'Data/Yugioh Card Database.csv'):
         """
@@ -79,62 +222,142 @@ class CardPriceScraper:
         filepath: str
             Default value: 'Data/Yugioh Card Database.csv'
 
-            Filepath that leads to the Yugioh Card Database to initialize a DbHandler Object. Default
+            Filepath that leads to the Yugioh Card Database to get the shared DbHandler Object. Default
             value allows any python file in the same level as the yugioh package to access the database
             directly. The method, search_card_name, from the object is invoked here
         """
         if type(card_names) == str:
             card_names = [card_names] # Converting it to a list
         card_names = list(set(card_names))
-        duelist = ygf.DbHandler(database_filepath = filepath)
+        duelist = ygf.get_database(filepath) # The database file is only read once
         tosearch_df = duelist.search_card_name(card_names)[['Card Name', 'Card Type', 'Competitive Status (TCG Advanced)', 'Reference']]
         return tosearch_df
 
     def price_searcher(self, db_card_name):
         """
         Returns a dictionary of price statistics of the card that has the same name as db_card_name
-        in the web page
+        in the web page. Prices that are in the price cache and younger than its time-to-live are
+        returned without searching the web page
 
         Parameters:
         -----------
         db_card_name: str
             card name of the card to be searched
         """
-        search = self.driver.find_element_by_id('autocomplete-input')
-        search.send_keys(db_card_name)
-        search.send_keys(Keys.RETURN)
+        price_stats = self.price_cache.get(db_card_name)
+        if price_stats is not None:
+            return price_stats
+
+        if self.backend == 'http':
+            price_stats = self.__http_price_searcher(db_card_name)
+        else:
+            # Borrowing a driver from the pool, the search waits if every driver is busy
+            driver = self.__idle_drivers.get()
+            try:
+                price_stats = self.__selenium_price_searcher(db_card_name, driver)
+            finally:
+                self.__idle_drivers.put(driver)
+
+        # Failed searches return nothing and are not cached so that they are searched again next time
+        if price_stats is not None:
+            self.price_cache.store(db_card_name, price_stats)
+            if self.price_history is not None:
+                self.price_history.record(db_card_name, price_stats)
+        return price_stats
+
+    def __selenium_price_searcher(self, db_card_name, driver):
+        """
+        Returns a dictionary of price statistics of the card that has the same name as db_card_name in
+        the web page of the driver in its argument
+
+        Private method that is invoked in the price_searcher method with the selenium backend
+        """
+        # Results of the previous search on this driver, the new search is only ready once they change
+        previous_results = driver.find_elements(By.CLASS_NAME, 'results')
+        previous_url = driver.current_url
+        previous_text = previous_results[0].text if previous_results else None
+
+        def search_changed(driver):
+            # The url holds the query of the search and the results text holds its count, the site can
+            # either render the results again or reuse the same element
+            try:
+                return driver.current_url != previous_url or previous_results[0].text != previous_text
+            except StaleElementReferenceException:
+                return True
 
         try:
-            # finding the number of results that appears at the bottom of the page
-            # because that takes the longest to load
-            results = WebDriverWait(self.driver, 3).until(
-                EC.presence_of_element_located((By.CLASS_NAME, 'results'))
-            )
-        except:
-            self.driver.quit()
+            search = WebDriverWait(driver, 3).until(EC.element_to_be_clickable((By.ID, 'autocomplete-input')))
+            search.send_keys(db_card_name)
+            search.send_keys(Keys.RETURN)
+
+            if previous_results:
+                WebDriverWait(driver, 3).until(search_changed)
+            # Polls the page until the script finds every result item, then every title and price comes
+            # back in that one call. Only the first page of results is read
+            card_info = json.loads(WebDriverWait(driver, 3).until(lambda driver: driver.execute_script(SEARCH_RESULTS_SCRIPT)))
+        except TimeoutException:
+            # The driver goes back to the home page instead of quitting so that it stays in the pool
+            driver.get('https://www.tcgplayer.com/')
             print(f'{db_card_name} is not found in tcgplayer.com')
             return None
-        else:
-            time.sleep(1) # Pausing script here for 1 second because the script moves too fast before
-                          # the web page can even load
-
-        # card_info shows the list of all cards in the page and only searching this 1 page,
-        # the code does not go into the next page eventhough there are cards in the next page
-        card_info = self.driver.find_elements_by_class_name('search-result__content')
 
         market_price_list = []
         lowest_price_list = []
-        for card in card_info:
-            name = card.find_element_by_class_name('search-result__title').text
-            if name.lower() == db_card_name.lower():
+        for name, market_price, lowest_price in card_info:
+            if name is not None and name.lower() == db_card_name.lower():
                 try:
-                    market_price = card.find_element_by_class_name('search-result__market-price--value').text
-                    lowest_price = card.find_element_by_class_name('inventory__price-with-shipping').text
-                except:
+                    market_price = float(market_price.strip('$').replace(',', ''))
+                    lowest_price = float(lowest_price.strip('$').replace(',', ''))
+                except (AttributeError, ValueError):
                     pass
                 else:
-                    market_price_list.append(float(market_price.strip('$').replace(',', '')))
-                    lowest_price_list.append(float(lowest_price.strip('$').replace(',', '')))
+                    market_price_list.append(market_price)
+                    lowest_price_list.append(lowest_price)
+
+        try:
+            return self.__price_statistics(market_price_list, lowest_price_list)
+        finally:
+            search.send_keys(Keys.CONTROL + 'a')
+            search.send_keys(Keys.DELETE)
+
+    def __http_price_searcher(self, db_card_name):
+        """
+        Returns a dictionary of price statistics of the card that has the same name as db_card_name in
+        the results of the JSON search endpoint, in the same format as the price_searcher method
+
+        Private method that is invoked in the price_searcher method with the http backend
+        """
+        payload = {'algorithm': '', 'from': 0, 'size': 24,
+                   'filters': {'term': {'productLineName': ['yugioh']}, 'range': {}, 'match': {}},
+                   'listingSearch': {'filters': {'term': {}, 'range': {}, 'exclude': {}}},
+                   'context': {'cart': {}, 'shippingCountry': 'US'},
+                   'sort': {}}
+        try:
+            response = webfetch.get_fetcher().post_json(self.search_url, payload, params = {'q': db_card_name, 'isList': 'false'})
+            response.raise_for_status()
+            search_results = response.json()['results'][0]['results']
+        except (requests.exceptions.RequestException, ValueError, KeyError, IndexError):
+            print(f'{db_card_name} is not found in tcgplayer.com')
+            return None
+
+        market_price_list = []
+        lowest_price_list = []
+        for card in search_results:
+            if str(card.get('productName', '')).lower() == db_card_name.lower():
+                # Same as the selenium backend, cards without both prices are left out
+                if card.get('marketPrice') is not None and card.get('lowestPriceWithShipping') is not None:
+                    market_price_list.append(float(card['marketPrice']))
+                    lowest_price_list.append(float(card['lowestPriceWithShipping']))
+        return self.__price_statistics(market_price_list, lowest_price_list)
+
+    @staticmethod
+    def __price_statistics(market_price_list, lowest_price_list):
+        """
+        Returns a dictionary of price statistics from the market prices and the lowest prices of the
+        search results of a card, and returns an empty dictionary if there are no prices
+
+        Private method that is invoked by both backends of the price_searcher method
+        """
         all_price_list = market_price_list + lowest_price_list
 
         price_stats = {}
@@ -150,12 +373,31 @@ class CardPriceScraper:
                            'Average Lowest Price': avg_lowest_price,
                            'Cheapest Price': cheapest_price,
                            'Highest Price': highest_price}
-        finally:
-            search.send_keys(Keys.CONTROL + 'a')
-            search.send_keys(Keys.DELETE)
+        return price_stats
 
-            return price_stats
 
+    def search_prices(self, card_names):
+        """
+        Returns the price statistics of several cards in a dictionary format, keys are the card names
+        and values are the dictionaries returned by the price_searcher method
+
+        Parameters:
+        -----------
+        card_names: iterable of strings
+            Card names to be searched, they are not checked against the Yugioh Card Database
+        """
+        card_names = list(card_names)
+        # Plain HTTP requests are independent and every browser of the pool searches its own card,
+        # so several cards are searched at the same time
+        workers = self.max_workers if self.backend == 'http' else len(self.drivers)
+        if workers > 1 and len(card_names) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers = workers) as executor:
+                return dict(zip(card_names, executor.map(self.price_searcher, card_names)))
+
+        card_prices = {}
+        for name in card_names:
+            card_prices[name] = self.price_searcher(name)
+        return card_prices
 
     def set_card_prices(self, card_names):
         """
@@ -174,9 +416,7 @@ class CardPriceScraper:
         if len(tosearch_df) == 0:
             raise KeyError('This card you inputted is not in the database!')
         else:
-            card_prices = {}
-            for name in tosearch_df['Card Name'].unique():
-                card_prices[name] = self.price_searcher(name)
+            card_prices = self.search_prices(tosearch_df['Card Name'].unique())
 
             self.__card_prices_df = pd.DataFrame.from_dict(card_prices, orient = 'index')
             self.__combined_df = ( tosearch_df.merge(self.__card_prices_df,
@@ -203,37 +443,49 @@ class CardPriceScraper:
 
     def quit_browser(self):
         """
-        Method to quit the current browser
+        Method to quit the current browsers of the pool
 
         WARNING: User cannot invoke the price_searcher method and set_card_prices method if the
         browswer is closed. The restart_browser method will have to be invoked first to open
-        the browser again
+        the browser again. Nothing is done with the http backend
         """
+        if self.backend == 'http':
+            return
         try:
             self.driver.get('https://www.tcgplayer.com')
         except:
             raise Exception('Browser is already closed, unable to quit browser that is no longer open')
         else:
-            try:
-                # Waiting for a certain content page to appear to bypass the broken pipe error
-                content = WebDriverWait(self.driver, 3).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, 'homepage-content'))
-                )
-            except:
-                self.driver.quit()
-            else:
-                self.driver.quit()
+            for driver in self.drivers:
+                try:
+                    # Waiting for a certain content page to appear to bypass the broken pipe error
+                    driver.get('https://www.tcgplayer.com')
+                    content = WebDriverWait(driver, 3).until(
+                        EC.presence_of_element_located((By.CLASS_NAME, 'homepage-content'))
+                    )
+                except:
+                    driver.quit()
+                else:
+                    driver.quit()
 
     def restart_browser(self):
         """
-        Method to restart the browser if it is closed or refreshes the page to the url:
-        https://www.tcgplayer.com from any url that it is currently in
+        Method to restart the browsers of the pool if they are closed or refreshes their pages to the
+        url: https://www.tcgplayer.com from any url that they are currently in. Nothing is done with the
+        http backend
         """
-        try:
-            self.driver.get('https://www.tcgplayer.com/')
-        except:
-            self.driver = webdriver.Chrome() # Restarting chrome based on its initial PATH location
-            self.driver.get('https://www.tcgplayer.com/')
+        if self.backend == 'http':
+            return
+        for position, driver in enumerate(self.drivers):
+            try:
+                driver.get('https://www.tcgplayer.com/')
+            except:
+                self.drivers[position] = self.__open_driver() # Restarting chrome based on its initial PATH location
+
+        self.__idle_drivers = queue.Queue()
+        for driver in self.drivers:
+            self.__idle_drivers.put(driver)
+        self.driver = self.drivers[0]
 
 
 class BuyingTool(CardPriceScraper):
@@ -242,7 +494,9 @@ class BuyingTool(CardPriceScraper):
     of cards that the user is trying to buy based on the quantity of each card that is going to
     be purchased
     """
-    def __init__(self, cards_to_buy, PATH = 'External Applications/chromedriver.exe', filepath = 'Data/Yugioh Card Database.csv'):
+    def __init__(self, cards_to_buy, PATH = 'External Applications/chromedriver.exe', filepath = 'Data/Yugioh Card Database.csv',
+                 backend = 'selenium', search_url = TCGPLAYER_SEARCH_URL, max_workers = 5, browsers = 1, headless = False,
+                 price_cache = None, price_history = None):
         """
         Parameters:
         -----------
@@ -256,6 +510,9 @@ class BuyingTool(CardPriceScraper):
             value allows any python file in the same level as the yugioh package to access the database
             directly. A DbHandler Object is required to check the names of cards passed in cards_to_buy
 
+        backend, search_url, max_workers, browsers, headless, price_cache, price_history:
+            Refer to the CardPriceScraper class
+
         Variables:
         ----------
         Public:
@@ -269,71 +526,172 @@ class BuyingTool(CardPriceScraper):
                 Keys are name of cards and values are the quantities
 
         Private:
-            card_prices_df: DataFrame() (from Parent Class)
-                Dataframe that provides a list of price statistics for specified cards
+            cart: dict
+                The shopping cart, keys are the lowercase card names and values are dictionaries of
+                the Card Name, the Details (Card Type, Competitive Status and Reference), the Cents
+                (price statistics in cents, None if the price is unknown), the Searched time (when the
+                prices were searched, in seconds since the epoch) and the Quantity. It is None after
+                the set_buying_dfs method fails
+
+            total_cents: list
+                Running totals of each price statistic multiplied by the quantities in the cart, in
+                cents. They are updated by the difference on every change of quantity
+
+            total_quantity: int
+                Running total of the quantities in the cart
+
+            buying_dfs: dict
+                The dataframes of the cart, built by the first get method invoked after the cart
+                changes and None until then:
+                    card_prices, combined: the same dataframes as the card prices and combined
+                        dataframes of the Parent Class, for the cards in the cart
+                    normalprice: Normal price statistics (Price of 1 card) of the cards with their
+                        purchased quantities
+                    totalprice: Total price statistics (Price * Quantity) of the cards with their
+                        purchased quantities
+                    cumulative: summation of Total price statistics of each card, multiplied by their
+                        purchased quantities. Represents the total amount of money the user will spend
+                        if they decide to go through with their choice
+        """
+        super().__init__(PATH = PATH, filepath = filepath, backend = backend, search_url = search_url, max_workers = max_workers,
+                         browsers = browsers, headless = headless, price_cache = price_cache,
+                         price_history = price_history)
+        self.cards_dict = {}
+        self.__cart = {}
+        self.__total_cents = [0] * len(self.price_columns)
+        self.__total_quantity = 0
+        self.__buying_dfs = None
+        self.set_buying_dfs(cards_to_buy)
 
-            combined_df: DataFrame() (from Parent Class)
-                Dataframe that merges the card_prices_df and a subset of the yugioh card database
-                that includes the columns: Card Type, Competitive Status, and Reference
+    def __add_cards(self, card_names):
+        """
+        Searches the cards in its argument that are not in the cart yet and adds them to the cart with a
+        quantity of 0, cards that are not in the Yugioh Card Database are left out
 
-            normalprice_df: DataFrame()
-                Dataframe that contains the Normal price statistics (Price of 1 card) of the cards
-                with their purchased quantities
+        Private Method that is invoked in the set_buying_dfs and add_to_cart method
+        """
+        new_names = [name for name in dict.fromkeys(card_names) if name.lower() not in self.__cart]
+        if len(new_names) == 0:
+            return
 
-            totalprice_df: DataFrame()
-                Dataframe that contains the Total price statistics (Price * Quantity) of the cards
-                with their purchased quantities
+        tosearch_df = self.check_card_names(new_names, self.filepath)
+        if len(tosearch_df) == 0:
+            return
+        tosearch_df = tosearch_df.drop_duplicates(subset = 'Card Name')
+        card_prices = self.search_prices(tosearch_df['Card Name'])
 
-            cumulative_df: DataFrame()
-                Dataframe that contains the summation of Total price statistics of each card,
-                multiplied by their purchased quantities
+        searched = time.time()
+        for card in tosearch_df.itertuples(index = False):
+            self.__cart[card[0].lower()] = {'Card Name': card[0], 'Details': tuple(card[1:]),
+                                            'Cents': self.__to_cents(card_prices[card[0]]), 'Searched': searched, 'Quantity': 0}
 
-                Represents the total amount of money the user will spend if they decide to go
-                through with their choice
+    def __to_cents(self, price_stats):
         """
-        super().__init__(PATH = PATH, filepath = filepath)
-        self.cards_dict = {}
-        self.set_buying_dfs(cards_to_buy)
-        self.__normalprice_df = self.get_normalprice_df()
-        self.__totalprice_df = self.get_totalprice_df()
-        self.__cumulative_df = self.get_cumulative_df()
+        Returns the price statistics returned by the price_searcher method as a tuple of cents, in the
+        order of the price columns. Prices are kept in cents so that adding and removing cards never
+        accumulates rounding errors
 
-    def __internal_calculations(self):
+        Private Method that is invoked in the __add_cards and __refresh_prices method
         """
-        Calculates the different price statistics of each card the user is interested in and sets it to a
-        dataframe format
+        price_stats = price_stats or {}
+        return tuple(round(price_stats[column] * 100) if column in price_stats else None for column in self.price_columns)
 
-        Private Method that is invoked in the set_buying_dfs and add_to_cart method
+    def __refresh_prices(self):
+        """
+        Searches again the cards of the cart whose prices are older than the time-to-live of the price
+        cache, and updates the running totals of the cart by the difference. The previous prices are
+        kept if the search fails
+
+        Private Method that is invoked by the get methods
+        """
+        searched = time.time()
+        expired = [card for card in self.__cart.values() if searched - card['Searched'] >= self.price_cache.ttl]
+        if len(expired) == 0:
+            return
+
+        card_prices = self.search_prices(card['Card Name'] for card in expired)
+        for card in expired:
+            card['Searched'] = searched
+            if card_prices[card['Card Name']] is None:
+                continue
+            cents = self.__to_cents(card_prices[card['Card Name']])
+            for position, (old_cents, new_cents) in enumerate(zip(card['Cents'], cents)):
+                self.__total_cents[position] += ((new_cents or 0) - (old_cents or 0)) * card['Quantity']
+            card['Cents'] = cents
+        self.__buying_dfs = None
+
+    def __change_quantity(self, card_key, quantity):
+        """
+        Changes the quantity of a card in the cart and updates the running totals of the cart by the
+        difference only, a card is removed from the cart once its quantity reaches 0
+
+        Private Method that is invoked in the set_buying_dfs, add_to_cart and remove_from_cart method
         """
-        self.__normalprice_df = ( super().get_card_prices()
-                                         .reset_index()
-                                         .rename(columns = {'index': 'Card Name'}) )
-        if len(self.cards_dict) != 0:
-            self.__normalprice_df['Quantity'] = self.__normalprice_df['Card Name'].apply(lambda x: self.cards_dict[x.lower()])
-            self.__normalprice_df.set_index('Card Name', inplace = True)
-
-        # Block of code to set the total_price dataframe, containing the Total price statistics
-        # of the cards with their purchased quantities
-        self.__totalprice_df = self.__normalprice_df.copy()
-        for col in self.__totalprice_df.columns:
-            if col != 'Quantity':
-                new_col = 'Total' + '(' + col + ')'
-                self.__totalprice_df.rename(columns = {col: new_col}, inplace = True)
-                self.__totalprice_df[new_col] = self.__totalprice_df.apply(lambda x: x[new_col] * x['Quantity'], axis = 1)
-
-        # Block of code to set the cummulative dataframe that contains the summation of Total
-        # price statistics of each card, multiplied by their purchased quantities. These statistics
-        # reflect the total amount of money the user will spend if they decide to go through with
-        # their choice
-        if len(self.__totalprice_df) != 0:
-            self.__cumulative_df = ( self.__totalprice_df.sum()
-                                                         .to_frame()
-                                                         .rename(columns = {0: 'Cumulative Total'})
-                                                         .transpose()
-                                                         .rename(columns = {'Quantity': 'Total no. of cards'}) )
-            self.__cumulative_df['Total no. of cards'] = self.__cumulative_df['Total no. of cards'].astype('int32')
+        card = self.__cart[card_key]
+        quantity = max(card['Quantity'] + quantity, 0) - card['Quantity']
+        for position, cents in enumerate(card['Cents']):
+            if cents is not None:
+                self.__total_cents[position] += cents * quantity
+        self.__total_quantity += quantity
+        card['Quantity'] += quantity
+
+        if card['Quantity'] == 0:
+            del self.__cart[card_key]
+            self.cards_dict.pop(card_key, None)
         else:
-            self.__cumulative_df = pd.DataFrame()
+            self.cards_dict[card_key] = card['Quantity']
+        self.__buying_dfs = None # The dataframes are built again when a get method is invoked
+
+    def __build_buying_dfs(self):
+        """
+        Returns the card prices, combined, normalprice, totalprice and cumulative dataframes of the cart
+        in a dictionary format
+
+        Private Method that is invoked by the get methods when the cart has changed since the dataframes
+        were last built
+        """
+        names = [card['Card Name'] for card in self.__cart.values()]
+        prices = [[None if cents is None else cents / 100 for cents in card['Cents']] for card in self.__cart.values()]
+        quantities = [card['Quantity'] for card in self.__cart.values()]
+
+        card_prices_df = pd.DataFrame(prices, index = names, columns = self.price_columns, dtype = 'float64')
+        details_df = pd.DataFrame([card['Details'] for card in self.__cart.values()], index = names,
+                                  columns = ['Card Type', 'Competitive Status (TCG Advanced)', 'Reference'])
+        combined_df = details_df.join(card_prices_df).rename_axis('Card Name')
+
+        normalprice_df = card_prices_df.rename_axis('Card Name')
+        normalprice_df['Quantity'] = quantities
+
+        totalprice_df = ( normalprice_df[self.price_columns].multiply(normalprice_df['Quantity'], axis = 0)
+                                                            .rename(columns = lambda column: f'Total({column})') )
+        totalprice_df['Quantity'] = normalprice_df['Quantity']
+
+        # The cumulative dataframe comes from the running totals, so it does not sum every card again
+        if len(self.__cart) != 0:
+            cumulative_df = pd.DataFrame([[cents / 100 for cents in self.__total_cents] + [self.__total_quantity]],
+                                         index = ['Cumulative Total'],
+                                         columns = list(totalprice_df.columns[:-1]) + ['Total no. of cards'])
+            cumulative_df['Total no. of cards'] = cumulative_df['Total no. of cards'].astype('int32')
+        else:
+            cumulative_df = pd.DataFrame()
+
+        return {'card_prices': card_prices_df, 'combined': combined_df, 'normalprice': normalprice_df,
+                'totalprice': totalprice_df, 'cumulative': cumulative_df}
+
+    def __get_buying_df(self, name):
+        """
+        Returns one of the dataframes of the cart, the dataframes are only built when they are asked
+        for after the cart or its prices have changed. Returns nothing if the last set_buying_dfs method
+        failed
+
+        Private Method that is invoked by the get methods
+        """
+        if self.__cart is None:
+            return None
+        self.__refresh_prices()
+        if self.__buying_dfs is None:
+            self.__buying_dfs = self.__build_buying_dfs()
+        return self.__buying_dfs[name]
 
     def set_buying_dfs(self, cards_to_buy):
         """
@@ -346,37 +704,50 @@ class BuyingTool(CardPriceScraper):
         cards_to_buy: iterable of 2-element tuples
             First element is the card name and second element is the quantity to be bought
         """
-        self.cards_dict = {} # Resetting the dictionary of cards to be searched
+        # Resetting the cart of cards to be searched
+        self.cards_dict = {}
+        self.__cart = {}
+        self.__total_cents = [0] * len(self.price_columns)
+        self.__total_quantity = 0
+        self.__buying_dfs = None
+
+        cards_to_buy = list(cards_to_buy)
+        self.__add_cards(card[0] for card in cards_to_buy)
+        if len(self.__cart) == 0:
+            self.__cart = None # The get methods return nothing until cards are added to the cart again
+            raise KeyError('Check the spelling of your card!')
+
         for card in cards_to_buy:
-            self.cards_dict[card[0].lower()] = card[1]
-        card_names = self.cards_dict.keys()
+            if card[0].lower() in self.__cart:
+                self.__change_quantity(card[0].lower(), card[1])
 
-        # Block of code to set the normal_price dataframe, containing the Normal price statistics
-        # of the cards with their purchased quantities
-        try:
-            super().set_card_prices(card_names)
-        except KeyError:
-            self.__normalprice_df = None
-            self.__totalprice_df = None
-            self.__cumulative_df = None
-            self.cards_dict = {}
-            raise KeyError('Check the spelling of your card!')
-        else:
-            self.__internal_calculations()
+    def get_cart_prices(self):
+        """
+        Returns the dataframe that only shows the price statistics of each card in the cart, the
+        get_card_prices method still returns the cards of the last set_card_prices method
+        """
+        return self.__get_buying_df('card_prices')
+
+    def get_cart_combined_df(self):
+        """
+        Returns the combined dataframe of the cart prices dataframe and the subset of Yugioh Card
+        Database with columns: Card Type, Competitive Status, Reference of each card in the cart
+        """
+        return self.__get_buying_df('combined')
 
     def get_normalprice_df(self):
         """
         Returns the normalprice dataframe which contains the Normal price statistics
         of the cards with their purchased quantities
         """
-        return self.__normalprice_df
+        return self.__get_buying_df('normalprice')
 
     def get_totalprice_df(self):
         """
         Returns the totalprice dataframe which contains the Total price statistics
         of the cards with their purchased quantities
         """
-        return self.__totalprice_df
+        return self.__get_buying_df('totalprice')
 
     def get_cumulative_df(self):
         """
@@ -386,38 +757,25 @@ class BuyingTool(CardPriceScraper):
         These statistics reflect the total amount of money the user will spend if they decide
         to go through with their choice
         """
-        return self.__cumulative_df
+        return self.__get_buying_df('cumulative')
 
     def add_to_cart(self, cards_to_buy):
         """
-        Add cards to the existing card_dict that acts as the shopping cart
+        Add cards to the existing card_dict that acts as the shopping cart, only the cards that are not
+        in the cart yet are searched. Cards that are not in the Yugioh Card Database are left out
 
         Parameters:
         -----------
         cards_to_buy: iterable of 2-element tuples
             First element is the card name and second element is the quantity to be bought
         """
+        if self.__cart is None:
+            self.__cart = {}
+        cards_to_buy = list(cards_to_buy)
+        self.__add_cards(card[0] for card in cards_to_buy)
         for card in cards_to_buy:
-            if card[0].lower() in self.cards_dict.keys():
-                self.cards_dict[card[0].lower()] += card[1]
-            else:
-                self.cards_dict[card[0].lower()] = card[1]
-        card_names = self.cards_dict.keys()
-
-        try:
-            super().set_card_prices(card_names)
-        except KeyError:
-            pass
-        else:
-            self.__internal_calculations()
-
-            # Block of code to delete keys that are not found in the Yugioh Card Database from the card_dict
-            deleted_keys = []
-            for key in self.cards_dict.keys():
-                if key not in [name.lower() for name in self.__normalprice_df.index]:
-                    deleted_keys.append(key)
-            for key in deleted_keys:
-                del self.cards_dict[key]
+            if card[0].lower() in self.__cart:
+                self.__change_quantity(card[0].lower(), card[1])
 
     def remove_from_cart(self, cards_to_remove):
         """
@@ -429,21 +787,8 @@ class BuyingTool(CardPriceScraper):
         cards_to_remove: iterable of 2-element tuples
             First element is the card name and the second element is the quantity to be removed
         """
-        deleted_keys = []
+        if self.__cart is None:
+            return
         for card in cards_to_remove:
-            if card[0].lower() in self.cards_dict.keys():
-                self.cards_dict[card[0].lower()] -= card[1]
-                if self.cards_dict[card[0].lower()] <= 0:
-                    deleted_keys.append(card[0].lower())
-            else:
-                pass
-        for key in deleted_keys:
-            del self.cards_dict[key]
-        card_names = self.cards_dict.keys()
-
-        try:
-            super().set_card_prices(card_names)
-        except KeyError:
-            pass
-        else:
-            self.__internal_calculations()
+            if card[0].lower() in self.__cart:
+                self.__change_quantity(card[0].lower(), -card[1])
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 10:40:18 2026
+
+Author: Jordan Tanudjaja
+
+Shared pytest fixtures for the unit-testing modules
+"""
+
+import os
+import shutil
+import threading
+import functools
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+import pytest
+from yugioh import webfetch
+from yugioh import ygfandom as ygf
+
+# Directory of saved card pages so that the scraping can be tested without accessing the website
+PAGES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'pages')
+
+# Small database with the same format as the Yugioh Card Database
+TEST_DATABASE_FILEPATH = os.path.join(os.path.dirname(__file__), 'data', 'Test Card Database.csv')
+
+# (path, status code) of every request answered by the local HTTP stand-in
+REQUEST_LOG = []
+
+
+def page_filename(page_name):
+    """
+    Returns the filename of a saved page from its name in the url. ':' cannot be used in a filename
+    on Windows, so pages such as Template:Packs are saved as Template_Packs.html
+    """
+    return page_name.replace(':', '_') + '.html'
+
+
+class QuietRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Request handler that serves the saved pages without printing every request, the .html extension
+    is optional in the URL so that the URLs look like the ones in https://yugioh.fandom.com/wiki/
+    """
+    def translate_path(self, path):
+        filepath = super().translate_path(path)
+        if not os.path.exists(filepath):
+            directory, page_name = os.path.split(filepath)
+            page_filepath = os.path.join(directory, page_filename(page_name))
+            if os.path.exists(page_filepath):
+                filepath = page_filepath
+        return filepath
+
+    def log_request(self, code = '-', size = '-'):
+        REQUEST_LOG.append((self.path, int(code)))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FandomFetcher(webfetch.WebFetcher):
+    """
+    WebFetcher that downloads the https://yugioh.fandom.com/wiki/ urls from the local HTTP stand-in, so
+    code that builds fandom urls can be tested on the saved pages
+    """
+    def __init__(self, base_url, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def get(self, url):
+        return super().get(url.replace('https://yugioh.fandom.com/wiki/', self.base_url + '/'))
+
+
+@pytest.fixture(scope = 'module')
+def page_server():
+    """
+    Local HTTP stand-in that serves the saved pages in the pages directory, yields the base URL
+    """
+    handler = functools.partial(QuietRequestHandler, directory = PAGES_DIRECTORY)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def saved_page():
+    """
+    Returns a function that returns the HTML of a saved page of the pages directory by its name
+    """
+    def read_saved_page(page_name):
+        with open(os.path.join(PAGES_DIRECTORY, page_filename(page_name)), encoding = 'utf-8') as page:
+            return page.read()
+    return read_saved_page
+
+@pytest.fixture
+def small_database(tmp_path):
+    """
+    Copy of the small database in a temporary directory so that a test can save to it freely, yields
+    its filepath. The shared DbHandler objects are forgotten afterwards
+    """
+    database_filepath = str(tmp_path / 'Test Card Database.csv')
+    shutil.copy(TEST_DATABASE_FILEPATH, database_filepath)
+    yield database_filepath
+    ygf.invalidate_database()
+
+@pytest.fixture
+def request_log():
+    """
+    Empties and returns the list of (path, status code) of the requests answered by the page server
+    """
+    REQUEST_LOG.clear()
+    return REQUEST_LOG
+
+@pytest.fixture
+def fandom_fetcher(page_server):
+    """
+    FandomFetcher object that downloads the fandom urls from the page server
+    """
+    fetcher = FandomFetcher(page_server, pool_size = 3, max_retries = 0, timeout = 5)
+    yield fetcher
+    fetcher.close()
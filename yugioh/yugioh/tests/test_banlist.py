@@ -12,6 +12,7 @@ create this in development mode in a virtual environment
 from yugioh import banlist, ygfandom as ygf
 import requests
 from bs4 import BeautifulSoup
+import pandas as pd
 import pytest
 
 
@@ -70,4 +71,28 @@ def test_banlist_update(duelist, monkeypatch):
     # Ensuring that the data scraped from the website has some card names in the database, which shows
     # that the banlist_update algorithm is working      
     assert banlist_card_names & db_card_names != set()
-    assert unique_card_status & db_competitive_status != set()
\ No newline at end of file
+    assert unique_card_status & db_competitive_status != set()
+
+
+def test_get_banlist(page_server):
+    """
+    Test Function to handle the get_banlist function on a saved banlist page
+    """
+    banlist_df = banlist.get_banlist(page_server + '/Banlist')
+    assert banlist_df.values.tolist() == [['Cyber Dragon', 'Limited'], ['Polymerisation', 'Forbidden'], ['Imperial Order', 'Unlimited']]
+
+
+def test_banlist_update_saved_page(page_server, small_database):
+    """
+    Test Function to handle the banlist_update function on a saved banlist page and a small database
+    """
+    diff_df = banlist.banlist_update(page_server + '/Banlist', filepath = small_database)
+    assert diff_df.values.tolist() == [['Cyber Dragon', 'Unlimited', 'Limited'],
+                                       ['Imperial Order', 'Limited', 'Unlimited'],
+                                       ['Polymerization', 'Unlimited', 'Forbidden']] # Misspelled on the banlist
+
+    # The changes are saved, and running the update again finds nothing to change
+    saved_df = pd.read_csv(small_database, keep_default_na = False).set_index('Card Name')
+    assert saved_df.loc[list(diff_df['Card Name']), 'Competitive Status (TCG Advanced)'].tolist() == ['Limited', 'Unlimited', 'Forbidden']
+    assert saved_df.loc['Dark Simorgh', 'Competitive Status (TCG Advanced)'] == 'Forbidden'
+    assert len(banlist.banlist_update(page_server + '/Banlist', filepath = small_database)) == 0
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:12:44 2026
+
+Author: Jordan Tanudjaja
+
+Unit-testing Module for crawler.py
+To be called with python -m pytest in the command line because pytest does not work since I did not
+create this in development mode in a virtual environment
+"""
+
+from yugioh import crawler, ygfandom as ygf
+from yugioh.journal import CrawlJournal
+import pandas as pd
+import pytest
+import os
+import json
+
+
+def test_get_booster_urls(fandom_fetcher):
+    assert crawler.get_booster_urls(fetcher = fandom_fetcher) == ['https://yugioh.fandom.com/wiki/Test_Booster',
+                                                                  'https://yugioh.fandom.com/wiki/Second_Booster',
+                                                                  'https://yugioh.fandom.com/wiki/Future_Booster']
+    assert crawler.get_booster_urls(cutoff = 'Second Booster', fetcher = fandom_fetcher) == ['https://yugioh.fandom.com/wiki/Test_Booster',
+                                                                                             'https://yugioh.fandom.com/wiki/Second_Booster']
+
+
+def test_get_other_sets_url(fandom_fetcher):
+    # The first link of the template and the links of other tables are not card sets
+    assert crawler.get_other_sets_url('https://yugioh.fandom.com/wiki/Template:Packs', crawler.SET_TEMPLATES['https://yugioh.fandom.com/wiki/Template:Packs'],
+                                      fetcher = fandom_fetcher) == ['https://yugioh.fandom.com/wiki/Test_Booster']
+
+
+def test_checkpoint(tmp_path):
+    checkpoint_filepath = str(tmp_path / 'Crawl Checkpoint.json')
+    checkpoint = crawler.load_checkpoint(checkpoint_filepath)
+    assert checkpoint == {'sets': {}, 'skipped_urls': [], 'last_sync': None}
+
+    checkpoint['sets']['https://yugioh.fandom.com/wiki/Test_Booster'] = ['https://yugioh.fandom.com/wiki/Cyber_Dragon']
+    crawler.save_checkpoint(checkpoint, checkpoint_filepath)
+    assert crawler.load_checkpoint(checkpoint_filepath) == checkpoint
+    assert os.listdir(tmp_path) == ['Crawl Checkpoint.json']
+
+
+class TestSyncDatabase:
+    @pytest.fixture
+    def duelist(self, small_database):
+        # Database without Polymerization and with an outdated Cyber Dragon
+        df = pd.read_csv(small_database, keep_default_na = False)
+        df = df[df['Card Name'] != 'Polymerization']
+        df.loc[df['Card Name'] == 'Cyber Dragon', 'Competitive Status (TCG Advanced)'] = 'Not yet released'
+        df.to_csv(small_database, index = False)
+        return ygf.DbHandler(database_filepath = small_database)
+
+    def test_sync_database(self, duelist, fandom_fetcher, tmp_path, request_log):
+        checkpoint_filepath = str(tmp_path / 'Crawl Checkpoint.json')
+        set_urls = ['https://yugioh.fandom.com/wiki/Test_Booster', 'https://yugioh.fandom.com/wiki/Empty_Set']
+        summary = crawler.sync_database(duelist, checkpoint_filepath, set_urls = set_urls, fetcher = fandom_fetcher)
+        assert summary == {'New card sets': 2, 'Added cards': 1, 'Updated cards': 1}
+
+        df = duelist.get_card_database()
+        assert df['Card Name'].iloc[-1] == 'Polymerization'
+        assert df.loc[duelist.locate_card('https://yugioh.fandom.com/wiki/Cyber_Dragon'), 'Competitive Status (TCG Advanced)'] != 'Not yet released'
+        assert len(pd.read_csv(duelist.database_filepath, keep_default_na = False)) == len(df)
+
+        # The card set that could not be read is tried again in the next sync, the one that was read is not
+        with open(checkpoint_filepath, encoding = 'utf-8') as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        assert list(checkpoint['sets']) == ['https://yugioh.fandom.com/wiki/Test_Booster']
+        assert checkpoint['last_sync'] is not None
+
+        request_log.clear()
+        summary = crawler.sync_database(duelist, checkpoint_filepath, set_urls = set_urls, update_changed = False, fetcher = fandom_fetcher)
+        assert summary == {'New card sets': 1, 'Added cards': 0, 'Updated cards': 0}
+        assert [path for path, _ in request_log] == ['/Empty_Set']
+
+
+    def test_failed_and_skipped_urls(self, duelist, fandom_fetcher, tmp_path, request_log):
+        # Card set with a page that is not a card page, a missing page and a url that cannot be reached
+        checkpoint_filepath = str(tmp_path / 'Crawl Checkpoint.json')
+        card_urls = ['https://yugioh.fandom.com/wiki/Booster_Pack', 'https://yugioh.fandom.com/wiki/Not_a_card', 'http://127.0.0.1:9/Polymerization']
+        crawler.save_checkpoint({'sets': {'https://yugioh.fandom.com/wiki/Test_Booster': card_urls}, 'skipped_urls': [], 'last_sync': None},
+                                checkpoint_filepath)
+
+        for _ in range(2):
+            request_log.clear()
+            summary = crawler.sync_database(duelist, checkpoint_filepath, set_urls = [], update_changed = False, fetcher = fandom_fetcher)
+            assert summary == {'New card sets': 0, 'Added cards': 0, 'Updated cards': 0}
+            # Only the page that is not a card page is skipped, the urls that failed are tried again
+            assert crawler.load_checkpoint(checkpoint_filepath)['skipped_urls'] == ['https://yugioh.fandom.com/wiki/Booster_Pack']
+        assert [path for path, _ in request_log] == ['/Not_a_card']
+
+
+class TestCrawlDatabase:
+    def test_crawl_database(self, fandom_fetcher, tmp_path, request_log, saved_page):
+        database_filepath = str(tmp_path / 'Yugioh Card Database.csv')
+        journal_filepath = str(tmp_path / 'Crawl Journal.sqlite')
+
+        # Journal of a crawl that was interrupted after scraping Cyber Dragon
+        journal = CrawlJournal(journal_filepath)
+        journal.add_urls(['https://yugioh.fandom.com/wiki/Test_Booster'], 'set')
+        journal.record_set('https://yugioh.fandom.com/wiki/Test_Booster', ['https://yugioh.fandom.com/wiki/Cyber_Dragon',
+                                                                           'https://yugioh.fandom.com/wiki/Polymerization',
+                                                                           'https://yugioh.fandom.com/wiki/Not_a_card'])
+        cyber_dragon = ygf.YgScraper().parse_card_details(saved_page('Cyber_Dragon'), 'https://yugioh.fandom.com/wiki/Cyber_Dragon')
+        journal.record_card('https://yugioh.fandom.com/wiki/Cyber_Dragon', 'abc', cyber_dragon)
+        journal.close()
+
+        # Only the urls that were not done are crawled when the crawl is resumed
+        df = crawler.crawl_database(database_filepath, journal_filepath, parse_workers = 1, fetcher = fandom_fetcher)
+        assert sorted(path for path, _ in request_log) == ['/Not_a_card', '/Polymerization']
+        assert list(df['Card Name']) == ['Cyber Dragon', 'Polymerization']
+        assert list(ygf.DbHandler(database_filepath = database_filepath).get_card_database()['Card Name']) == ['Cyber Dragon', 'Polymerization']
+
+        # The url that failed is the only one crawled again, and the rebuilt database is the same
+        request_log.clear()
+        assert crawler.crawl_database(database_filepath, journal_filepath, parse_workers = 1, fetcher = fandom_fetcher).equals(df)
+        assert [path for path, _ in request_log] == ['/Not_a_card']
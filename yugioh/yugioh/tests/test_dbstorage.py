@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:02:11 2026
+
+Author: Jordan Tanudjaja
+
+Unit-testing Module for dbstorage.py
+To be called with python -m pytest in the command line because pytest does not work since I did not
+create this in development mode in a virtual environment
+"""
+
+from yugioh import dbstorage, ygfandom as ygf
+import sqlite3
+import pandas as pd
+import pytest
+
+
+def test_parse_set():
+    assert dbstorage.parse_set("{'Cyber', 'Cyber Dragon'}") == {'Cyber', 'Cyber Dragon'}
+    assert dbstorage.parse_set('set()') == set()
+    assert dbstorage.parse_set({'EARTH'}) == {'EARTH'}
+    assert dbstorage.parse_set(['EARTH']) == {'EARTH'}
+
+def test_format_set():
+    assert dbstorage.format_set(['Cyber', 'Cyber Dragon']) == "{'Cyber', 'Cyber Dragon'}"
+    assert dbstorage.format_set([]) == 'set()'
+    assert dbstorage.parse_set(dbstorage.format_set(["Ra's Disciple", 'Ra'])) == {"Ra's Disciple", 'Ra'}
+
+
+def test_get_storage():
+    assert isinstance(dbstorage.get_storage('Data/Yugioh Card Database.csv'), dbstorage.CsvStorage)
+    assert isinstance(dbstorage.get_storage('Data/Yugioh Card Database.parquet'), dbstorage.ParquetStorage)
+    assert isinstance(dbstorage.get_storage('Data/Yugioh Card Database.feather'), dbstorage.FeatherStorage)
+    with pytest.raises(ValueError):
+        dbstorage.get_storage('Data/Yugioh Card Database.xlsx')
+
+
+@pytest.mark.parametrize("extension", ['.parquet', '.feather'])
+def test_columnar_round_trip(tmp_path, small_database, extension):
+    pytest.importorskip('pyarrow')
+    csv_df = pd.read_csv(small_database, keep_default_na = False)
+    columnar_filepath = str(tmp_path / ('Yugioh Card Database' + extension))
+    dbstorage.convert_card_database(small_database, columnar_filepath)
+
+    duelist = ygf.DbHandler(database_filepath = columnar_filepath)
+    df = duelist.get_card_database()
+    assert tuple(df.columns) == ygf.DbHandler.yugioh_columns
+    assert list(df['Card Name']) == list(csv_df['Card Name'])
+    assert df['ATK'].iloc[0] == '2100'
+    assert df['Direct Archetype & Series Support'].iloc[0] == "{'Cyber', 'Cyber Dragon'}"
+    assert df['Card/Attribute/Type Support'].iloc[0] == 'set()'
+
+    # Exporting back to CSV gives the same database as the original CSV file
+    csv_filepath = str(tmp_path / 'Yugioh Card Database.csv')
+    dbstorage.convert_card_database(columnar_filepath, csv_filepath)
+    exported_df = pd.read_csv(csv_filepath, keep_default_na = False)
+    for column in dbstorage.set_columns:
+        assert list(exported_df[column].apply(dbstorage.parse_set)) == list(csv_df[column].apply(dbstorage.parse_set))
+    other_columns = [column for column in csv_df.columns if column not in dbstorage.set_columns]
+    assert exported_df[other_columns].astype(str).equals(csv_df[other_columns].astype(str))
+
+
+def test_numeric_columns():
+    df = pd.DataFrame({'ATK': ['2100', '?', 'N/A', ''], 'Level/Rank': ['5', 'N/A', '4', '3'], 'LINK': ['N/A', 'N/A', '2', 'x']})
+    columnar_df = dbstorage.to_columnar(df)
+    assert str(columnar_df['ATK'].dtype) == 'Int64'
+    assert list(columnar_df['ATK'].iloc[:3]) == [2100, dbstorage.numeric_sentinels['?'], dbstorage.numeric_sentinels['N/A']]
+    assert columnar_df['ATK'].isna().iloc[3]
+    # Columns with values that are not numbers are kept as text
+    assert str(columnar_df['LINK'].dtype) == 'category'
+
+    assert dbstorage.from_columnar(columnar_df).equals(df)
+
+
+class TestSqliteStorage:
+    @pytest.fixture
+    def sqlite_filepath(self, tmp_path, small_database):
+        sqlite_filepath = str(tmp_path / 'Yugioh Card Database.sqlite')
+        dbstorage.convert_card_database(small_database, sqlite_filepath)
+        return sqlite_filepath
+
+    def test_round_trip(self, sqlite_filepath, small_database):
+        csv_df = dbstorage.CsvStorage().load(small_database)
+        assert dbstorage.get_storage(sqlite_filepath).load(sqlite_filepath).equals(csv_df)
+
+    def test_wal_mode_and_indexes(self, sqlite_filepath):
+        connection = sqlite3.connect(sqlite_filepath)
+        assert connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {'reference_index', 'card_name_index'} <= indexes
+        connection.close()
+
+    def test_incremental_writes(self, sqlite_filepath):
+        duelist = ygf.DbHandler(database_filepath = sqlite_filepath)
+        new_card = dict(duelist.get_card_database().iloc[0])
+        new_card['Reference'] = 'https://yugioh.fandom.com/wiki/Cyber_Dragon_(new)'
+
+        # Only the new row is written, the rows that are already in the database are left untouched
+        connection = sqlite3.connect(sqlite_filepath)
+        connection.execute("UPDATE cards SET \"Card Description\" = 'untouched' WHERE position = 0")
+        connection.commit()
+        duelist.add_cards([new_card])
+        descriptions = [row[0] for row in connection.execute('SELECT "Card Description" FROM cards ORDER BY position')]
+        connection.close()
+        assert len(descriptions) == 9
+        assert descriptions[0] == 'untouched'
+        assert descriptions[-1] == new_card['Card Description']
+
+        reloaded_duelist = ygf.DbHandler(database_filepath = sqlite_filepath)
+        assert reloaded_duelist.locate_card(new_card['Reference']) == 8
+
+    def test_upsert(self, sqlite_filepath):
+        storage = dbstorage.get_storage(sqlite_filepath)
+        df = storage.load(sqlite_filepath)
+        df.loc[2, 'Competitive Status (TCG Advanced)'] = 'Limited'
+        storage.upsert(df, df.loc[[2]], sqlite_filepath)
+        assert storage.load(sqlite_filepath).equals(df)
+
+    def test_changed_reference(self, sqlite_filepath):
+        duelist = ygf.DbHandler(database_filepath = sqlite_filepath)
+        references = list(duelist.get_card_database()['Reference'])
+        new_reference = 'https://yugioh.fandom.com/wiki/Renamed_card'
+        duelist.update_cards(pd.DataFrame({'Reference': [new_reference]}, index = [2]))
+
+        # The row of the previous Reference is replaced instead of adding a second row
+        df = dbstorage.get_storage(sqlite_filepath).load(sqlite_filepath)
+        assert list(df['Reference']) == references[:2] + [new_reference] + references[3:]
+        assert df.equals(duelist.get_card_database())
+
+        # Cards that swap their References keep their positions
+        duelist.update_cards(pd.DataFrame({'Reference': [references[1], references[0]]}, index = [0, 1]))
+        df = dbstorage.get_storage(sqlite_filepath).load(sqlite_filepath)
+        assert list(df['Reference'][:2]) == [references[1], references[0]]
+        assert df.equals(duelist.get_card_database())
+
+    def test_concurrent_handlers(self, sqlite_filepath):
+        # Two handlers that loaded the database before either of them added a card
+        first_duelist = ygf.DbHandler(database_filepath = sqlite_filepath)
+        second_duelist = ygf.DbHandler(database_filepath = sqlite_filepath)
+        first_card = dict(first_duelist.get_card_database().iloc[0])
+        first_card['Reference'] = 'https://yugioh.fandom.com/wiki/First_card'
+        second_card = dict(second_duelist.get_card_database().iloc[1])
+        second_card['Reference'] = 'https://yugioh.fandom.com/wiki/Second_card'
+
+        first_duelist.add_cards([first_card])
+        second_duelist.add_cards([second_card])
+        references = list(dbstorage.get_storage(sqlite_filepath).load(sqlite_filepath)['Reference'])
+        assert len(references) == 10
+        assert references[-2:] == [first_card['Reference'], second_card['Reference']]
+
+    def test_unique_reference_migration(self, sqlite_filepath):
+        # Databases created before the Reference index was unique get a unique index on their next write
+        connection = sqlite3.connect(sqlite_filepath)
+        connection.execute('DROP INDEX reference_index')
+        connection.execute('CREATE INDEX reference_index ON cards ("Reference")')
+        connection.commit()
+
+        storage = dbstorage.get_storage(sqlite_filepath)
+        df = storage.load(sqlite_filepath)
+        storage.upsert(df, df.loc[[2]], sqlite_filepath)
+        assert dict((row[1], row[2]) for row in connection.execute('PRAGMA index_list(cards)'))['reference_index'] == 1
+        connection.close()
+        assert storage.load(sqlite_filepath).equals(df)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:22:08 2026
+
+Author: Jordan Tanudjaja
+
+Unit-testing Module for fuzzy.py
+To be called with python -m pytest in the command line because pytest does not work since I did not
+create this in development mode in a virtual environment
+"""
+
+from yugioh import fuzzy
+import pytest
+
+CARD_NAMES = ['Polymerization', 'Cyber Dragon', 'Cyber Dragon Nova', 'Dark Magician', 'Dark Magician Girl',
+              'Dark Simorgh', 'Imperial Order', 'Elemental HERO Neos', 'Elemental HERO Neos', 'Ojama Yellow']
+
+
+@pytest.mark.parametrize("name, normalized_name", [
+    ('Polymerization', 'polymerization'),
+    ('  Elemental HERO   Neos ', 'elemental hero neos'),
+    ('"A" Cell Breeding Device', 'a cell breeding device'),
+    ('Ojamá Yellow', 'ojama yellow')
+    ])
+def test_normalize_name(name, normalized_name):
+    assert fuzzy.normalize_name(name) == normalized_name
+
+
+@pytest.mark.parametrize("a, b, max_distance, distance", [
+    ('polymerization', 'polymerisation', 2, 1),
+    ('kitten', 'sitting', 3, 3),
+    ('kitten', 'sitting', 2, 3), # Further than max_distance gives max_distance + 1
+    ('cyber dragon', 'cyber dragon nova', 2, 3),
+    ('', 'abc', 5, 3),
+    ('same', 'same', 0, 0)
+    ])
+def test_bounded_levenshtein(a, b, max_distance, distance):
+    assert fuzzy.bounded_levenshtein(a, b, max_distance) == distance
+
+
+class TestFuzzyIndex:
+    @pytest.fixture
+    def index(self):
+        return fuzzy.FuzzyIndex(CARD_NAMES)
+
+    def test_search(self, index):
+        assert len(index) == 9 # Repeated names are kept once
+        assert index.search('Polymerisation') == [('Polymerization', 1)]
+        assert index.search('dark magician') == [('Dark Magician', 0)]
+        assert index.search('Dark Magican', max_distance = 2) == [('Dark Magician', 1)]
+        assert index.search('Cyber Dragon Nov') == [('Cyber Dragon Nova', 1)]
+        assert index.search('Blue-Eyes White Dragon') == []
+
+    def test_ranking(self, index):
+        # Ranked by distance, then by the difference in length
+        assert index.search('Cyber Dragon N', max_distance = 3) == [('Cyber Dragon', 2), ('Cyber Dragon Nova', 3)]
+        assert index.search('Cyber Dragon N', max_distance = 3, limit = 1) == [('Cyber Dragon', 2)]
+
+    def test_short_names(self):
+        # Names too short for the bigram filter are compared with every card name
+        index = fuzzy.FuzzyIndex(['Ax', 'Bx', 'Polymerization'])
+        assert index.search('Cx', max_distance = 1) == [('Ax', 1), ('Bx', 1)]
+
+    def test_best_match(self, index):
+        assert index.best_match('ELEMENTAL hero neos') == 'Elemental HERO Neos'
+        assert index.best_match('Polymerisation') == 'Polymerization'
+        assert index.best_match('Blue-Eyes White Dragon') == None
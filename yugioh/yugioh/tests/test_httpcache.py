@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 12:48:50 2026
+
+Author: Jordan Tanudjaja
+
+Unit-testing Module for httpcache.py
+To be called with python -m pytest in the command line because pytest does not work since I did not
+create this in development mode in a virtual environment
+"""
+
+from yugioh import httpcache, webfetch
+import pytest
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = httpcache.ResponseCache(cache_filepath = str(tmp_path / 'HTTP Cache.sqlite'))
+    yield cache
+    cache.close()
+
+@pytest.fixture
+def fetcher(cache):
+    fetcher = webfetch.WebFetcher(pool_size = 2, max_retries = 0, timeout = 5, cache = cache)
+    yield fetcher
+    fetcher.close()
+
+class TestResponseCache:
+    """
+    Test Class to handle the ResponseCache class in the httpcache module through a WebFetcher
+    """
+    def test_cache_hit(self, fetcher, page_server, request_log):
+        url = page_server + '/Cyber_Dragon'
+        first_response = fetcher.get(url)
+        second_response = fetcher.get(url)
+        assert not getattr(first_response, 'from_cache', False)
+        assert second_response.from_cache
+        assert second_response.text == first_response.text
+        assert request_log == [('/Cyber_Dragon', 200)] # The website is only accessed once
+
+
+    def test_revalidation(self, fetcher, cache, page_server, request_log):
+        cache.ttl = 0 # Every cached page is stale straight away
+        url = page_server + '/Polymerization'
+        first_response = fetcher.get(url)
+        second_response = fetcher.get(url)
+        assert second_response.from_cache
+        assert second_response.text == first_response.text
+        assert request_log == [('/Polymerization', 200), ('/Polymerization', 304)]
+
+
+    def test_errors_not_cached(self, fetcher, cache, page_server):
+        assert fetcher.get_html(page_server + '/Not_a_card') == None
+        assert cache.get(page_server + '/Not_a_card') == None
+
+
+    def test_lru_eviction(self, fetcher, cache, page_server):
+        cyber_dragon_url = page_server + '/Cyber_Dragon'
+        polymerization_url = page_server + '/Polymerization'
+        fetcher.get(cyber_dragon_url)
+        cache.max_size = cache.get_size() + 10 # Room for 1 page only
+        fetcher.get(polymerization_url)
+        assert cache.get(cyber_dragon_url) == None
+        assert cache.get(polymerization_url) != None
+        assert cache.get_size() <= cache.max_size
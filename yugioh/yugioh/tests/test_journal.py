@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:02:26 2026
+
+Author: Jordan Tanudjaja
+
+Unit-testing Module for journal.py
+To be called with python -m pytest in the command line because pytest does not work since I did not
+create this in development mode in a virtual environment
+"""
+
+from yugioh.journal import CrawlJournal
+from yugioh import ygfandom as ygf
+import pytest
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = CrawlJournal(str(tmp_path / 'Crawl Journal.sqlite'))
+    yield journal
+    journal.close()
+
+def test_sets_and_cards(journal):
+    journal.add_urls(['https://yugioh.fandom.com/wiki/Test_Booster', 'https://yugioh.fandom.com/wiki/Empty_Set'], 'set')
+    journal.record_set('https://yugioh.fandom.com/wiki/Test_Booster', ['https://yugioh.fandom.com/wiki/Cyber_Dragon',
+                                                                       'https://yugioh.fandom.com/wiki/Polymerization'])
+    journal.record_set('https://yugioh.fandom.com/wiki/Empty_Set', None)
+    assert journal.get_urls('set') == ['https://yugioh.fandom.com/wiki/Empty_Set']
+    assert journal.get_urls('card') == ['https://yugioh.fandom.com/wiki/Cyber_Dragon', 'https://yugioh.fandom.com/wiki/Polymerization']
+
+    card_dict = {'Card Name': 'Cyber Dragon', 'ATK': 2100, 'Direct Archetype & Series Support': {'Cyber', 'Cyber Dragon'}}
+    journal.record_card('https://yugioh.fandom.com/wiki/Cyber_Dragon', 'abc', card_dict)
+    journal.record_card('https://yugioh.fandom.com/wiki/Polymerization', None, None)
+    assert journal.get_cards() == [card_dict]
+    assert journal.get_urls('card') == ['https://yugioh.fandom.com/wiki/Polymerization'] # Failed urls are crawled again
+
+    journal.record_card('https://yugioh.fandom.com/wiki/Polymerization', 'def', None)
+    assert journal.get_urls('card') == []
+    assert journal.get_counts() == {('set', 'done'): 1, ('set', 'failed'): 1, ('card', 'done'): 1, ('card', 'skipped'): 1}
+
+def test_add_urls_keeps_status(journal):
+    journal.add_urls(['https://yugioh.fandom.com/wiki/Test_Booster'], 'set')
+    journal.record_set('https://yugioh.fandom.com/wiki/Test_Booster', [])
+    journal.add_urls(['https://yugioh.fandom.com/wiki/Test_Booster'], 'set')
+    assert journal.get_urls('set') == []
+    assert journal.get_urls('set', statuses = ['done']) == ['https://yugioh.fandom.com/wiki/Test_Booster']
+
+def test_broken_card_table(journal, saved_page):
+    # A card page whose Statuses row is renamed gives a card with an exception as its Card Type
+    html = saved_page('Cyber_Dragon').replace('>Statuses<', '>Legality<')
+    card_dict = ygf.YgScraper().parse_card_details(html, 'https://yugioh.fandom.com/wiki/Cyber_Dragon')
+    assert isinstance(card_dict['Card Type'], Exception)
+
+    journal.record_card('https://yugioh.fandom.com/wiki/Cyber_Dragon', 'abc', card_dict)
+    assert journal.get_counts() == {('card', 'done'): 1}
+    assert journal.get_cards()[0]['Card Type'] == str(card_dict['Card Type'])
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 14:02:39 2026
+
+Author: Jordan Tanudjaja
+
+Unit-testing Module for parsers.py
+To be called with python -m pytest in the command line because pytest does not work since I did not
+create this in development mode in a virtual environment
+"""
+
+from yugioh import parsers, ygfandom as ygf
+import pytest
+
+@pytest.fixture(scope = 'module')
+def soup_backend():
+    return parsers.get_backend('html.parser')
+
+@pytest.fixture(scope = 'module')
+def lxml_backend():
+    pytest.importorskip('lxml')
+    return parsers.get_backend('lxml')
+
+class TestParsingBackends:
+    """
+    Test Class to make sure the lxml backend and the html.parser backend read the saved pages the same way
+    """
+    @pytest.mark.parametrize("page_name", ['Cyber_Dragon', 'Polymerization'])
+    def test_card_pages(self, soup_backend, lxml_backend, page_name, saved_page):
+        soup_doc = soup_backend.parse(saved_page(page_name))
+        lxml_doc = lxml_backend.parse(saved_page(page_name))
+        assert soup_backend.card_description_text(soup_doc) == lxml_backend.card_description_text(lxml_doc)
+        assert soup_backend.support_lists(soup_doc) == lxml_backend.support_lists(lxml_doc)
+
+        url = 'https://yugioh.fandom.com/wiki/' + page_name
+        soup_card = ygf.YgScraper(parser = 'html.parser').parse_card_details(saved_page(page_name), url)
+        lxml_card = ygf.YgScraper(parser = 'lxml').parse_card_details(saved_page(page_name), url)
+        assert soup_card == lxml_card
+
+
+    def test_set_tables(self, soup_backend, lxml_backend, saved_page):
+        soup_tables = soup_backend.set_tables(soup_backend.parse(saved_page('Test_Booster')), 'class', 'wikitable')
+        lxml_tables = lxml_backend.set_tables(lxml_backend.parse(saved_page('Test_Booster')), 'class', 'wikitable')
+        assert soup_tables == lxml_tables
+        assert soup_tables[0][1][0][1] == '/wiki/Cyber_Dragon'
+        assert soup_tables[0][1][2][1] == 'Unreleased Card' # Link without an href
+
+
+    def test_navbox_links(self, soup_backend, lxml_backend, saved_page):
+        for page_name, class_name, first in [('Booster_Pack', 'navbox-subgroup', False), ('Template:Packs', 'navbox', True)]:
+            soup_links = soup_backend.navbox_links(soup_backend.parse(saved_page(page_name)), class_name, first = first)
+            lxml_links = lxml_backend.navbox_links(lxml_backend.parse(saved_page(page_name)), class_name, first = first)
+            assert soup_links == lxml_links
+        assert soup_links[1] == ('/wiki/Test_Booster', 'Test Booster')
+        assert soup_links[3] == (None, None) # Link without an href
+
+    def test_banlist_rows(self, soup_backend, lxml_backend, saved_page):
+        soup_rows = soup_backend.banlist_rows(soup_backend.parse(saved_page('Banlist')))
+        lxml_rows = lxml_backend.banlist_rows(lxml_backend.parse(saved_page('Banlist')))
+        assert soup_rows == lxml_rows
+        assert (['Cyber Dragon', 'Monster'], ['Unlimited', 'Limited']) in soup_rows
+
+
+    @pytest.mark.parametrize("html", ['', '   ', '<!-- truncated -->'])
+    def test_blank_pages(self, soup_backend, lxml_backend, html):
+        for backend in (soup_backend, lxml_backend):
+            assert backend.card_table_html(backend.parse(html)) is None
+            assert ygf.YgScraper(parser = backend.name).parse_card_details(html, 'https://yugioh.fandom.com/wiki/Blank') is None
+
+    def test_get_backend(self):
+        assert parsers.get_backend('html.parser').name == 'html.parser'
+        with pytest.raises(KeyError):
+            parsers.get_backend('html5lib')
+
+
+@pytest.mark.parametrize("parser", ['html.parser', 'lxml'])
+def test_set_card_urls(page_server, parser):
+    if parser == 'lxml':
+        pytest.importorskip('lxml')
+    scraper = ygf.YgScraper(parser = parser)
+    scraper.set_card_urls(page_server + '/Test_Booster')
+    assert set(scraper.get_card_urls()) == {'https://yugioh.fandom.com/wiki/Cyber_Dragon',
+                                            'https://yugioh.fandom.com/wiki/Polymerization'}
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 15:41:57 2026
+
+Author: Jordan Tanudjaja
+
+Unit-testing Module for pipeline.py
+To be called with python -m pytest in the command line because pytest does not work since I did not
+create this in development mode in a virtual environment
+"""
+
+import sqlite3
+from yugioh import pipeline, webfetch
+import pytest
+
+
+@pytest.fixture(scope = 'module')
+def fetcher():
+    fetcher = webfetch.WebFetcher(pool_size = 3, max_retries = 0, timeout = 5)
+    yield fetcher
+    fetcher.close()
+
+def test_scrape_cards(fetcher, page_server):
+    urls = [page_server + '/Cyber_Dragon', page_server + '/Not_a_card', page_server + '/Polymerization', page_server + '/Test_Booster'] * 5
+    card_details = pipeline.scrape_cards(urls, io_workers = 3, parse_workers = 2, queue_size = 2, fetcher = fetcher)
+    assert len(card_details) == len(urls)
+    assert [card_dict['Card Name'] if card_dict else None for card_dict in card_details] == ['Cyber Dragon', None, 'Polymerization', None] * 5
+    assert all(card_dict['Reference'] == url for url, card_dict in zip(urls, card_details) if card_dict)
+
+
+def test_scrape_no_cards(fetcher):
+    assert pipeline.scrape_cards([], parse_workers = 1, fetcher = fetcher) == []
+
+
+def test_on_result(fetcher, page_server):
+    urls = [page_server + '/Cyber_Dragon', page_server + '/Not_a_card', page_server + '/Test_Booster']
+    results = {}
+    pipeline.scrape_cards(urls, io_workers = 2, parse_workers = 1, fetcher = fetcher,
+                          on_result = lambda url, html_hash, card_dict: results.update({url: (html_hash, card_dict)}))
+    assert results[urls[0]][1]['Card Name'] == 'Cyber Dragon' and len(results[urls[0]][0]) == 64
+    assert results[urls[1]] == (None, None) # Page that cannot be downloaded
+    assert results[urls[2]][1] == None and results[urls[2]][0] != None # Page that is not a card page
+
+
+def test_unexpected_download_error(page_server):
+    class BrokenCacheFetcher(webfetch.WebFetcher):
+        def get_html(self, url):
+            if url.endswith('Polymerization'):
+                raise sqlite3.OperationalError('database is locked')
+            return super().get_html(url)
+
+    urls = [page_server + '/Cyber_Dragon', page_server + '/Polymerization']
+    results = {}
+    broken_fetcher = BrokenCacheFetcher(pool_size = 1, max_retries = 0, timeout = 5)
+    # The error only fails its own url and the scraping finishes instead of waiting forever
+    card_details = pipeline.scrape_cards(urls, io_workers = 1, parse_workers = 1, fetcher = broken_fetcher,
+                                         on_result = lambda url, html_hash, card_dict: results.update({url: (html_hash, card_dict)}))
+    broken_fetcher.close()
+    assert card_details[0]['Card Name'] == 'Cyber Dragon'
+    assert card_details[1] is None
+    assert results[urls[1]] == (None, None)
+
+def test_parse_worker_has_no_fetcher(monkeypatch, saved_page):
+    # The parsing processes only parse pages, so they do not create the shared WebFetcher
+    monkeypatch.setattr(webfetch, '_shared_fetcher', None)
+    monkeypatch.setattr(pipeline, '_worker_scraper', None)
+    pipeline._init_parse_worker('html.parser')
+    index, card_dict = pipeline._parse_card_page(3, 'https://yugioh.fandom.com/wiki/Cyber_Dragon', saved_page('Cyber_Dragon'))
+    assert (index, card_dict['Card Name']) == (3, 'Cyber Dragon')
+    assert webfetch._shared_fetcher is None
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:40:16 2026
+
+Author: Jordan Tanudjaja
+
+Unit-testing Module for pricecache.py
+To be called with python -m pytest in the command line because pytest does not work since I did not
+create this in development mode in a virtual environment
+"""
+
+import time
+from yugioh import pricecache
+import pytest
+
+PRICE_STATS = {'Average Market Price': 2.0, 'Average Lowest Price': 2.0, 'Cheapest Price': 1.0, 'Highest Price': 3.0}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = pricecache.PriceCache(cache_filepath = str(tmp_path / 'Price Cache.sqlite'))
+    yield cache
+    cache.close()
+
+class TestPriceCache:
+    """
+    Test Class to handle the PriceCache class in the pricecache module
+    """
+    def test_store_get(self, cache):
+        assert cache.get('Cyber Dragon') is None
+        cache.store('Cyber Dragon', PRICE_STATS)
+        cache.store('Sdgsdg', {})
+        assert cache.get('cYBER dRAGON') == PRICE_STATS
+        assert cache.get('sdgsdg') == {}
+        assert len(cache) == 2
+
+
+    def test_punctuation(self, cache):
+        # Card names that only differ in their punctuation are different cards
+        cache.store("Ra's Disciple", PRICE_STATS)
+        assert cache.get('Ras Disciple') is None
+        assert cache.get("ra's disciple") == PRICE_STATS
+
+
+    def test_ttl(self, cache):
+        cache.store('Cyber Dragon', PRICE_STATS)
+        cache.ttl = 0.05
+        time.sleep(0.1)
+        assert cache.get('Cyber Dragon') is None
+        cache.store('Cyber Dragon', PRICE_STATS)
+        assert cache.get('Cyber Dragon') == PRICE_STATS
+
+
+    def test_lru_eviction(self, cache):
+        cache.max_entries = 2
+        cache.store('Cyber Dragon', PRICE_STATS)
+        time.sleep(0.01)
+        cache.store('Dark Magician', PRICE_STATS)
+        time.sleep(0.01)
+        assert cache.get('Cyber Dragon') == PRICE_STATS # Dark Magician is now the least recently used card
+        time.sleep(0.01)
+        cache.store('Polymerization', PRICE_STATS)
+        assert len(cache) == 2
+        assert cache.get('Dark Magician') is None
+        assert cache.get('Cyber Dragon') == PRICE_STATS
+
+
+    def test_persistence(self, cache, tmp_path):
+        cache.store('Cyber Dragon', PRICE_STATS)
+        cache.close()
+        reopened_cache = pricecache.PriceCache(cache_filepath = str(tmp_path / 'Price Cache.sqlite'))
+        assert reopened_cache.get('Cyber Dragon') == PRICE_STATS
+        reopened_cache.clear()
+        assert len(reopened_cache) == 0
+        reopened_cache.close()
+
+
+def test_get_price_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(pricecache, '_shared_cache', None)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'Data').mkdir()
+    shared_cache = pricecache.get_price_cache()
+    assert pricecache.get_price_cache() is shared_cache
+    assert shared_cache.cache_filepath == 'Data/Price Cache.sqlite'
+    shared_cache.close()
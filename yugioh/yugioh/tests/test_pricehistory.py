@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 14:52:09 2026
+
+Author: Jordan Tanudjaja
+
+Unit-testing Module for pricehistory.py
+To be called with python -m pytest in the command line because pytest does not work since I did not
+create this in development mode in a virtual environment
+"""
+
+import datetime
+from yugioh import pricehistory
+import pytest
+
+DAY = 24 * 60 * 60
+
+
+def price_stats(price):
+    return {'Average Market Price': price, 'Average Lowest Price': price + 1,
+            'Cheapest Price': price - 1, 'Highest Price': price + 2}
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = pricehistory.PriceHistory(history_filepath = str(tmp_path / 'Price History.sqlite'))
+    # Two observations a day of two cards for 10 days, starting on 2026-01-01
+    start = datetime.datetime(2026, 1, 1, tzinfo = datetime.timezone.utc).timestamp()
+    for day in range(10):
+        for hour in (0, 12):
+            history.record_many({'Cyber Dragon': price_stats(10 + day + hour / 12), 'Dark Magician': price_stats(5), 'Sdgsdg': {}},
+                                observed_at = start + day * DAY + hour * 60 * 60)
+    yield history
+    history.close()
+
+class TestPriceHistory:
+    """
+    Test Class to handle the PriceHistory class in the pricehistory module
+    """
+    def test_record(self, history):
+        assert len(history) == 40 # Cards without sellers are not recorded
+        history.record('Cyber Dragon', price_stats(1))
+        assert len(history) == 41
+
+
+    def test_get_history(self, history):
+        history_df = history.get_history('cYBER dRAGON', start = '2026-01-03', end = datetime.datetime(2026, 1, 5))
+        assert list(history_df.columns) == ['Card Name', 'Observed At'] + pricehistory.PRICE_COLUMNS
+        assert len(history_df) == 4
+        assert history_df['Observed At'].is_monotonic_increasing
+        assert history_df['Average Market Price'].tolist() == [12, 13, 13, 14]
+        assert (history_df['Card Name'] == 'Cyber Dragon').all()
+
+        assert len(history.get_history(['Cyber Dragon', 'Dark Magician'])) == 40
+        assert len(history.get_history('Polymerization')) == 0
+
+
+    def test_get_aggregates(self, history):
+        aggregates_df = history.get_aggregates(['Cyber Dragon', 'Dark Magician'], start = '2026-01-01', end = '2026-01-09',
+                                               interval = datetime.timedelta(days = 2))
+        assert len(aggregates_df) == 8
+        cyber_dragon_df = aggregates_df[aggregates_df['Card Name'] == 'Cyber Dragon']
+        assert cyber_dragon_df['Observations'].tolist() == [4, 4, 4, 4]
+        assert cyber_dragon_df['Average Market Price'].tolist() == [11.0, 13.0, 15.0, 17.0]
+        assert cyber_dragon_df['Cheapest Price'].tolist() == [9, 11, 13, 15]
+        assert cyber_dragon_df['Highest Price'].tolist() == [14, 16, 18, 20]
+        assert cyber_dragon_df['Period Start'].iloc[0] == datetime.datetime(2026, 1, 1)
+
+        with pytest.raises(ValueError):
+            history.get_aggregates(interval = 0)
+
+
+    def test_no_card_names(self, history):
+        # An empty list of card names selects no card instead of every card
+        history_df = history.get_history([])
+        assert len(history_df) == 0
+        assert list(history_df.columns) == ['Card Name', 'Observed At'] + pricehistory.PRICE_COLUMNS
+        aggregates_df = history.get_aggregates([], start = '2026-01-01')
+        assert len(aggregates_df) == 0
+        assert list(aggregates_df.columns) == ['Card Name', 'Period Start', 'Observations'] + pricehistory.PRICE_COLUMNS
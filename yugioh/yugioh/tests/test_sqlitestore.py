@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 20:41:55 2026
+
+Author: Jordan Tanudjaja
+
+Unit-testing Module for sqlitestore.py
+To be called with python -m pytest in the command line because pytest does not work since I did not
+create this in development mode in a virtual environment
+"""
+
+from yugioh.sqlitestore import SqliteStore
+import concurrent.futures
+import sqlite3
+import pytest
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SqliteStore(str(tmp_path / 'Store.sqlite'), 'CREATE TABLE IF NOT EXISTS numbers (number INTEGER PRIMARY KEY)')
+    yield store
+    store.close()
+
+
+def test_wal_mode(store):
+    with store.read() as connection:
+        assert connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+
+def test_transaction_rollback(store):
+    with store.transaction() as connection:
+        connection.execute('INSERT INTO numbers VALUES (1)')
+    with pytest.raises(sqlite3.IntegrityError):
+        with store.transaction() as connection:
+            connection.execute('INSERT INTO numbers VALUES (2)')
+            connection.execute('INSERT INTO numbers VALUES (1)')
+
+    # The whole transaction that failed is rolled back, and the store can still be used
+    with store.read() as connection:
+        assert connection.execute('SELECT number FROM numbers').fetchall() == [(1,)]
+
+
+def test_threads(store):
+    def insert(number):
+        with store.transaction() as connection:
+            connection.execute('INSERT INTO numbers VALUES (?)', (number,))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers = 8) as executor:
+        list(executor.map(insert, range(200)))
+    with store.read() as connection:
+        assert connection.execute('SELECT COUNT(*) FROM numbers').fetchone()[0] == 200
@@ -9,9 +9,371 @@ To be called with python -m pytest in the command line because pytest does not w
 create this in development mode in a virtual environment
 """
 
+import json
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from yugioh import tcgplayer as tcg
+from yugioh import pricecache, pricehistory
 import pytest
 
+# Canned results of the JSON search endpoint, keyed by the lowercase query
+SEARCH_RESULTS = {
+    'cyber dragon': [{'productName': 'Cyber Dragon', 'marketPrice': 1.5, 'lowestPriceWithShipping': 1.0},
+                     {'productName': 'Cyber Dragon', 'marketPrice': 2.5, 'lowestPriceWithShipping': 3.0},
+                     {'productName': 'Cyber Dragon', 'marketPrice': None, 'lowestPriceWithShipping': 0.1},
+                     {'productName': 'Cyber Dragon Core', 'marketPrice': 0.2, 'lowestPriceWithShipping': 0.2}],
+    'dark magician': [{'productName': 'Dark Magician', 'marketPrice': 4.0, 'lowestPriceWithShipping': 5.0}]
+}
+
+# Lowercase query of every request answered by the local stand-in for the JSON search endpoint
+SEARCH_LOG = []
+
+
+class SearchRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler that stands in for the JSON search endpoint of tcgplayer.com
+    """
+    def do_POST(self):
+        query = self.path.split('q=')[-1].split('&')[0].replace('+', ' ').replace('%20', ' ').lower()
+        SEARCH_LOG.append(query)
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        assert payload['filters']['term']['productLineName'] == ['yugioh']
+        body = json.dumps({'results': [{'results': SEARCH_RESULTS.get(query, [])}]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(autouse = True)
+def shared_price_cache(monkeypatch):
+    # Every test gets an empty shared price cache in memory instead of the SQLite file in the Data directory,
+    # it is not closed because the module-scoped fixtures keep using it
+    price_cache = pricecache.PriceCache(':memory:')
+    monkeypatch.setattr(pricecache, '_shared_cache', price_cache)
+    return price_cache
+
+@pytest.fixture(scope = 'module')
+def search_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SearchRequestHandler)
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/v1/search/request'
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def http_bundle(search_server, small_database):
+    return tcg.CardPriceScraper(filepath = small_database, backend = 'http', search_url = search_server)
+
+class TestHttpBackend:
+    """
+    Test Class to handle the http backend of the CardPriceScraper Class with a local stand-in for the
+    JSON search endpoint
+    """
+    def test_price_searcher(self, http_bundle):
+        assert http_bundle.driver is None
+        assert http_bundle.price_searcher('cybEr drAGon') == {'Average Market Price': 2.0,
+                                                              'Average Lowest Price': 2.0,
+                                                              'Cheapest Price': 1.0,
+                                                              'Highest Price': 3.0}
+        assert http_bundle.price_searcher('sdgsdg') == {}
+
+
+    def test_price_searcher_unreachable(self, http_bundle):
+        http_bundle.search_url = 'http://127.0.0.1:9/v1/search/request'
+        assert http_bundle.price_searcher('Cyber Dragon') is None
+
+
+    def test_set_card_prices(self, http_bundle):
+        with pytest.raises(KeyError):
+            http_bundle.set_card_prices('sdgsd')
+        http_bundle.set_card_prices(['cYber DraGON', 'dark magician'])
+        assert len(http_bundle.get_card_prices()) == 2
+        assert http_bundle.get_card_prices()['Highest Price'].loc['Dark Magician'] == 5.0
+        assert list(http_bundle.get_combined_df().columns[:3]) == ['Card Type', 'Competitive Status (TCG Advanced)', 'Reference']
+        http_bundle.quit_browser()
+        http_bundle.restart_browser()
+
+
+    def test_price_cache(self, http_bundle):
+        SEARCH_LOG.clear()
+        http_bundle.set_card_prices(['Cyber Dragon', 'Dark Magician'])
+        http_bundle.set_card_prices(['cyber dragon', 'Dark Magician', 'Polymerization'])
+        assert sorted(SEARCH_LOG) == ['cyber dragon', 'dark magician', 'polymerization']
+        assert http_bundle.get_card_prices()['Highest Price'].loc['Cyber Dragon'] == 3.0
+
+        # Failed searches are not cached
+        http_bundle.search_url = 'http://127.0.0.1:9/v1/search/request'
+        assert http_bundle.price_searcher('Imperial Order') is None
+        assert http_bundle.price_cache.get('Imperial Order') is None
+
+
+    def test_shared_price_cache(self, search_server, small_database, shared_price_cache):
+        SEARCH_LOG.clear()
+        card_bundle = tcg.CardPriceScraper(filepath = small_database, backend = 'http', search_url = search_server)
+        shopping_cart = tcg.BuyingTool([('Cyber Dragon', 1)], filepath = small_database, backend = 'http', search_url = search_server)
+        assert card_bundle.price_cache is shopping_cart.price_cache is shared_price_cache
+        card_bundle.price_searcher('Cyber Dragon')
+        assert SEARCH_LOG == ['cyber dragon'] # The card searched by the BuyingTool is not searched again
+
+
+    def test_price_history(self, http_bundle, tmp_path):
+        http_bundle.price_history = pricehistory.PriceHistory(history_filepath = str(tmp_path / 'Price History.sqlite'))
+        http_bundle.set_card_prices(['Cyber Dragon', 'Dark Magician', 'Dark Simorgh'])
+        http_bundle.price_searcher('Cyber Dragon') # Prices from the price cache are not recorded again
+        history_df = http_bundle.price_history.get_history()
+        assert sorted(history_df['Card Name']) == ['Cyber Dragon', 'Dark Magician'] # Dark Simorgh has no sellers
+        assert history_df.set_index('Card Name')['Highest Price'].loc['Cyber Dragon'] == 3.0
+        http_bundle.price_history.close()
+
+
+    def test_buying_tool_delta(self, search_server, small_database):
+        SEARCH_LOG.clear()
+        shopping_cart = tcg.BuyingTool([('Cyber Dragon', 3)], filepath = small_database,
+                                       backend = 'http', search_url = search_server)
+        shopping_cart.add_to_cart([('dark MagicIAn', 4)])
+        shopping_cart.remove_from_cart([('CyBER DraGoN', 1)])
+
+        assert SEARCH_LOG == ['cyber dragon', 'dark magician'] # Every card is only searched once
+        assert shopping_cart.get_normalprice_df()['Quantity'].loc['Cyber Dragon'] == 2
+        assert shopping_cart.get_cumulative_df()['Total no. of cards'].loc['Cumulative Total'] == 6
+
+
+    def test_buying_tool_totals(self, search_server, small_database):
+        shopping_cart = tcg.BuyingTool([('Cyber Dragon', 3)], filepath = small_database,
+                                       backend = 'http', search_url = search_server)
+
+        shopping_cart.add_to_cart([('dark MagicIAn', 4), ('dark SimORgh', 7), ('khjn', 4)])
+        assert shopping_cart.cards_dict == {'cyber dragon': 3, 'dark magician': 4, 'dark simorgh': 7}
+        assert list(shopping_cart.get_normalprice_df().columns) == tcg.CardPriceScraper.price_columns + ['Quantity']
+        assert shopping_cart.get_totalprice_df()['Total(Highest Price)'].loc['Dark Magician'] == 20.0
+        cumulative_df = shopping_cart.get_cumulative_df()
+        assert list(cumulative_df.columns) == [f'Total({column})' for column in tcg.CardPriceScraper.price_columns] + ['Total no. of cards']
+        assert cumulative_df['Total(Highest Price)'].loc['Cumulative Total'] == 29.0 # Dark Simorgh has no sellers
+        assert cumulative_df['Total no. of cards'].loc['Cumulative Total'] == 14
+
+        shopping_cart.remove_from_cart([('DarK SiMoRGH', 7), ('slgks', 2), ('CyBER DraGoN', 1)])
+        assert shopping_cart.cards_dict == {'cyber dragon': 2, 'dark magician': 4}
+        assert len(shopping_cart.get_normalprice_df()) == 2
+        assert len(shopping_cart.get_cart_combined_df()) == 2
+        assert len(shopping_cart.get_cart_prices()) == 2
+        assert shopping_cart.get_cumulative_df()['Total(Cheapest Price)'].loc['Cumulative Total'] == 18.0
+        assert shopping_cart.get_cumulative_df()['Total no. of cards'].loc['Cumulative Total'] == 6
+
+        # The cumulative totals are kept by difference and have to match a sum over the whole cart
+        totalprice_df = shopping_cart.get_totalprice_df()
+        assert (totalprice_df.sum().values == shopping_cart.get_cumulative_df().values[0]).all()
+
+        shopping_cart.remove_from_cart([('Cyber Dragon', 2), ('Dark Magician', 4)])
+        assert len(shopping_cart.get_normalprice_df()) == 0
+        assert len(shopping_cart.get_cumulative_df()) == 0
+
+        with pytest.raises(KeyError):
+            shopping_cart.set_buying_dfs([('gsdg', 2)])
+        assert shopping_cart.get_normalprice_df() is None
+        assert shopping_cart.get_cumulative_df() is None
+        shopping_cart.add_to_cart([('Cyber Dragon', 1)])
+        assert len(shopping_cart.get_normalprice_df()) == 1
+
+
+    def test_buying_tool_card_prices(self, search_server, small_database):
+        shopping_cart = tcg.BuyingTool([('Cyber Dragon', 3)], filepath = small_database,
+                                       backend = 'http', search_url = search_server)
+        # The card prices of the Parent Class are kept apart from the cart
+        assert len(shopping_cart.get_card_prices()) == 0
+        shopping_cart.set_card_prices(['Dark Magician'])
+        assert list(shopping_cart.get_card_prices().index) == ['Dark Magician']
+        assert list(shopping_cart.get_combined_df().index) == ['Dark Magician']
+        assert list(shopping_cart.get_cart_prices().index) == ['Cyber Dragon']
+
+
+    def test_buying_tool_refresh(self, search_server, small_database, monkeypatch):
+        shopping_cart = tcg.BuyingTool([('Dark Magician', 2), ('Cyber Dragon', 1)], filepath = small_database,
+                                       backend = 'http', search_url = search_server)
+        assert shopping_cart.get_cumulative_df()['Total(Highest Price)'].loc['Cumulative Total'] == 13.0
+
+        # Prices of the cart that are older than the time-to-live of the price cache are searched again
+        SEARCH_LOG.clear()
+        monkeypatch.setitem(SEARCH_RESULTS, 'dark magician', [{'productName': 'Dark Magician', 'marketPrice': 4.0,
+                                                               'lowestPriceWithShipping': 6.0}])
+        monkeypatch.setattr(shopping_cart.price_cache, 'ttl', 0)
+        assert shopping_cart.get_cart_prices()['Highest Price'].loc['Dark Magician'] == 6.0
+        assert sorted(SEARCH_LOG) == ['cyber dragon', 'dark magician']
+        cumulative_df = shopping_cart.get_cumulative_df()
+        assert cumulative_df['Total(Highest Price)'].loc['Cumulative Total'] == 15.0
+        assert (shopping_cart.get_totalprice_df().sum().values == cumulative_df.values[0]).all()
+
+
+    def test_unknown_backend(self):
+        with pytest.raises(KeyError):
+            tcg.CardPriceScraper(backend = 'firefox')
+
+
+class FakeChrome:
+    """
+    Stand-in for webdriver.Chrome that only remembers the cards it searched, it takes the same arguments
+    as webdriver.Chrome in Selenium 4
+    """
+    def __init__(self, options = None, service = None, keep_alive = True):
+        assert isinstance(service, tcg.Service)
+        self.searched = []
+        self.closed = False
+
+    def get(self, url):
+        if self.closed:
+            raise Exception('Browser is closed')
+
+    def quit(self):
+        self.closed = True
+
+
+class FakeSearchBox:
+    """
+    Stand-in for the search box of the tcgplayer.com home page
+    """
+    def __init__(self, page):
+        self.page = page
+        self.keys = []
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def send_keys(self, keys):
+        self.keys.append(keys)
+        if keys == tcg.Keys.RETURN:
+            self.page.submit(self.keys[-2])
+
+
+class FakeElement:
+    """
+    Stand-in for a WebElement that only has a text
+    """
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeSearchPage(FakeChrome):
+    """
+    Stand-in for webdriver.Chrome on a search page whose results take two polls to load after each
+    search. The element with the number of results is reused by every search, only its text changes
+    """
+    def __init__(self, options = None, service = None, keep_alive = True):
+        super().__init__(options = options, service = service, keep_alive = keep_alive)
+        self.search_box = FakeSearchBox(self)
+        self.current_url = 'https://www.tcgplayer.com/'
+        self.results_count = None
+        self.polls = 0
+        self.results = [['Cyber Dragon', '$1.50', '$1.00'],
+                        ['Cyber Dragon', '$2.50', '$3.00'],
+                        ['Cyber Dragon', None, '$0.10'],
+                        ['cyber dragon', '$1,000.00', 'Unavailable'],
+                        ['Cyber Dragon Core', '$0.20', '$0.20']]
+
+    def find_element(self, by, value):
+        assert (by, value) == (tcg.By.ID, 'autocomplete-input')
+        return self.search_box
+
+    def find_elements(self, by, value):
+        assert (by, value) == (tcg.By.CLASS_NAME, 'results')
+        return [] if self.results_count is None else [self.results_count]
+
+    def submit(self, query):
+        self.current_url = 'https://www.tcgplayer.com/search/yugioh/product?q=' + query
+        if self.results_count is None:
+            self.results_count = FakeElement('')
+        self.results_count.text = f'{len(self.results)} results for: {query}'
+        self.polls = 0
+
+    def execute_script(self, script):
+        assert script == tcg.SEARCH_RESULTS_SCRIPT
+        self.polls += 1
+        return json.dumps(self.results) if self.polls >= 2 else None
+
+
+class TestSearchResultsScript:
+    """
+    Test Class to handle the extraction of the search results of the selenium backend without opening
+    Chrome
+    """
+    def test_price_searcher(self, small_database, monkeypatch):
+        monkeypatch.setattr(tcg.webdriver, 'Chrome', FakeSearchPage)
+        card_bundle = tcg.CardPriceScraper(filepath = small_database)
+        assert card_bundle.price_searcher('cybEr drAGon') == {'Average Market Price': 2.0,
+                                                              'Average Lowest Price': 2.0,
+                                                              'Cheapest Price': 1.0,
+                                                              'Highest Price': 3.0}
+        assert card_bundle.driver.polls == 2
+        assert card_bundle.driver.search_box.keys[0] == 'cybEr drAGon'
+
+        # The second search waits for the url and the results text to change instead of waiting for
+        # the reused results element to go stale
+        card_bundle.driver.results = []
+        start = time.time()
+        assert card_bundle.price_searcher('sdgsdg') == {}
+        assert time.time() - start < 2
+
+    def test_search_box_timeout(self, small_database, monkeypatch):
+        # A search box that never becomes clickable gives no prices instead of raising TimeoutException
+        monkeypatch.setattr(tcg.webdriver, 'Chrome', FakeSearchPage)
+        card_bundle = tcg.CardPriceScraper(filepath = small_database)
+        card_bundle.driver.search_box.is_enabled = lambda: False
+        assert card_bundle.price_searcher('Cyber Dragon') is None
+        assert card_bundle.driver.search_box.keys == []
+
+
+class TestBrowserPool:
+    """
+    Test Class to handle the pool of browsers of the selenium backend without opening Chrome
+    """
+    @pytest.fixture
+    def pool_bundle(self, small_database, monkeypatch):
+        def fake_searcher(self, db_card_name, driver):
+            driver.searched.append(db_card_name)
+            time.sleep(0.2) # Each search holds on to its driver, so the pool has to spread the cards
+            return {'Average Market Price': 1.0, 'Average Lowest Price': 1.0, 'Cheapest Price': 1.0, 'Highest Price': 1.0}
+
+        monkeypatch.setattr(tcg.webdriver, 'Chrome', FakeChrome)
+        monkeypatch.setattr(tcg.CardPriceScraper, '_CardPriceScraper__selenium_price_searcher', fake_searcher)
+        return tcg.CardPriceScraper(filepath = small_database, browsers = 3, headless = True)
+
+
+    def test_pool(self, pool_bundle):
+        assert len(pool_bundle.drivers) == 3
+        assert pool_bundle.driver is pool_bundle.drivers[0]
+
+        card_names = ['Cyber Dragon', 'Dark Magician', 'Dark Simorgh', 'Imperial Order', 'Knightmare Unicorn', 'Polymerization']
+        pool_bundle.set_card_prices(card_names)
+        assert len(pool_bundle.get_card_prices()) == 6
+        assert len(pool_bundle.get_combined_df()) == 6
+        assert sorted(name for driver in pool_bundle.drivers for name in driver.searched) == sorted(card_names)
+        assert all(len(driver.searched) > 0 for driver in pool_bundle.drivers)
+
+        # The same browsers are reused by the next call
+        drivers = list(pool_bundle.drivers)
+        pool_bundle.set_card_prices('Astrograph Sorcerer')
+        assert pool_bundle.drivers == drivers
+        assert sum(len(driver.searched) for driver in drivers) == 7
+
+
+    def test_quit_restart(self, pool_bundle):
+        pool_bundle.quit_browser()
+        assert all(driver.closed for driver in pool_bundle.drivers)
+        pool_bundle.restart_browser()
+        assert len(pool_bundle.drivers) == 3
+        assert not any(driver.closed for driver in pool_bundle.drivers)
+        pool_bundle.set_card_prices('Cyber Dragon')
+        assert len(pool_bundle.get_card_prices()) == 1
+
+
 @pytest.fixture(scope = 'module')
 def card_bundle():
     card_bundle = tcg.CardPriceScraper(PATH = '../../External Applications/chromedriver.exe', filepath = '../../Data/Yugioh Card Database.csv')
@@ -39,7 +401,7 @@ class TestCardPriceSraper:
 
 
     def test_price_searcher(self, card_bundle, monkeypatch):
-        assert card_bundle.driver.find_element_by_id('autocomplete-input')
+        assert card_bundle.driver.find_element(tcg.By.ID, 'autocomplete-input')
         assert card_bundle.price_searcher('cybEr drAGon') != {}
         assert card_bundle.price_searcher('sdgsdg') == {}
 
@@ -53,6 +415,14 @@ class TestCardPriceSraper:
         assert len(card_bundle.get_combined_df()) == 1
 
 
+    def test_browser_pool(self):
+        card_pool = tcg.CardPriceScraper(PATH = '../../External Applications/chromedriver.exe', filepath = '../../Data/Yugioh Card Database.csv',
+                                         browsers = 2, headless = True)
+        card_pool.set_card_prices(['cYber DraGON', 'DaRK magician'])
+        assert len(card_pool.get_card_prices()) == 2
+        card_pool.quit_browser()
+
+
     def test_quit_browser(self, card_bundle):
         card_bundle.quit_browser()
         with pytest.raises(Exception) as error:
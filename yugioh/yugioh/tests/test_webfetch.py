@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 10:52:06 2026
+
+Author: Jordan Tanudjaja
+
+Unit-testing Module for webfetch.py
+To be called with python -m pytest in the command line because pytest does not work since I did not
+create this in development mode in a virtual environment
+"""
+
+from yugioh import webfetch
+import concurrent.futures
+import pytest
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = webfetch.WebFetcher(pool_size = 3, max_retries = 0, timeout = 5)
+    yield fetcher
+    fetcher.close()
+
+class TestWebFetcher:
+    """
+    Test Class to handle the WebFetcher class and the shared fetcher in the webfetch module
+    """
+    def test_get_html(self, fetcher, page_server):
+        assert 'Cyber Dragon' in fetcher.get_html(page_server + '/Cyber_Dragon')
+        assert fetcher.get(page_server + '/Not_a_card').status_code == 404
+        assert fetcher.get_html(page_server + '/Not_a_card') == None
+
+
+    def test_threaded_get_html(self, fetcher, page_server):
+        urls = [page_server + '/Cyber_Dragon', page_server + '/Polymerization'] * 10
+        with concurrent.futures.ThreadPoolExecutor(max_workers = fetcher.pool_size) as executor:
+            pages = list(executor.map(fetcher.get_html, urls))
+        assert all('cardtable' in page for page in pages)
+
+
+    def test_shared_fetcher(self, monkeypatch):
+        # The shared fetcher of the package is put back when the test ends, so other tests never see
+        # the one configured here
+        monkeypatch.setattr(webfetch, '_shared_fetcher', None)
+        assert webfetch.get_fetcher() is webfetch.get_fetcher()
+        shared_fetcher = webfetch.configure_fetcher(pool_size = 8)
+        assert shared_fetcher.pool_size == 8
+        assert webfetch.get_fetcher() is shared_fetcher
+        shared_fetcher.close()
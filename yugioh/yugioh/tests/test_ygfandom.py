@@ -10,9 +10,12 @@ create this in development mode in a virtual environment
 """
 
 from yugioh import ygfandom as ygf
+from yugioh import dbstorage
+from yugioh import webfetch
 import pandas as pd
 import pytest
-
+import os
+import time
 
 @pytest.fixture(scope = 'module') # Scope = 'module' is used to make sure this only runs once, and not after every test
 def duelist():
@@ -20,6 +23,11 @@ def duelist():
     duelist.database_filepath = '../../Data/Yugioh Card Database (Testing).csv' # For testing purposes, the filepath to save the database in a test is changed to a separate file
     return duelist
 
+@pytest.fixture
+def small_duelist(small_database):
+    # Small copy of the Yugioh Card Database in a temporary directory, so the tests can save to it freely
+    return ygf.DbHandler(database_filepath = small_database)
+
 @pytest.fixture
 def scraper():
     scraper = ygf.YgScraper()
@@ -110,6 +118,137 @@ class TestDbHandler:
                 set(checkup_df['Competitive Status (TCG Advanced)'].unique()) & incorrect_competitive_status != set())
 
 
+class TestDbHandlerBatch:
+    """
+    Test Class to handle the batch methods of the DbHandler class on a small copy of the database
+    """
+    def test_add_cards(self, small_duelist, scraper, saved_page):
+        number_of_cards = len(small_duelist.get_card_database())
+        with pytest.raises(Exception) as error:
+            small_duelist.add_cards([{'random': 3}])
+        assert str(error.value) == 'The card format passed is not correct, make sure you call YgSraper.get_card_details on the URL first'
+
+        existing_card = small_duelist.get_card_database().iloc[0].to_dict()
+        new_card = scraper.parse_card_details(saved_page('Cyber_Dragon'), 'https://yugioh.fandom.com/wiki/Cyber_Dragon_(new)')
+        assert len(small_duelist.add_cards([existing_card, new_card, new_card])) == number_of_cards + 1
+        assert small_duelist.add_cards([existing_card, new_card]) == None
+
+        saved_df = pd.read_csv(small_duelist.database_filepath, keep_default_na = False)
+        assert len(saved_df) == number_of_cards + 1
+        assert saved_df['Reference'].iloc[-1] == 'https://yugioh.fandom.com/wiki/Cyber_Dragon_(new)'
+
+
+    def test_indexes(self, small_duelist, scraper, saved_page):
+        df = small_duelist.get_card_database()
+        imperial_order_index = df[df['Card Name'] == 'Imperial Order'].index[0]
+        assert small_duelist.locate_card('https://yugioh.fandom.com/wiki/Imperial_Order') == imperial_order_index
+        assert small_duelist.locate_card('https://www.google.com/') == None
+        assert list(small_duelist.search_card_name('imPERial ORDER').index) == [imperial_order_index]
+        assert len(small_duelist.search_card_name(['cybEr DrAgoN', 'sdgsdg', 'dARk simOrGH', 'Cyber DRAgon'])) == 2
+        assert len(small_duelist.search_card_name(['sdgsdg', 'random name'])) == 0
+
+        found_df, missing_names = small_duelist.search_card_names(['Dark Magician', 'sdgsdg', 'cyber DRAGON', 'DARK MAGICIAN'])
+        assert list(found_df['Card Name']) == ['Dark Magician', 'Cyber Dragon']
+        assert missing_names == ['sdgsdg']
+        assert all(df == small_duelist.get_card_database()) # The database is not changed by the search
+
+        # The indexes are updated when new cards are added
+        new_card = scraper.parse_card_details(saved_page('Cyber_Dragon'), 'https://yugioh.fandom.com/wiki/Cyber_Dragon_(new)')
+        small_duelist.add_card(new_card)
+        new_card_index = small_duelist.locate_card('https://yugioh.fandom.com/wiki/Cyber_Dragon_(new)')
+        assert new_card_index == small_duelist.get_card_database().index[-1]
+        assert new_card_index in small_duelist.search_card_name('cyber dragon').index
+
+
+    def test_update_cards(self, small_duelist):
+        df = small_duelist.get_card_database()
+        updates_df = pd.DataFrame({'Competitive Status (TCG Advanced)': ['Limited', 'Semi-Limited']}, index = [0, 6])
+        assert small_duelist.update_cards(updates_df) is df
+        assert list(df.loc[[0, 6], 'Competitive Status (TCG Advanced)']) == ['Limited', 'Semi-Limited']
+
+        saved_df = pd.read_csv(small_duelist.database_filepath, keep_default_na = False)
+        assert list(saved_df.loc[[0, 6], 'Competitive Status (TCG Advanced)']) == ['Limited', 'Semi-Limited']
+
+        # Changing the Card Name updates the indexes
+        small_duelist.update_cards(pd.DataFrame({'Card Name': ['Cyber Dragon Nova']}, index = [0]))
+        assert list(small_duelist.search_card_name('cyber dragon nova').index) == [0]
+
+        assert small_duelist.update_cards(updates_df.iloc[:0]) == None
+        with pytest.raises(Exception):
+            small_duelist.update_cards(pd.DataFrame({'random': [3]}, index = [0]))
+        with pytest.raises(Exception):
+            small_duelist.update_cards(pd.DataFrame({'Card Name': ['Cyber Dragon']}, index = [100]))
+
+    def test_match_card_names(self, small_duelist, scraper, saved_page):
+        assert small_duelist.match_card_names('Polymerisation') == [('Polymerization', 1)]
+        assert small_duelist.match_card_names('dark magican')[0] == ('Dark Magician', 1)
+        assert small_duelist.match_card_names('Blue-Eyes White Dragon') == []
+
+        # The fuzzy index is rebuilt after cards are added
+        new_card = scraper.parse_card_details(saved_page('Cyber_Dragon'), 'https://yugioh.fandom.com/wiki/Cyber_Dragon_(new)')
+        small_duelist.add_cards([dict(new_card, **{'Card Name': 'Cyber Dragon Nova'})])
+        assert small_duelist.match_card_names('Cyber Dragon Nov') == [('Cyber Dragon Nova', 1)]
+
+
+    def test_compact(self, small_duelist, tmp_path):
+        compact_duelist = ygf.DbHandler(database_filepath = small_duelist.database_filepath, compact = True)
+        df = compact_duelist.get_card_database()
+        assert str(df['ATK'].dtype) == 'Int64' and str(df['Card Type'].dtype) == 'category'
+        assert df['ATK'].iloc[0] == 2100
+        assert pd.isna(df['LINK'].iloc[0])
+        assert df['Direct Archetype & Series Support'].iloc[0] == {'Cyber', 'Cyber Dragon'}
+        assert list(compact_duelist.search_card_name('cyber dragon')['Card Name']) == ['Cyber Dragon']
+        assert list(compact_duelist.regulatory_checkup().index) == list(small_duelist.regulatory_checkup().index)
+
+        # The compact database cannot be changed because the values that are not numbers are lost
+        with pytest.raises(Exception):
+            compact_duelist.add_cards([small_duelist.get_card_database().iloc[0].to_dict()])
+        with pytest.raises(Exception):
+            compact_duelist.save_card_database()
+
+        # The compact format takes less memory once the database has more than a handful of cards
+        pd.concat([small_duelist.get_card_database()] * 200, ignore_index = True).to_csv(tmp_path / 'Large Card Database.csv', index = False)
+        large_duelist = ygf.DbHandler(database_filepath = str(tmp_path / 'Large Card Database.csv'))
+        compact_large_duelist = ygf.DbHandler(database_filepath = str(tmp_path / 'Large Card Database.csv'), compact = True)
+        assert (compact_large_duelist.get_card_database().drop(columns = list(dbstorage.set_columns)).memory_usage(deep = True).sum() * 2
+                < large_duelist.get_card_database().drop(columns = list(dbstorage.set_columns)).memory_usage(deep = True).sum())
+
+
+
+class TestSharedDatabase:
+    """
+    Test Class to handle the shared DbHandler objects of the ygfandom module
+    """
+    @pytest.fixture
+    def database_filepath(self, small_database):
+        return small_database
+
+    def test_get_database(self, database_filepath):
+        duelist = ygf.get_database(database_filepath)
+        assert ygf.get_database(database_filepath) is duelist
+
+        # Saving through the shared object keeps it shared
+        duelist.save_card_database()
+        assert ygf.get_database(database_filepath) is duelist
+
+        ygf.invalidate_database(database_filepath)
+        assert ygf.get_database(database_filepath) is not duelist
+
+    def test_outside_changes(self, database_filepath):
+        duelist = ygf.get_database(database_filepath)
+
+        # Saving through another DbHandler object makes the shared object read the file again
+        other_duelist = ygf.DbHandler(database_filepath = database_filepath)
+        other_duelist.add_cards([dict(other_duelist.get_card_database().iloc[0], Reference = 'https://yugioh.fandom.com/wiki/Cyber_Dragon_(new)')])
+        assert len(ygf.get_database(database_filepath).get_card_database()) == len(duelist.get_card_database()) + 1
+
+        # Changing the file outside of the package also makes the shared object read the file again
+        duelist = ygf.get_database(database_filepath)
+        pd.read_csv(database_filepath, keep_default_na = False).iloc[:3].to_csv(database_filepath, index = False)
+        os.utime(database_filepath, ns = (time.time_ns(), time.time_ns() + 10**9))
+        assert len(ygf.get_database(database_filepath).get_card_database()) == 3
+
+
 @pytest.mark.webtest
 class TestYgScraper:
     """
@@ -192,3 +331,97 @@ class TestYgScraper:
     def test_add_card_urls(self, scraper, card_url, list_of_card_urls):
         scraper.add_card_urls(card_url)
         assert set(scraper.get_card_urls()) == set(list_of_card_urls)
+
+
+class TestCardPageParsing:
+    """
+    Test Class to handle the parsing of saved card pages in the YgScraper class, no website is accessed
+    """
+    def test_parse_card_details(self, scraper, saved_page):
+        card_dict = scraper.parse_card_details(saved_page('Cyber_Dragon'), 'https://yugioh.fandom.com/wiki/Cyber_Dragon')
+        assert card_dict == {'Card Name': 'Cyber Dragon',
+                             'Card Type': 'Monster',
+                             'Spell/Trap Property': 'N/A',
+                             'Attribute': 'LIGHT',
+                             'Types': 'Machine / Effect',
+                             'Level/Rank': '5',
+                             'ATK': '2100',
+                             'DEF': '1600',
+                             'LINK': 'N/A',
+                             'Pendulum Scale': 'N/A',
+                             'Card Description': 'If only your opponent controls a monster, you can Special Summon this card (from your hand).',
+                             'Card/Attribute/Type Support': set(),
+                             'Direct Archetype & Series Support': {'Cyber', 'Cyber Dragon'},
+                             'Indirect Archetype & Series Support': {'Chimeratech', 'Cybernetic'},
+                             'Competitive Status (TCG Advanced)': 'Unlimited',
+                             'Reference': 'https://yugioh.fandom.com/wiki/Cyber_Dragon'}
+
+        card_dict = scraper.parse_card_details(saved_page('Polymerization'), 'https://yugioh.fandom.com/wiki/Polymerization')
+        assert card_dict['Card Type'] == 'Spell'
+        assert card_dict['Spell/Trap Property'] == 'Normal'
+        assert card_dict['Card/Attribute/Type Support'] == {'Fusion Monster'}
+
+
+    def test_parse_non_card_page(self, scraper):
+        assert scraper.parse_card_details('<html><body><table class="wikitable"></table></body></html>', 'https://www.google.com/') == None
+
+
+class TestAsyncScraping:
+    """
+    Test Class to handle the asyncio engine of the YgScraper class against a local HTTP stand-in that
+    serves the saved card pages
+    """
+    def test_scrape_many(self, scraper, page_server):
+        urls = [page_server + '/Cyber_Dragon', page_server + '/Not_a_card', page_server + '/Polymerization']
+        card_details = scraper.scrape_many(urls, concurrency = 3, requests_per_second = None)
+        assert [card_dict['Card Name'] if card_dict else None for card_dict in card_details] == ['Cyber Dragon', None, 'Polymerization']
+        assert card_details[0]['Reference'] == urls[0]
+        assert len(scraper.get_card_details()) == 2
+        assert set(scraper.get_card_urls()) == set(urls)
+
+
+    def test_scrape_many_rate_limit(self, scraper, page_server):
+        urls = [page_server + '/Cyber_Dragon'] * 4
+        time1 = time.perf_counter()
+        card_details = scraper.scrape_many(urls, concurrency = 4, requests_per_second = 20)
+        assert time.perf_counter() - time1 >= 3 / 20 # The 4th request starts 3 intervals after the 1st one
+        assert all(card_dict['Card Name'] == 'Cyber Dragon' for card_dict in card_details)
+
+
+class TestThreadedScraping:
+    """
+    Test Class to handle the thread-safety of the YgScraper class against a local HTTP stand-in that
+    serves the saved card pages
+    """
+    def test_scrape_card_details(self, scraper, page_server):
+        urls = [page_server + '/Cyber_Dragon', page_server + '/Polymerization', page_server + '/Not_a_card'] * 10
+        card_details = scraper.scrape_card_details(urls, max_workers = 15)
+        assert [card_dict['Card Name'] if card_dict else None for card_dict in card_details] == ['Cyber Dragon', 'Polymerization', None] * 10
+        assert len(scraper.get_card_details()) == 2 # Duplicate cards are removed
+        assert set(scraper.get_card_urls()) == set(urls)
+
+
+    def test_connection_error(self, page_server):
+        # Nothing listens on port 9, so that url raises a ConnectionError instead of giving a status code
+        scraper = ygf.YgScraper(fetcher = webfetch.WebFetcher(pool_size = 2, max_retries = 0, timeout = 5))
+        urls = [page_server + '/Cyber_Dragon', 'http://127.0.0.1:9/Polymerization']
+        card_details = scraper.scrape_card_details(urls, max_workers = 2)
+        assert card_details[0]['Card Name'] == 'Cyber Dragon'
+        assert card_details[1] is None
+
+
+    def test_card_urls_order(self, scraper):
+        scraper.add_card_urls(['https://yugioh.fandom.com/wiki/Polymerization', 'https://yugioh.fandom.com/wiki/Cyber_Dragon'])
+        scraper.add_card_urls(['https://yugioh.fandom.com/wiki/Cyber_Dragon', 'https://yugioh.fandom.com/wiki/Imperial_Order'])
+        assert scraper.get_card_urls() == ['https://yugioh.fandom.com/wiki/Polymerization',
+                                           'https://yugioh.fandom.com/wiki/Cyber_Dragon',
+                                           'https://yugioh.fandom.com/wiki/Imperial_Order']
+        scraper.card_url_list = ['https://yugioh.fandom.com/wiki/Cyber_Dragon'] * 2
+        assert scraper.get_card_urls() == ['https://yugioh.fandom.com/wiki/Cyber_Dragon']
+
+
+    def test_duplicate_cards(self, scraper, page_server):
+        scraper.set_card_details(page_server + '/Cyber_Dragon')
+        scraper.set_card_details(page_server + '/Polymerization')
+        scraper.set_card_details(page_server + '/Cyber_Dragon')
+        assert [card_dict['Card Name'] for card_dict in scraper.get_card_details()] == ['Cyber Dragon', 'Polymerization']
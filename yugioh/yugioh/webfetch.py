@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 10:12:45 2026
+
+Author: Jordan Tanudjaja
+
+Python module for downloading web pages from (https://yugioh.fandom.com) and (https://www.yugioh-card.com).
+All the scraping in the yugioh package goes through a shared WebFetcher object, so that the connections
+to these websites are kept alive and reused by every thread instead of opening a new connection for
+every single page
+"""
+
+import threading
+import asyncio
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+class WebFetcher:
+    """
+    Class for downloading web pages through a pooled requests.Session, with retries and timeouts. The
+    object is thread-safe and one object can be shared by all the threads of a ThreadPoolExecutor
+    """
+    # Class Variable
+    retry_status_codes = (429, 500, 502, 503, 504) # Status codes that are worth retrying
+
+    def __init__(self, pool_size = 5, max_retries = 3, backoff_factor = 0.5, timeout = 15, cache = None):
+        """
+        Parameters:
+        -----------
+        pool_size: int
+            Default value: 5
+
+            Number of connections kept alive for each website, it should match the max_workers of the
+            ThreadPoolExecutor that uses this object. Threads wait for a free connection instead of
+            opening extra connections when all of them are in use
+
+        max_retries: int
+            Default value: 3
+
+            Number of times a request is retried when the connection fails or the website returns
+            one of the status codes in retry_status_codes
+
+        backoff_factor: float
+            Default value: 0.5
+
+            The waiting time between retries is backoff_factor * (2 ** (number of previous retries)) seconds
+
+        timeout: int or float
+            Default value: 15
+
+            Number of seconds to wait for the website to respond before giving up on a request
+
+        cache: httpcache.ResponseCache
+            Default value: None
+
+            Cache that keeps the downloaded web pages on disk, pages are always downloaded from the
+            website if no cache is passed
+
+        Variables:
+        ----------
+        Public:
+            pool_size: int
+                Number of connections kept alive for each website
+
+            timeout: int or float
+                Number of seconds to wait for the website to respond
+
+            cache: httpcache.ResponseCache
+                Cache that keeps the downloaded web pages on disk
+
+        Private:
+            session: requests.Session()
+                The session that holds the pool of connections
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.cache = cache
+
+        retries = Retry(total = max_retries,
+                        backoff_factor = backoff_factor,
+                        status_forcelist = WebFetcher.retry_status_codes,
+                        allowed_methods = frozenset(['GET']),
+                        raise_on_status = False)
+        adapter = HTTPAdapter(pool_connections = pool_size, pool_maxsize = pool_size,
+                              pool_block = True, max_retries = retries)
+
+        self.__session = requests.Session()
+        self.__session.mount('https://', adapter)
+        self.__session.mount('http://', adapter)
+
+    def get(self, url):
+        """
+        Returns the requests.Response of the url in its argument
+
+        If the object has a cache, fresh cached pages are returned without contacting the website, and
+        stale cached pages are revalidated with a conditional GET so that unchanged pages are not
+        downloaded again
+
+        Parameters:
+        -----------
+        url: str
+            URL of the web page to be downloaded
+        """
+        if self.cache is None:
+            return self.__session.get(url, timeout = self.timeout)
+
+        record = self.cache.get(url)
+        headers = {}
+        if record is not None:
+            if self.cache.is_fresh(record):
+                return self.cache.to_response(record)
+            if record['etag'] is not None:
+                headers['If-None-Match'] = record['etag']
+            if record['last_modified'] is not None:
+                headers['If-Modified-Since'] = record['last_modified']
+
+        source = self.__session.get(url, headers = headers, timeout = self.timeout)
+        if source.status_code == 304 and record is not None:
+            self.cache.touch(url)
+            return self.cache.to_response(record)
+        elif source.status_code == 200:
+            self.cache.store(url, source)
+        return source
+
+    def post_json(self, url, payload, params = None):
+        """
+        Returns the requests.Response of a POST request with a JSON body, it is used for the search
+        endpoints that take their query in the request body. POST requests are never cached or retried
+
+        Parameters:
+        -----------
+        url: str
+            URL of the endpoint
+
+        payload: dict
+            Body of the request, it is sent in the JSON format
+
+        params: dict
+            Default value: None
+
+            Query string parameters of the request
+        """
+        return self.__session.post(url, json = payload, params = params, timeout = self.timeout)
+
+    def get_html(self, url):
+        """
+        Returns the HTML of the url in its argument in a string format, and returns nothing if the web
+        page cannot be downloaded successfully
+
+        Parameters:
+        -----------
+        url: str
+            URL of the web page to be downloaded
+        """
+        source = self.get(url)
+        if source.status_code == 200:
+            return source.text
+        else:
+            return None
+
+    def close(self):
+        """
+        Method to close all the connections that are kept alive in the session
+        """
+        self.__session.close()
+
+
+class HostRateLimiter:
+    """
+    Class for spacing out the requests that coroutines send to the same website, each website (host)
+    gets at most requests_per_second requests started every second
+    """
+    def __init__(self, requests_per_second = 10):
+        """
+        Parameters:
+        -----------
+        requests_per_second: int or float
+            Default value: 10
+
+            Maximum number of requests started per second for each website, no limit is applied if the
+            value is None or 0
+
+        Variables:
+        ----------
+        Public:
+            requests_per_second: int or float
+                Maximum number of requests started per second for each website
+
+        Private:
+            next_slot: dict
+                Keys are the hosts and values are the event loop time when the next request to that
+                host is allowed to start
+        """
+        self.requests_per_second = requests_per_second
+        self.__next_slot = {}
+
+    async def wait(self, url):
+        """
+        Coroutine that waits until a request to the host of the url in its argument is allowed to start
+
+        Parameters:
+        -----------
+        url: str
+            URL of the web page that is about to be downloaded
+        """
+        if not self.requests_per_second:
+            return
+
+        # Coroutines of one event loop never run at the same time, so the slots can be reserved
+        # without a lock
+        host = urlsplit(url).netloc
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self.__next_slot.get(host, now))
+        self.__next_slot[host] = slot + 1 / self.requests_per_second
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+# Shared WebFetcher object used by every module in the package, it is only created when it is needed
+_shared_fetcher = None
+_shared_fetcher_lock = threading.Lock()
+
+def get_fetcher():
+    """
+    Returns the WebFetcher object that is shared by the whole package
+    """
+    global _shared_fetcher
+    with _shared_fetcher_lock:
+        if _shared_fetcher is None:
+            _shared_fetcher = WebFetcher()
+        return _shared_fetcher
+
+def configure_fetcher(**kwargs):
+    """
+    Replaces the shared WebFetcher object with a new one, it is used to match the pool size with the
+    number of threads that are going to scrape the websites
+
+    Parameters:
+    -----------
+    **kwargs:
+        Keyword arguments that are passed to the WebFetcher class (pool_size, max_retries,
+        backoff_factor, timeout, cache)
+    """
+    global _shared_fetcher
+    with _shared_fetcher_lock:
+        if _shared_fetcher is not None:
+            _shared_fetcher.close()
+        _shared_fetcher = WebFetcher(**kwargs)
+        return _shared_fetcher
@@ -11,9 +11,17 @@ and the 'Yugioh Card Database.csv' file that was initialized on July 29 2020 in
 import pandas as pd
 import numpy as np
 import requests
-from bs4 import BeautifulSoup
 import re
+import os
 import unicodedata
+import io
+import asyncio
+import concurrent.futures
+import threading
+from yugioh import webfetch
+from yugioh import parsers
+from yugioh import dbstorage
+from yugioh import fuzzy
 
 class DbHandler:
     """
@@ -27,14 +35,22 @@ class DbHandler:
                       'Indirect Archetype & Series Support',
                       'Competitive Status (TCG Advanced)', 'Reference')
 
-    def __init__(self, database_filepath = 'Data/Yugioh Card Database.csv'):
+    def __init__(self, database_filepath = 'Data/Yugioh Card Database.csv', compact = False):
         """
         Parameters:
         -----------
         database_filepath: str
             Default value: 'Data/Yugioh Card Database.csv'
-            The value has to be in a CSV format, and the default path leads to a
-            file that contains all the information of yugioh cards up to the current meta
+            The value has to be in a CSV, Parquet, Feather or SQLite format (decided by its extension,
+            refer to the dbstorage module), and the default path leads to a file that contains all the
+            information of yugioh cards up to the current meta. With a SQLite database, adding cards
+            only writes the new rows instead of rewriting the whole file
+
+        compact: bool
+            Default value: False
+            If True, the database is kept in the compact in-memory format (refer to the to_compact
+            function of the dbstorage module), which takes several times less memory. A compact
+            database is read-only, cards cannot be added and it cannot be saved
 
         Variables:
         ----------
@@ -42,12 +58,52 @@ class DbHandler:
             database_filepath: str
                 The filepath that leads to the specified Yugioh Card Database
 
+            compact: bool
+                Whether the database is kept in the compact in-memory format
+
         Private:
             card_database: DataFrame()
                 The Yugioh Card Database that is read from the database_filepath
+
+            reference_index: dict
+                Keys are the References of the cards and values are their index in the card_database
+
+            name_index: dict
+                Keys are the lowercase Card Names and values are the lists of indexes of the cards with
+                that name in the card_database
+
+            fuzzy_index: fuzzy.FuzzyIndex
+                Index of the Card Names used to match misspelled names, it is only built when it is
+                first needed and rebuilt after cards are added
         """
         self.database_filepath = database_filepath
-        self.__card_database = pd.read_csv(database_filepath, keep_default_na = False)
+        self.compact = compact
+        self.__card_database = dbstorage.get_storage(database_filepath).load(database_filepath)
+        if compact:
+            self.__card_database = dbstorage.to_compact(self.__card_database)
+        self.__build_indexes()
+
+    def __build_indexes(self):
+        """
+        Builds the Reference and Card Name indexes from scratch
+
+        Private method that is invoked whenever the whole card_database is replaced
+        """
+        self.__reference_index = {}
+        self.__name_index = {}
+        self.__index_cards(self.__card_database)
+
+    def __index_cards(self, df):
+        """
+        Adds the cards of a dataframe to the Reference and Card Name indexes, the dataframe has to be part
+        of the card_database so that its index matches
+
+        Private method that is invoked when cards are added to the card_database
+        """
+        self.__fuzzy_index = None # Rebuilt from the new Card Names when it is needed again
+        for card_index, card_name, reference in zip(df.index, df['Card Name'].astype(str).str.lower(), df['Reference']):
+            self.__reference_index.setdefault(reference, card_index) # The first card with a Reference is kept
+            self.__name_index.setdefault(card_name, []).append(card_index)
 
     def get_card_database(self):
         """
@@ -74,16 +130,32 @@ class DbHandler:
         if tuple(df.columns) != DbHandler.yugioh_columns or len(df) < 10391:
             raise InvalidDataFrameError('DataFrame is invalid and cannot be set as the Yugioh Card Database')
         else:
-            self.__card_database = df
+            self.__card_database = dbstorage.to_compact(df) if self.compact else df
+            self.__build_indexes()
 
     def save_card_database(self):
         """
-        Method to save the database to the name of the csv file that was initialized at the start
-        of instantiation
+        Method to save the database to the name of the file that was initialized at the start
+        of instantiation, in the file format of its extension
+        """
+        self.__check_writable()
+        dbstorage.get_storage(self.database_filepath).save(self.__card_database, self.database_filepath)
+        _database_saved(self)
+        print('Save successful')
+
+    def __save_cards(self, df, previous_references = None):
+        """
+        Saves the cards that were added or changed, the dataframe has to be part of the card_database so
+        that its index matches. Only these rows are written if the storage allows it (SQLite), otherwise
+        the whole database is saved. previous_references are the References of the changed cards before
+        the change, so that a card whose Reference was changed replaces its previous row
+
+        Private method that is invoked when cards are added or changed in the card_database
         """
-        # Required to set index to Card Name before writing to the csv file in order to prevent insertion
-        # of additonal Unnamed columns when reading the csv file in get_card_database()
-        self.__card_database.set_index('Card Name').to_csv(self.database_filepath)
+        self.__check_writable()
+        dbstorage.get_storage(self.database_filepath).upsert(self.__card_database, df, self.database_filepath,
+                                                               previous_references = previous_references)
+        _database_saved(self)
         print('Save successful')
 
     def search_card_name(self, name):
@@ -96,31 +168,62 @@ class DbHandler:
         name: str or list
             name or names of the cards that are meant to be searched
         """
-        df = self.__card_database.copy() # Since there will be some changes to df, it is important
-                                         # to set a copy to prevent the changes from affecting the original database
-                                         # pandas are passed by referenced by default after all
+        found_df, missing_names = self.search_card_names(name)
+        for n in missing_names:
+            print(f"'{n}' is not in database, make sure you check your spellings, and cross-reference with the database using locate_card method")
+        return found_df
+
+    def search_card_names(self, names):
+        """
+        Returns a 2-element tuple of a dataframe of the cards that were found and a list of the lowercase
+        names that are not in the database
+
+        All the names are looked up in the lowercase Card Name index in one pass, without copying the
+        database, and cards are returned in the same order as the names
+
+        Parameters:
+        -----------
+        names: str or list
+            name or names of the cards that are meant to be searched, upper or lower case letters do not matter
+        """
+        if type(names) == str:
+            names = [names]
 
         # Converting the card names to lowercase to allow the user to input lower case letters without throwing an error
-        df['Card Name'] = df['Card Name'].apply(lambda x: x.lower())
-        if type(name) == str:
-            name = [name.lower()]
-        else:
-            name = list(set(map(lambda x: x.lower(), name)))
+        lowercase_names = pd.Series(list(names), dtype = object).str.lower().drop_duplicates()
+        indexes = lowercase_names.map(self.__name_index)
+        missing_names = list(lowercase_names[indexes.isna()])
+        indexes_to_search = list(indexes.dropna().explode())
 
-        while True:
-            try:
-                indexes_to_search = []
-                for n in name:
-                    name_tracker = n
-                    indexes_to_search.append(df.set_index('Card Name').index.get_loc(n))
-            except KeyError as e:
-                print(f'{e} is not in database, make sure you check your spellings, and cross-reference with the database using locate_card method')
-                if len(name) == 1:
-                    return pd.DataFrame(columns = DbHandler.yugioh_columns) # Returning empty dataframe with yugioh columns
-                else:
-                    name.remove(name_tracker) # Removing the erroneous card name
-            else:
-                return self.__card_database.iloc[indexes_to_search] # Cannot sort the index because it will cause logic errors in the tcgplayer class
+        if len(indexes_to_search) == 0:
+            return pd.DataFrame(columns = DbHandler.yugioh_columns), missing_names # Returning empty dataframe with yugioh columns
+        return self.__card_database.loc[indexes_to_search], missing_names # Cannot sort the index because it will cause logic errors in the tcgplayer class
+
+    def match_card_names(self, name, max_distance = 2, limit = 5):
+        """
+        Returns the Card Names in the database that are closest to a name that can be misspelled, in a
+        list format ranked from the closest. Each Card Name is in a 2-element tuple with its Levenshtein
+        distance to the name, upper or lower case letters, accents and punctuation do not count. Refer
+        to the fuzzy module
+
+        Parameters:
+        -----------
+        name: str
+            Name of the card to be matched
+
+        max_distance: int
+            Default value: 2
+
+            Largest Levenshtein distance of the Card Names to be returned
+
+        limit: int
+            Default value: 5
+
+            Maximum number of Card Names to be returned
+        """
+        if self.__fuzzy_index is None:
+            self.__fuzzy_index = fuzzy.FuzzyIndex(self.__card_database['Card Name'].astype(str))
+        return self.__fuzzy_index.search(name, max_distance = max_distance, limit = limit)
 
     def locate_card(self, card_url):
         """
@@ -133,10 +236,9 @@ class DbHandler:
             The card url has to be from https://yugioh.fandom.com and has to be a card URL, not a booster
             pack URL or a deck URL
         """
-        df = self.__card_database
-        if df[df['Reference'] == card_url].index.size != 0:
-            card_index = df[df['Reference'] == card_url].index[0]
-            print(f"{df['Card Name'].iloc[card_index]} is already in the Yugioh database and it is located at index: {card_index}")
+        card_index = self.__reference_index.get(card_url)
+        if card_index is not None:
+            print(f"{self.__card_database['Card Name'].loc[card_index]} is already in the Yugioh database and it is located at index: {card_index}")
             return card_index
         else:
             print('Card is not in database')
@@ -154,20 +256,105 @@ class DbHandler:
             YgScraper class has to be invoked on the specific card url first and return the value to
             a local variable before invoking this method
         """
-        list_of_keys = ['Card Name', 'Card Type', 'Spell/Trap Property', 'Attribute', 'Types', 'Level/Rank',
-                        'ATK','DEF', 'LINK', 'Pendulum Scale', 'Card Description', 'Card/Attribute/Type Support',
-                        'Direct Archetype & Series Support', 'Indirect Archetype & Series Support', 'Competitive Status (TCG Advanced)', 'Reference']
-
-        if (type(card_dict) != dict) or (set(card_dict.keys()).union(set(list_of_keys)) != set(list_of_keys)):
-            raise Exception('The card format passed is not correct, make sure you call YgSraper.get_card_details on the URL first')
+        self.__check_writable()
+        self.__check_card_format(card_dict)
+
+        if self.locate_card(card_dict['Reference']) == None:
+            self.__card_database = self.__card_database.append(card_dict, ignore_index = True)
+            self.__index_cards(self.__card_database.iloc[-1:])
+            print(f"{card_dict['Card Name']} is successfully added")
+            self.__save_cards(self.__card_database.iloc[-1:])
+            return self.__card_database
         else:
-            if self.locate_card(card_dict['Reference']) == None:
-                self.__card_database = self.__card_database.append(card_dict, ignore_index = True)
-                print(f"{card_dict['Card Name']} is successfully added")
-                self.save_card_database()
-                return self.__card_database
-            else:
+            print(f"{card_dict['Card Name']} was not added into the database")
+
+    def add_cards(self, card_dicts):
+        """
+        Returns the updated database after a successful addition of new cards, otherwise, it will not
+        return anything
+
+        Batch version of the add_card method, every card is checked first, cards that are already in
+        the database (or repeated in card_dicts) are skipped, and the new cards are added to the
+        database and saved in one go instead of rewriting the database file for every card
+
+        Parameters:
+        ----------
+        card_dicts: iterable of dict
+            The cards have to be in the dictionary format returned by the get_card_details method in the
+            YgScraper class
+        """
+        self.__check_writable()
+        card_dicts = list(card_dicts)
+        for card_dict in card_dicts:
+            self.__check_card_format(card_dict)
+
+        new_cards = {}
+        for card_dict in card_dicts:
+            if card_dict['Reference'] in self.__reference_index or card_dict['Reference'] in new_cards:
                 print(f"{card_dict['Card Name']} was not added into the database")
+            else:
+                new_cards[card_dict['Reference']] = card_dict
+
+        if len(new_cards) == 0:
+            return None
+
+        new_cards_df = pd.DataFrame(list(new_cards.values()), columns = DbHandler.yugioh_columns)
+        self.__card_database = pd.concat([self.__card_database, new_cards_df], ignore_index = True)
+        self.__index_cards(self.__card_database.iloc[-len(new_cards_df):])
+        print(f'{len(new_cards)} cards are successfully added')
+        self.__save_cards(self.__card_database.iloc[-len(new_cards_df):])
+        return self.__card_database
+
+    def update_cards(self, updates_df):
+        """
+        Returns the updated database after changing the values of cards that are already in the
+        database, otherwise, it will not return anything
+
+        The values are changed in one go and only the changed cards are saved (refer to the
+        __save_cards method)
+
+        Parameters:
+        ----------
+        updates_df: DataFrame
+            New values of the cards, the index has to be the index of the cards in the database and the
+            columns have to be columns of the Yugioh Card Database. Columns that are not passed are not
+            changed
+        """
+        self.__check_writable()
+        if (not set(updates_df.columns).issubset(DbHandler.yugioh_columns)
+            or not updates_df.index.isin(self.__card_database.index).all()):
+            raise Exception('The updates passed are not correct, make sure the columns are from the Yugioh Card Database and the index is from cards in the database')
+
+        if len(updates_df) == 0:
+            return None
+
+        previous_references = list(self.__card_database.loc[updates_df.index, 'Reference'])
+        self.__card_database.loc[updates_df.index, list(updates_df.columns)] = updates_df.values
+        if {'Card Name', 'Reference'} & set(updates_df.columns):
+            self.__build_indexes()
+        print(f'{len(updates_df)} cards are successfully updated')
+        self.__save_cards(self.__card_database.loc[updates_df.index], previous_references = previous_references)
+        return self.__card_database
+
+    def __check_card_format(self, card_dict):
+        """
+        Raises an Exception if the card is not in the dictionary format returned by the get_card_details
+        method in the YgScraper class
+
+        Private method that is invoked in the add_card and add_cards methods
+        """
+        if (type(card_dict) != dict) or (set(card_dict.keys()).union(set(DbHandler.yugioh_columns)) != set(DbHandler.yugioh_columns)):
+            raise Exception('The card format passed is not correct, make sure you call YgSraper.get_card_details on the URL first')
+
+    def __check_writable(self):
+        """
+        Raises an Exception if the database is kept in the compact in-memory format, because the values
+        that are lost in that format would be missing from the saved database
+
+        Private method that is invoked before the card_database is changed or saved
+        """
+        if self.compact:
+            raise Exception('The database is loaded in compact mode and is read-only, create a DbHandler with compact = False to change it')
 
     def regulatory_checkup(self):
         """
@@ -180,10 +367,10 @@ class DbHandler:
         df = self.__card_database
 
         # Dataframe that contains a list of cards with errors when they were added to the database or
-        # cards that have status: Not yet released and needs to be updated
-        checkup_df = df[(df['Card Type'] != 'Monster') & (df['Card Type'] != 'Spell') & (df['Card Type'] != 'Trap')
-                      | (df['Competitive Status (TCG Advanced)'] == 'Legal')
-                      | (df['Competitive Status (TCG Advanced)'] == 'Not yet released')]
+        # cards that have status: Not yet released and needs to be updated. isin compares the category
+        # codes of the categorical columns in compact mode
+        checkup_df = df[~df['Card Type'].isin(('Monster', 'Spell', 'Trap'))
+                      | df['Competitive Status (TCG Advanced)'].isin(('Legal', 'Not yet released'))]
 
         if checkup_df.index.size == 0:
             print('No updates needed')
@@ -192,26 +379,152 @@ class DbHandler:
         return checkup_df
 
 
+# Shared DbHandler objects used by every module in the package, keyed by the absolute database filepath.
+# Each value is a 2-element tuple of the DbHandler object and the version of the file it was loaded from
+_shared_databases = {}
+_shared_databases_lock = threading.Lock()
+
+def _file_version(database_filepath):
+    """
+    Returns the modification time and size of the database file, including the write-ahead log of a
+    SQLite database, so that any change to the file gives a different version
+    """
+    version = []
+    for filepath in (database_filepath, database_filepath + '-wal'):
+        if os.path.exists(filepath):
+            stat = os.stat(filepath)
+            version.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+def _database_saved(duelist):
+    """
+    Keeps the shared DbHandler objects up to date after a DbHandler object saves its database. The
+    shared object is kept if it is the one that saved, otherwise it is dropped so that the next
+    get_database call reads the saved file
+    """
+    key = os.path.abspath(duelist.database_filepath)
+    with _shared_databases_lock:
+        if key in _shared_databases:
+            if _shared_databases[key][0] is duelist:
+                _shared_databases[key] = (duelist, _file_version(duelist.database_filepath))
+            else:
+                del _shared_databases[key]
+
+def get_database(database_filepath = 'Data/Yugioh Card Database.csv'):
+    """
+    Returns the DbHandler object of the database file that is shared by the whole package. The file is
+    only read the first time, and read again if it was changed by anything other than the shared
+    DbHandler object
+
+    Parameters:
+    -----------
+    database_filepath: str
+        Default value: 'Data/Yugioh Card Database.csv'
+        Filepath of the Yugioh Card Database, refer to the DbHandler class
+    """
+    key = os.path.abspath(database_filepath)
+    version = _file_version(database_filepath)
+    with _shared_databases_lock:
+        if key not in _shared_databases or _shared_databases[key][1] != version:
+            _shared_databases[key] = (DbHandler(database_filepath = database_filepath), version)
+        return _shared_databases[key][0]
+
+def invalidate_database(database_filepath = None):
+    """
+    Drops the shared DbHandler object of a database file so that the next get_database call reads the
+    file again
+
+    Parameters:
+    -----------
+    database_filepath: str
+        Default value: None
+        Filepath of the Yugioh Card Database, every shared DbHandler object is dropped if no filepath
+        is passed
+    """
+    with _shared_databases_lock:
+        if database_filepath is None:
+            _shared_databases.clear()
+        else:
+            _shared_databases.pop(os.path.abspath(database_filepath), None)
+
+
 class YgScraper:
     """
         Class for scraping the https://yugioh.fandom website to get the URLs for cards from card sets URLs
         and translating the information to a readable format
     """
-    def __init__(self):
+    def __init__(self, fetcher = None, parser = None):
         """
+        Parameters:
+        -----------
+        fetcher: webfetch.WebFetcher
+            Default value: None
+
+            WebFetcher object used to download the web pages, the shared WebFetcher object of the
+            webfetch module is used if no object is passed
+
+        parser: str
+            Default value: None
+
+            Name of the parsing backend from the parsers module ('lxml' or 'html.parser'), lxml is used
+            if no name is passed and it is installed
+
         Variables:
         ---------
         Public:
             card_url_list: list
-                Holds the list of card URLs interested in scraping
+                Holds the list of card URLs interested in scraping, in the order they were added and
+                without duplicates
+
+            fetcher: webfetch.WebFetcher
+                Downloads the web pages through a pool of connections that are kept alive, the shared
+                WebFetcher object is only taken when a page is first downloaded
+
+            parser: parsers.SoupBackend or parsers.LxmlBackend
+                Parses the downloaded web pages
 
         Private:
-            card_details = list of dictionaries
-                Holds the list of card details that were scraped from the urls in card_url_list, each card
-                detail is in the format of a dictionary
+            card_urls: dict
+                Ordered set behind card_url_list, keys are the card URLs and values are all None
+
+            card_details = dict of dictionaries
+                Holds the card details that were scraped from the urls in card_url_list, keyed by their
+                Reference. Each card detail is in the format of a dictionary, and when a card is scraped
+                more than once, the most recent scrape replaces the earlier one
+
+            lock: threading.Lock
+                Lock that allows only one thread at a time to change card_url_list and card_details, so
+                that the object can be shared by the threads of a ThreadPoolExecutor
+        """
+        self.__card_urls = {}
+        self.__fetcher = fetcher
+        self.parser = parsers.get_backend(parser)
+        self.__card_details = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def fetcher(self):
+        """
+        Returns the WebFetcher object used to download the web pages. The shared WebFetcher object is
+        only created when it is needed, so a YgScraper object that only parses pages, such as the ones
+        in the parsing processes of the pipeline module, does not open a requests.Session
+        """
+        return self.__fetcher if self.__fetcher is not None else webfetch.get_fetcher()
+
+    @fetcher.setter
+    def fetcher(self, fetcher):
+        self.__fetcher = fetcher
+
+    @property
+    def card_url_list(self):
+        """
+        Returns the list of card urls, in the order they were added and without duplicates
         """
-        self.card_url_list = []
-        self.__card_details = []
+        return list(self.__card_urls)
+
+    @card_url_list.setter
+    def card_url_list(self, urls):
+        self.__card_urls = dict.fromkeys(urls)
 
 
     def __atk_def_link_parser(self, atk_def_link):
@@ -247,7 +560,12 @@ class YgScraper:
     def set_card_details(self, url):
         """
         Set method that scrapes the card url in its argument and sets the details of the card to a
-        dictionary in a user-readable format
+        dictionary in a user-readable format. The card dictionary is also returned, and nothing is
+        returned if the url cannot be downloaded (including connection errors and timeouts) or is not
+        a card page
+
+        The card page is only downloaded once, and the same HTML is used for the card table, the
+        card description and the support lists. The method is thread-safe
 
         Parameters:
         -----------
@@ -255,14 +573,68 @@ class YgScraper:
             This is the individual card url, each card url in https://yugioh.fandom follows a
             more or less similar format that can be scraped using the algorithm below
         """
+        with self.__lock:
+            self.__card_urls[url] = None
+
+        try:
+            html = self.fetcher.get_html(url)
+        except requests.exceptions.RequestException:
+            html = None # Connection errors and timeouts only fail this url, like a bad status code
+        if html is None:
+            print(url)
+            return None
+
+        card_dict = self.parse_card_details(html, url)
+        if card_dict is not None:
+            with self.__lock:
+                self.__card_details[card_dict['Reference']] = card_dict
+        return card_dict
+
+    def scrape_card_details(self, urls, max_workers = 5):
+        """
+        Returns the card details of every url in its argument in a list format, in the same order as the
+        urls. Urls that cannot be scraped give None
+
+        The urls are scraped by the set_card_details method in a ThreadPoolExecutor, and the results are
+        taken from the executor instead of the shared card details, so no card is lost or duplicated no
+        matter how many threads are used
+
+        Parameters:
+        -----------
+        urls: list of strings
+            Individual card urls to be scraped
+
+        max_workers: int
+            Default value: 5
+
+            Number of threads that scrape the urls, it should match the pool size of the fetcher
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers = max_workers) as executor:
+            return list(executor.map(self.set_card_details, urls))
+
+    def parse_card_details(self, html, url):
+        """
+        Returns the details of a card in a dictionary format from the HTML of its card page, and
+        returns nothing if the page does not contain a card table
+
+        Parameters:
+        -----------
+        html: str
+            The HTML source of an individual card page from https://yugioh.fandom
 
-        if url not in self.card_url_list:
-            self.card_url_list.append(url)
+        url: str
+            The card url that the HTML was downloaded from, it is kept as the Reference of the card
+        """
+        site_html = self.parser.parse(html)
 
-        # Try-block code to read the table in the card url, and if the url passed is not a card URL,
+        # Try-block code to read the table in the card page, and if the page is not a card page,
         # the except-block will run and print out that url that is faulty
+        # Only the card table is handed to read_html because the rest of the page is already parsed above
+        card_table = self.parser.card_table_html(site_html)
         try:
-            card_details_df = pd.read_html(url, attrs = {'class': "cardtable"})[0]
+            if card_table is None:
+                raise ValueError('No card table found')
+            card_details_df = pd.read_html(io.StringIO(card_table))[0]
         except ValueError:
             print(url)
             return None
@@ -342,30 +714,25 @@ class YgScraper:
                         pendulum_scale = 'N/A'
 
                 # Block of code to handle the card description of all cards and make them readable
-                source = requests.get(url)
-                if source.status_code == 200:
-                    site_html = BeautifulSoup(source.text.encode('utf-8'), 'html.parser')
-                uncleaned_description = unicodedata.normalize("NFKD", site_html.find_all('td', attrs = {'class': "navbox-list"})[0].text.replace('\n', ''))
+                uncleaned_description = unicodedata.normalize("NFKD", self.parser.card_description_text(site_html).replace('\n', ''))
                 card_description = re.sub(r'(?<=[.,])(?=[^\s])', r' ', uncleaned_description) # Pendulum Monsters text have this issue
                 card_description = re.sub(r'(?<=[a-z])(?=[A-Z])', '. ',  card_description) # Link and Synchro Monsters have this issue
                 card_description = re.sub(r'(?<=[a-z]["])(?=[A-Z])', r'. ', card_description) # Fusion monsters text have this issue
 
                 # Block of code to handle which archetype/series/attribute/type/individual cards that each card supports
-                if site_html.find('div', attrs = {'class': "hlist"}).dt:
-                    for div in site_html.find_all('div', attrs = {'class': "hlist"}):
-                        try:
-                            if div.dt.text.replace('\n', '').strip() == 'Supports':
-                                for dd in div.find_all('dd'):
-                                    card_attribute_type_support.add(dd.text.replace('\n', '').strip())
-                            elif div.dt.text.replace('\n', '').strip() == 'Archetypes and series' or div.dt.text.replace('\n', '').strip() == 'Supports archetypes':
-                                for dd in div.find_all('dd'):
-                                    direct_archetype_series_support.add(dd.text.replace('\n', '').strip())
-                            elif div.dt.text.replace('\n', '').strip() == 'Related to archetypes and series':
-                                for dd in div.find_all('dd'):
-                                    indirect_archetype_series_support.add(dd.text.replace('\n', '').strip())
-                            else:
-                                break
-                        except AttributeError:
+                support_lists = self.parser.support_lists(site_html)
+                if support_lists[0][0] is not None:
+                    for dt, dds in support_lists:
+                        if dt is None:
+                            break
+                        dt = dt.replace('\n', '').strip()
+                        if dt == 'Supports':
+                            card_attribute_type_support.update(dd.replace('\n', '').strip() for dd in dds)
+                        elif dt == 'Archetypes and series' or dt == 'Supports archetypes':
+                            direct_archetype_series_support.update(dd.replace('\n', '').strip() for dd in dds)
+                        elif dt == 'Related to archetypes and series':
+                            indirect_archetype_series_support.update(dd.replace('\n', '').strip() for dd in dds)
+                        else:
                             break
                 else:
                     pass
@@ -407,14 +774,96 @@ class YgScraper:
                 'Reference': url,
                 }
 
-            self.__card_details.append(card_dict)
+            return card_dict
+
+    async def scrape_many_async(self, urls, concurrency = None, requests_per_second = 10, parse_workers = 1):
+        """
+        Coroutine that returns the card details of every url in its argument in a list format, in the
+        same order as the urls. Urls that cannot be downloaded or are not card pages give None
+
+        The web pages are downloaded concurrently by the fetcher and handed to parse_card_details as soon
+        as they arrive, and the scraped cards are also added to the card details of the object. Inside a
+        Jupyter Notebook, use "await scraper.scrape_many_async(urls)" instead of the scrape_many method
+
+        Parameters:
+        -----------
+        urls: list of strings
+            Individual card urls to be scraped
+
+        concurrency: int
+            Default value: None
+
+            Maximum number of web pages downloaded at the same time, the pool size of the fetcher is
+            used if no value is passed because the fetcher never opens more connections than its pool
+            size. For a bulk rebuild, configure the fetcher with a larger pool size (for example
+            webfetch.configure_fetcher(pool_size = 20)) so that more pages are in flight, the
+            requests_per_second limit still protects the website
+
+        requests_per_second: int or float
+            Default value: 10
+
+            Maximum number of requests started per second for each website, so that the website is not
+            flooded with requests
+
+        parse_workers: int
+            Default value: 1
+
+            Number of threads that parse the downloaded pages. The parsing has its own threads, so a
+            page that is being parsed never takes a download slot
+        """
+        urls = list(urls)
+        if concurrency is None:
+            concurrency = self.fetcher.pool_size
+
+        semaphore = asyncio.Semaphore(concurrency)
+        rate_limiter = webfetch.HostRateLimiter(requests_per_second)
+        loop = asyncio.get_running_loop()
+
+        # requests is a blocking library, so the downloads are run in threads while the event loop only
+        # schedules them. The parsing runs in threads of its own so that it does not hold the downloads
+        with concurrent.futures.ThreadPoolExecutor(max_workers = concurrency) as download_executor, \
+             concurrent.futures.ThreadPoolExecutor(max_workers = parse_workers) as parse_executor:
+            async def scrape(url):
+                async with semaphore:
+                    await rate_limiter.wait(url)
+                    try:
+                        html = await loop.run_in_executor(download_executor, self.fetcher.get_html, url)
+                    except requests.exceptions.RequestException:
+                        html = None
+                if html is None:
+                    print(url)
+                    return None
+                return await loop.run_in_executor(parse_executor, self.parse_card_details, html, url)
+
+            card_details = await asyncio.gather(*(scrape(url) for url in urls))
+
+        with self.__lock:
+            for url, card_dict in zip(urls, card_details):
+                self.__card_urls[url] = None
+                if card_dict is not None:
+                    self.__card_details[card_dict['Reference']] = card_dict
+
+        return card_details
+
+    def scrape_many(self, urls, concurrency = None, requests_per_second = 10, parse_workers = 1):
+        """
+        Returns the card details of every url in its argument in a list format, in the same order as the
+        urls. Urls that cannot be downloaded or are not card pages give None
+
+        Runs the scrape_many_async coroutine in a new event loop, refer to it for the parameters
+        """
+        return asyncio.run(self.scrape_many_async(urls, concurrency = concurrency,
+                                                  requests_per_second = requests_per_second,
+                                                  parse_workers = parse_workers))
 
     def get_card_details(self):
         """
         Returns the card details in a list format from the set_card_details method
+
+        The card details are keyed by their Reference, so there is only 1 card for each url
         """
-        self.__card_details = [i for n, i in enumerate(self.__card_details) if i not in self.__card_details[n + 1:]]  # To remove duplicate cards
-        return self.__card_details
+        with self.__lock:
+            return list(self.__card_details.values())
 
     def set_card_urls(self, card_set_url):
         """
@@ -429,10 +878,10 @@ class YgScraper:
         card_set_url: str
             The url of the card set, it has to be a card set, and not an individual card
         """
-        card_set_source = requests.get(card_set_url)
+        card_set_source = self.fetcher.get(card_set_url)
 
         if card_set_source.status_code == 200:
-            card_set_html = BeautifulSoup(card_set_source.text.encode('utf-8'), 'html.parser')
+            card_set_html = self.parser.parse(card_set_source.text)
 
         class_or_id = 'class'
         attribute_name = "wikitable"
@@ -445,25 +894,10 @@ class YgScraper:
 
         card_url_list = []
 
-        for card_table in card_set_html.find_all('table', attrs = {class_or_id: attribute_name}):
-            # Building a table of hyperlinks because pd.read_html does not read the hyperlinks, but only reads the unlinked
-            # text of tables
-            record = list()
-            for tr in card_table.findAll("tr"):
-                ths = tr.findAll("th")
-                if ths != []:
-                    columns = [th.text.replace('\n', '').strip() for th in ths]
-                else:
-                    row = list()
-                    for td in tr.find_all('td'):
-                        try:
-                            row.append(td.a['href'])
-                        except KeyError:
-                            row.append(td.a.text)
-                        except TypeError:
-                            row.append(td.text)
-                    record.append(row)
-
+        # Building a table of hyperlinks because pd.read_html does not read the hyperlinks, but only reads the unlinked
+        # text of tables
+        for columns, record in self.parser.set_tables(card_set_html, class_or_id, attribute_name):
+            columns = [column.replace('\n', '').strip() for column in columns]
             card_set_df = pd.DataFrame(data = record, columns = columns)
             try:
                 card_set_df.rename(columns = {'English name': 'Card Name'}, inplace = True)
@@ -480,7 +914,8 @@ class YgScraper:
                 card_set_df['Card Name'] = card_set_df['Card Name'].apply(lambda x: 'https://yugioh.fandom.com' + x)
                 card_url_list.extend(list(card_set_df['Card Name']))
 
-        self.card_url_list.extend(list(set(card_url_list)))
+        with self.__lock:
+            self.__card_urls.update(dict.fromkeys(card_url_list)) # Urls already in the list keep their position
 
     def add_card_urls(self, urls):
         """
@@ -493,12 +928,13 @@ class YgScraper:
         """
         if type(urls) == str:
             urls = [urls]
-        self.card_url_list.extend(urls)
-        self.card_url_list = list(set(self.card_url_list))
+        with self.__lock:
+            self.__card_urls.update(dict.fromkeys(urls))
 
     def get_card_urls(self):
         """
-        Returns the list of card urls that was initialized or added from the set_card_urls method
+        Returns the list of card urls that was initialized or added from the set_card_urls method, in
+        the order they were added
         """
-        self.card_url_list = list(set(self.card_url_list)) # To remove duplicate urls
-        return self.card_url_list
+        with self.__lock:
+            return list(self.__card_urls)